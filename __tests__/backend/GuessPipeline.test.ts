@@ -0,0 +1,93 @@
+import { GuessPipeline } from '../../server/GuessPipeline';
+import { RoomManager } from '../../server/RoomManager';
+import { ManualClock } from '../../server/clock';
+import { Room } from '../../types';
+
+const startRound = (roomManager: RoomManager): Room => {
+  const room = roomManager.createRoom('Test Room', 'public', 'host-id', 'Host');
+  roomManager.joinRoom(room.id, 'player-1', 'Player 1');
+  roomManager.joinRoom(room.id, 'player-2', 'Player 2');
+  roomManager.startGame(room.id);
+  roomManager.selectWord(room.id, { text: 'cat', difficulty: 'easy', points: 10 });
+  return room;
+};
+
+describe('GuessPipeline', () => {
+  let clock: ManualClock;
+  let roomManager: RoomManager;
+  let sink: { result: jest.Mock; correct: jest.Mock };
+  let pipeline: GuessPipeline;
+
+  beforeEach(() => {
+    clock = new ManualClock(0);
+    roomManager = new RoomManager(clock);
+    sink = { result: jest.fn(), correct: jest.fn() };
+    pipeline = new GuessPipeline(roomManager, sink, 50, clock);
+  });
+
+  it('should check a tick of guesses together and notify the drawer once', () => {
+    const room = startRound(roomManager);
+    const [first, second] = room.turnOrder.filter(id => id !== room.currentDrawer);
+
+    pipeline.submit(room.id, first, 'dog');
+    pipeline.submit(room.id, first, 'cat');
+    pipeline.submit(room.id, second, 'CAT ');
+    pipeline.submit(room.id, first, 'cow');
+    expect(sink.result).not.toHaveBeenCalled();
+
+    clock.advance(50);
+
+    expect(sink.result).toHaveBeenCalledTimes(2);
+    expect(sink.result).toHaveBeenCalledWith(first, expect.objectContaining({ correct: true }));
+    expect(sink.correct).toHaveBeenCalledTimes(1);
+    expect(sink.correct).toHaveBeenCalledWith(room.currentDrawer, [
+      { playerId: first, playerName: expect.any(String) },
+      { playerId: second, playerName: expect.any(String) }
+    ]);
+    expect(room.correctGuessers).toEqual([first, second]);
+    expect(pipeline.getStats()).toMatchObject({ guesses: 4, batches: 1, largestBatch: 4, correct: 2, results: 2 });
+  });
+
+  it('should only tell the drawer about new correct guessers', () => {
+    const room = startRound(roomManager);
+    const guesser = room.turnOrder.find(id => id !== room.currentDrawer)!;
+
+    pipeline.submit(room.id, guesser, 'cat');
+    pipeline.flush();
+    pipeline.submit(room.id, guesser, 'cat');
+    pipeline.flush();
+
+    expect(sink.result).toHaveBeenCalledTimes(2);
+    expect(sink.correct).toHaveBeenCalledTimes(1);
+  });
+
+  it('should drop guesses once the round is no longer being drawn', () => {
+    const room = startRound(roomManager);
+    const guesser = room.turnOrder.find(id => id !== room.currentDrawer)!;
+
+    pipeline.submit(room.id, guesser, 'cat');
+    roomManager.endRound(room.id, []);
+    pipeline.flushRoom(room.id);
+
+    expect(sink.result).not.toHaveBeenCalled();
+    expect(room.correctGuessers).toEqual([]);
+    expect(pipeline.getStats()).toMatchObject({ pending: 0, dropped: 1 });
+  });
+
+  it('should return the players a flush made correct so a manual stop can score them', () => {
+    const room = startRound(roomManager);
+    const [early, late] = room.turnOrder.filter(id => id !== room.currentDrawer);
+    pipeline.submit(room.id, early, 'cat');
+    pipeline.flush();
+
+    // The drawer stops the round with only `early` on their list while `late` is queued
+    pipeline.submit(room.id, late, 'cat');
+    const flushed = pipeline.flushRoom(room.id);
+    expect(flushed).toEqual([late]);
+    expect(sink.result).toHaveBeenLastCalledWith(late, expect.objectContaining({ correct: true }));
+
+    roomManager.endRound(room.id, [early, ...flushed]);
+    expect(room.scores[late]).toBe(10);
+    expect(pipeline.flushRoom(room.id)).toEqual([]);
+  });
+});
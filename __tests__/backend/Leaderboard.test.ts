@@ -0,0 +1,77 @@
+import { Leaderboard, ScoreBoard, loadLeaderboardConfig } from '../../server/Leaderboard';
+import { ManualClock } from '../../server/clock';
+
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+describe('ScoreBoard', () => {
+  it('should keep the top entries sorted as scores arrive', () => {
+    const board = new ScoreBoard(2, 10);
+    board.add('a', 'A', 10);
+    board.add('b', 'B', 30);
+    board.add('c', 'C', 20);
+
+    expect(board.entries()).toEqual([
+      { rank: 1, name: 'B', score: 30 },
+      { rank: 2, name: 'C', score: 20 }
+    ]);
+
+    board.add('a', 'A', 25);
+    expect(board.entries().map(entry => entry.name)).toEqual(['A', 'B']);
+  });
+
+  it('should keep the earlier player ahead on ties', () => {
+    const board = new ScoreBoard(3, 10);
+    board.add('a', 'A', 10);
+    board.add('b', 'B', 10);
+
+    expect(board.entries().map(entry => entry.name)).toEqual(['A', 'B']);
+  });
+
+  it('should forget the lowest unranked players once over capacity', () => {
+    const board = new ScoreBoard(2, 8);
+    board.add('top-1', 'Top 1', 100);
+    board.add('top-2', 'Top 2', 90);
+    for (let i = 0; i < 7; i++) {
+      board.add(`p-${i}`, `P ${i}`, i + 1);
+    }
+
+    expect(board.tracked).toBeLessThanOrEqual(8);
+    expect(board.entries().map(entry => entry.name)).toEqual(['Top 1', 'Top 2']);
+  });
+});
+
+describe('Leaderboard', () => {
+  it('should aggregate a player across rounds by name', () => {
+    const leaderboard = new Leaderboard({ size: 10, maxTracked: 100 }, new ManualClock(0));
+    leaderboard.record([{ playerId: 'socket-1', name: 'Alice', points: 50 }]);
+    leaderboard.record([
+      { playerId: 'socket-2', name: 'alice', points: 30 },
+      { playerId: 'socket-3', name: 'Bob', points: 40 }
+    ]);
+
+    expect(leaderboard.top('all-time')).toEqual([
+      { rank: 1, name: 'alice', score: 80 },
+      { rank: 2, name: 'Bob', score: 40 }
+    ]);
+    expect(leaderboard.top('all-time', 1)).toHaveLength(1);
+  });
+
+  it('should start the daily board over at midnight', () => {
+    const clock = new ManualClock(DAY_MS - 1000);
+    const leaderboard = new Leaderboard({ size: 10, maxTracked: 100 }, clock);
+    leaderboard.record([{ playerId: 'socket-1', name: 'Alice', points: 50 }]);
+    expect(leaderboard.top('daily')).toHaveLength(1);
+
+    clock.advance(1000);
+
+    expect(leaderboard.top('daily')).toEqual([]);
+    expect(leaderboard.top('all-time')).toHaveLength(1);
+  });
+
+  it('should track at least twice the board size', () => {
+    expect(loadLeaderboardConfig({ LEADERBOARD_SIZE: '50', LEADERBOARD_MAX_TRACKED: '10' })).toEqual({
+      size: 50,
+      maxTracked: 100
+    });
+  });
+});
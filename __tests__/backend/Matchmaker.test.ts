@@ -0,0 +1,80 @@
+import { Matchmaker } from '../../server/Matchmaker';
+import { Room } from '../../types';
+
+const makeRoom = (id: string, playerCount: number, overrides: Partial<Room> = {}): Room =>
+  ({
+    id,
+    type: 'public',
+    gameState: 'waiting',
+    maxPlayers: 15,
+    players: new Array(playerCount).fill(null).map((_, i) => ({ id: `${id}-p${i}` })),
+    ...overrides,
+  }) as unknown as Room;
+
+describe('Matchmaker', () => {
+  let matchmaker: Matchmaker;
+
+  beforeEach(() => {
+    matchmaker = new Matchmaker();
+  });
+
+  it('should pick the fullest joinable room', () => {
+    matchmaker.update(makeRoom('a', 2));
+    matchmaker.update(makeRoom('b', 9));
+    matchmaker.update(makeRoom('c', 5));
+
+    expect(matchmaker.peek()).toBe('b');
+  });
+
+  it('should prefer the oldest room on ties', () => {
+    matchmaker.update(makeRoom('a', 3));
+    matchmaker.update(makeRoom('b', 3));
+
+    expect(matchmaker.peek()).toBe('a');
+  });
+
+  it('should re-key rooms when players join or leave', () => {
+    const a = makeRoom('a', 2);
+    const b = makeRoom('b', 4);
+    matchmaker.update(a);
+    matchmaker.update(b);
+
+    a.players.push(...makeRoom('x', 5).players);
+    matchmaker.update(a);
+    expect(matchmaker.peek()).toBe('a');
+
+    a.players.splice(0, 6);
+    matchmaker.update(a);
+    expect(matchmaker.peek()).toBe('b');
+  });
+
+  it('should drop rooms that are full, private or already playing', () => {
+    matchmaker.update(makeRoom('full', 15));
+    matchmaker.update(makeRoom('private', 3, { type: 'private' }));
+    matchmaker.update(makeRoom('playing', 3, { gameState: 'drawing' }));
+
+    expect(matchmaker.size).toBe(0);
+    expect(matchmaker.peek()).toBeUndefined();
+
+    const room = makeRoom('a', 3);
+    matchmaker.update(room);
+    room.gameState = 'word-selection';
+    matchmaker.update(room);
+
+    expect(matchmaker.peek()).toBeUndefined();
+  });
+
+  it('should keep heap order after removals', () => {
+    for (let i = 1; i <= 10; i++) {
+      matchmaker.update(makeRoom(`room-${i}`, i));
+    }
+
+    matchmaker.remove('room-10');
+    matchmaker.remove('room-3');
+    expect(matchmaker.peek()).toBe('room-9');
+
+    matchmaker.remove('room-9');
+    expect(matchmaker.peek()).toBe('room-8');
+    expect(matchmaker.size).toBe(7);
+  });
+});
@@ -0,0 +1,101 @@
+import { RateLimiter, TokenBucket, loadRateLimiterConfig, RateLimiterConfig } from '../../server/RateLimiter';
+import { encodeStroke } from '../../lib/strokeCodec';
+import { ManualClock } from '../../server/clock';
+
+describe('TokenBucket', () => {
+  it('should allow up to burst and then refill over time', () => {
+    const bucket = new TokenBucket({ ratePerSecond: 2, burst: 2 }, 0);
+
+    expect(bucket.tryRemove(0)).toBe(true);
+    expect(bucket.tryRemove(0)).toBe(true);
+    expect(bucket.tryRemove(0)).toBe(false);
+
+    // 2 tokens per second -> one token after 500ms
+    expect(bucket.tryRemove(500)).toBe(true);
+    expect(bucket.tryRemove(500)).toBe(false);
+  });
+});
+
+describe('RateLimiter', () => {
+  const config: RateLimiterConfig = {
+    perSocket: {
+      'drawing:stroke': { ratePerSecond: 1, burst: 2 },
+      'guess:submit': { ratePerSecond: 1, burst: 1 }
+    },
+    perRoom: {
+      'drawing:stroke': { ratePerSecond: 1, burst: 3 },
+      'guess:submit': { ratePerSecond: 1, burst: 2 }
+    },
+    maxStrokePoints: 3,
+    maxGuessLength: 5,
+    maxPayloadBytes: 1000
+  };
+  const stroke = encodeStroke({ color: '#000000', width: 3, points: [{ x: 0, y: 0 }] });
+
+  let rateLimiter: RateLimiter;
+
+  beforeEach(() => {
+    rateLimiter = new RateLimiter(config);
+  });
+
+  it('should reject sockets that exceed their rate', () => {
+    expect(rateLimiter.checkSocket('drawing:stroke', 'socket-1', stroke, 0)).toBe(true);
+    expect(rateLimiter.checkSocket('drawing:stroke', 'socket-1', stroke, 0)).toBe(true);
+    expect(rateLimiter.checkSocket('drawing:stroke', 'socket-1', stroke, 0)).toBe(false);
+
+    // Other sockets have their own buckets
+    expect(rateLimiter.checkSocket('drawing:stroke', 'socket-2', stroke, 0)).toBe(true);
+    expect(rateLimiter.getStats().rejected['drawing:stroke']['socket-rate']).toBe(1);
+  });
+
+  it('should reject rooms that exceed their rate', () => {
+    expect(rateLimiter.checkRoom('guess:submit', 'room-1', 0)).toBe(true);
+    expect(rateLimiter.checkRoom('guess:submit', 'room-1', 0)).toBe(true);
+    expect(rateLimiter.checkRoom('guess:submit', 'room-1', 0)).toBe(false);
+
+    const stats = rateLimiter.getStats();
+    expect(stats.accepted['guess:submit']).toBe(2);
+    expect(stats.rejected['guess:submit']['room-rate']).toBe(1);
+  });
+
+  it('should reject oversized payloads', () => {
+    const bigStroke = encodeStroke({ color: '#000000', width: 3, points: new Array(4).fill({ x: 1, y: 1 }) });
+
+    expect(rateLimiter.checkSocket('drawing:stroke', 'socket-1', bigStroke, 0)).toBe(false);
+    expect(rateLimiter.checkSocket('drawing:stroke', 'socket-1', stroke.subarray(0, 10), 0)).toBe(false);
+    expect(rateLimiter.checkSocket('guess:submit', 'socket-1', 'toolong', 0)).toBe(false);
+    expect(rateLimiter.checkSocket('guess:submit', 'socket-1', { guess: 'cat' }, 0)).toBe(false);
+    expect(rateLimiter.getStats().rejected['drawing:stroke'].payload).toBe(2);
+    expect(rateLimiter.getStats().rejected['guess:submit'].payload).toBe(2);
+    expect(rateLimiter.getRejectedTotal()).toBe(4);
+  });
+
+  it('should reset buckets when a socket is released', () => {
+    rateLimiter.checkSocket('guess:submit', 'socket-1', 'cat', 0);
+    expect(rateLimiter.checkSocket('guess:submit', 'socket-1', 'cat', 0)).toBe(false);
+
+    rateLimiter.releaseSocket('socket-1');
+
+    expect(rateLimiter.checkSocket('guess:submit', 'socket-1', 'cat', 0)).toBe(true);
+  });
+});
+
+describe('loadRateLimiterConfig', () => {
+  it('should read limits from the environment and fall back to defaults', () => {
+    const loaded = loadRateLimiterConfig({ GUESS_RATE_PER_SOCKET: '10', MAX_STROKE_POINTS: 'nope' });
+
+    expect(loaded.perSocket['guess:submit'].ratePerSecond).toBe(10);
+    expect(loaded.maxStrokePoints).toBe(2000);
+  });
+
+  it('should refill from the injected clock when no time is passed', () => {
+    const clock = new ManualClock(0);
+    rateLimiter = new RateLimiter(config, clock);
+
+    expect(rateLimiter.checkSocket('guess:submit', 'socket-1', 'cat')).toBe(true);
+    expect(rateLimiter.checkSocket('guess:submit', 'socket-1', 'cat')).toBe(false);
+
+    clock.advance(1000);
+    expect(rateLimiter.checkSocket('guess:submit', 'socket-1', 'cat')).toBe(true);
+  });
+});
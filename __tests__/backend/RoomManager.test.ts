@@ -1,4 +1,5 @@
 import { RoomManager } from '../../server/RoomManager';
+import { ManualClock } from '../../server/clock';
 import { RoomType } from '../../types';
 
 describe('RoomManager', () => {
@@ -93,6 +94,28 @@ describe('RoomManager', () => {
     });
   });
 
+  describe('leaveRooms', () => {
+    it('should update each room once for a batch of leaving players', () => {
+      const first = roomManager.createRoom('First', 'public', 'host-1', 'Host 1');
+      roomManager.joinRoom(first.id, 'player-1', 'Player 1');
+      roomManager.joinRoom(first.id, 'player-2', 'Player 2');
+      const second = roomManager.createRoom('Second', 'public', 'host-2', 'Host 2');
+
+      const results = roomManager.leaveRooms(['host-1', 'player-1', 'host-2', 'unknown']);
+
+      expect(results).toHaveLength(2);
+      const firstResult = results.find(r => r.roomId === first.id);
+      expect(firstResult?.playerIds).toEqual(['host-1', 'player-1']);
+      expect(firstResult?.room?.players.map(p => p.id)).toEqual(['player-2']);
+      expect(firstResult?.room?.hostId).toBe('player-2');
+      expect(firstResult?.room?.scores).toEqual({ 'player-2': 0 });
+
+      expect(results.find(r => r.roomId === second.id)?.room).toBeNull();
+      expect(roomManager.getRoom(second.id)).toBeUndefined();
+      expect(roomManager.getStats()).toEqual({ rooms: 1, players: 1, spectators: 0, joinableRooms: 1 });
+    });
+  });
+
   describe('startGame', () => {
     it('should initialize game state correctly', () => {
       const room = roomManager.createRoom('Test Room', 'public', 'host-id', 'Host');
@@ -116,6 +139,128 @@ describe('RoomManager', () => {
     });
   });
 
+  describe('selectWord', () => {
+    it('should stamp the round start from the injected clock', () => {
+      const clock = new ManualClock(5000);
+      roomManager = new RoomManager(clock);
+      const room = roomManager.createRoom('Test Room', 'public', 'host-id', 'Host');
+      roomManager.joinRoom(room.id, 'player-id', 'Player');
+      roomManager.startGame(room.id);
+
+      clock.advance(1500);
+      const updatedRoom = roomManager.selectWord(room.id, { text: 'cat', difficulty: 'easy', points: 10 });
+
+      expect(updatedRoom?.roundStartTime).toBe(6500);
+    });
+  });
+
+  describe('endGame / getActiveGameCount', () => {
+    it('should count games until they end', () => {
+      const room = roomManager.createRoom('Test Room', 'public', 'host-id', 'Host');
+      roomManager.joinRoom(room.id, 'player-id', 'Player');
+      roomManager.createRoom('Idle Room', 'public', 'host-2', 'Host 2');
+      expect(roomManager.getActiveGameCount()).toBe(0);
+
+      roomManager.startGame(room.id);
+      expect(roomManager.getActiveGameCount()).toBe(1);
+
+      expect(roomManager.endGame(room.id)?.gameState).toBe('game-end');
+      expect(roomManager.getActiveGameCount()).toBe(0);
+    });
+  });
+
+  describe('spectators', () => {
+    it('should not count spectators toward maxPlayers', () => {
+      const room = roomManager.createRoom('Test Room', 'public', 'host-id', 'Host');
+      room.maxPlayers = 1;
+
+      expect(roomManager.spectateRoom(room.id, 'watcher-1')).toBe(room);
+      expect(roomManager.spectateRoom(room.id, 'watcher-2')).toBe(room);
+
+      expect(room.players).toHaveLength(1);
+      expect(roomManager.getSpectatorCount(room.id)).toBe(2);
+      expect(roomManager.getRoomByPlayerId('watcher-1')).toBeUndefined();
+    });
+
+    it('should report how many spectators remain after some leave', () => {
+      const room = roomManager.createRoom('Test Room', 'public', 'host-id', 'Host');
+      roomManager.spectateRoom(room.id, 'watcher-1');
+      roomManager.spectateRoom(room.id, 'watcher-2');
+
+      expect(roomManager.stopSpectating(['watcher-1', 'not-watching'])).toEqual([{ roomId: room.id, remaining: 1 }]);
+      expect(roomManager.stopSpectating(['watcher-2'])).toEqual([{ roomId: room.id, remaining: 0 }]);
+      expect(roomManager.getStats().spectators).toBe(0);
+    });
+
+    it('should drop spectators when the room is deleted', () => {
+      const room = roomManager.createRoom('Test Room', 'public', 'host-id', 'Host');
+      roomManager.spectateRoom(room.id, 'watcher-1');
+
+      roomManager.leaveRoom('host-id');
+
+      expect(roomManager.getSpectatorCount(room.id)).toBe(0);
+      expect(roomManager.getStats().spectators).toBe(0);
+    });
+  });
+
+  describe('undoStroke / redoStroke', () => {
+    const stroke = new Uint8Array([1, 3, 0, 0, 0, 0, 0, 0]);
+
+    it('should tombstone strokes by id and restore them in reverse order', () => {
+      const room = roomManager.createRoom('Test Room', 'public', 'host-id', 'Host');
+      expect(roomManager.addStroke(room.id, stroke)).toBe(0);
+      expect(roomManager.addStroke(room.id, stroke)).toBe(1);
+      expect(roomManager.addStroke(room.id, stroke)).toBe(2);
+
+      expect(roomManager.undoStroke(room.id)).toBe(2);
+      expect(roomManager.undoStroke(room.id)).toBe(1);
+      expect(room.canvas).toHaveLength(3);
+      expect(room.hiddenStrokes).toEqual([2, 1]);
+
+      expect(roomManager.redoStroke(room.id)).toBe(1);
+      expect(room.hiddenStrokes).toEqual([2]);
+    });
+
+    it('should drop the redo history once a new stroke is drawn', () => {
+      const room = roomManager.createRoom('Test Room', 'public', 'host-id', 'Host');
+      roomManager.addStroke(room.id, stroke);
+      roomManager.undoStroke(room.id);
+
+      expect(roomManager.addStroke(room.id, stroke)).toBe(1);
+      expect(roomManager.redoStroke(room.id)).toBeNull();
+      expect(room.hiddenStrokes).toEqual([0]);
+      expect(roomManager.undoStroke(room.id)).toBe(1);
+      expect(roomManager.undoStroke(room.id)).toBeNull();
+    });
+
+    it('should skip strokes hidden before a newer one was drawn', () => {
+      const room = roomManager.createRoom('Test Room', 'public', 'host-id', 'Host');
+      [0, 1, 2].forEach(() => roomManager.addStroke(room.id, stroke));
+      roomManager.undoStroke(room.id);
+      roomManager.addStroke(room.id, stroke);
+
+      expect(roomManager.undoStroke(room.id)).toBe(3);
+      expect(roomManager.undoStroke(room.id)).toBe(1);
+      expect(roomManager.redoStroke(room.id)).toBe(1);
+      expect(roomManager.undoStroke(room.id)).toBe(1);
+      expect(roomManager.undoStroke(room.id)).toBe(0);
+      expect(roomManager.undoStroke(room.id)).toBeNull();
+      expect(room.hiddenStrokes).toEqual([2, 3, 1, 0]);
+    });
+
+    it('should reset tombstones when the canvas is cleared', () => {
+      const room = roomManager.createRoom('Test Room', 'public', 'host-id', 'Host');
+      roomManager.addStroke(room.id, stroke);
+      roomManager.undoStroke(room.id);
+
+      roomManager.clearCanvas(room.id);
+
+      expect(room.canvas).toEqual([]);
+      expect(room.hiddenStrokes).toEqual([]);
+      expect(roomManager.redoStroke(room.id)).toBeNull();
+    });
+  });
+
   describe('submitGuess', () => {
     it('should return true for correct guess', () => {
       const room = roomManager.createRoom('Test Room', 'public', 'host-id', 'Host');
@@ -166,11 +311,14 @@ describe('RoomManager', () => {
       const word = { text: 'cat', difficulty: 'medium' as const, points: 50 };
       roomManager.selectWord(room.id, word);
 
-      const updatedRoom = roomManager.endRound(room.id, ['player-id']);
+      // The turn order is shuffled, so either player may be drawing
+      const drawer = room.currentDrawer!;
+      const guesser = drawer === 'host-id' ? 'player-id' : 'host-id';
+      const updatedRoom = roomManager.endRound(room.id, [guesser]);
 
       expect(updatedRoom).toBeDefined();
-      expect(updatedRoom?.scores['host-id']).toBe(50); // Drawer gets points
-      expect(updatedRoom?.scores['player-id']).toBe(50); // Guesser gets points
+      expect(updatedRoom?.scores[drawer]).toBe(50); // Drawer gets points
+      expect(updatedRoom?.scores[guesser]).toBe(50); // Guesser gets points
     });
 
     it('should not award points to drawer if no one guessed', () => {
@@ -185,6 +333,121 @@ describe('RoomManager', () => {
 
       expect(updatedRoom?.scores['host-id']).toBe(0);
     });
+
+    it('should report the points each player earned', () => {
+      const onRoundScored = jest.fn();
+      roomManager = new RoomManager(new ManualClock(0), onRoundScored);
+      const room = roomManager.createRoom('Test Room', 'public', 'host-id', 'Host');
+      roomManager.joinRoom(room.id, 'player-id', 'Player');
+      roomManager.joinRoom(room.id, 'other-id', 'Other');
+      roomManager.startGame(room.id);
+      roomManager.selectWord(room.id, { text: 'cat', difficulty: 'medium', points: 50 });
+      const guesser = room.turnOrder.find(id => id !== room.currentDrawer)!;
+
+      roomManager.endRound(room.id, [guesser]);
+
+      expect(onRoundScored).toHaveBeenCalledTimes(1);
+      expect(onRoundScored.mock.calls[0][0]).toHaveLength(2);
+      expect(onRoundScored.mock.calls[0][0]).toEqual(expect.arrayContaining([
+        expect.objectContaining({ playerId: room.currentDrawer, points: 50 }),
+        expect.objectContaining({ playerId: guesser, points: 50 })
+      ]));
+    });
+
+    it('should score each guesser once and ignore the drawer and unknown ids', () => {
+      const onRoundScored = jest.fn();
+      roomManager = new RoomManager(new ManualClock(0), onRoundScored);
+      const room = roomManager.createRoom('Test Room', 'public', 'host-id', 'Host');
+      roomManager.joinRoom(room.id, 'player-id', 'Player');
+      roomManager.joinRoom(room.id, 'other-id', 'Other');
+      roomManager.startGame(room.id);
+      roomManager.selectWord(room.id, { text: 'cat', difficulty: 'medium', points: 50 });
+      const drawer = room.currentDrawer!;
+      const guesser = room.turnOrder.find(id => id !== drawer)!;
+
+      roomManager.endRound(room.id, [guesser, guesser, guesser, drawer, drawer, 'stranger-id']);
+
+      expect(room.scores[guesser]).toBe(50);
+      expect(room.scores[drawer]).toBe(50);
+      expect(room.scores['stranger-id']).toBeUndefined();
+      expect(onRoundScored.mock.calls[0][0]).toHaveLength(2);
+    });
+
+    it('should not score a round that has already ended', () => {
+      const onRoundScored = jest.fn();
+      roomManager = new RoomManager(new ManualClock(0), onRoundScored);
+      const room = roomManager.createRoom('Test Room', 'public', 'host-id', 'Host');
+      roomManager.joinRoom(room.id, 'player-id', 'Player');
+      roomManager.startGame(room.id);
+      roomManager.selectWord(room.id, { text: 'cat', difficulty: 'medium', points: 50 });
+      const guesser = room.turnOrder.find(id => id !== room.currentDrawer)!;
+
+      roomManager.endRound(room.id, [guesser]);
+      expect(roomManager.endRound(room.id, [guesser])).toBeNull();
+
+      expect(room.scores[guesser]).toBe(50);
+      expect(onRoundScored).toHaveBeenCalledTimes(1);
+    });
+  });
+
+  describe('getWinner', () => {
+    it('should pick the highest score and the earliest player on ties', () => {
+      const room = roomManager.createRoom('Test Room', 'public', 'host-id', 'Host');
+      roomManager.joinRoom(room.id, 'player-id', 'Player');
+      roomManager.joinRoom(room.id, 'other-id', 'Other');
+      expect(roomManager.getWinner(room.id)).toBe('host-id');
+
+      room.players[1].score = 100;
+      room.players[2].score = 100;
+      expect(roomManager.getWinner(room.id)).toBe('player-id');
+    });
+  });
+
+  describe('quickPlay', () => {
+    it('should create a public room when none is joinable', () => {
+      const result = roomManager.quickPlay('player-1', 'Player 1');
+
+      expect(result.created).toBe(true);
+      expect(result.room.type).toBe('public');
+      expect(result.room.hostId).toBe('player-1');
+    });
+
+    it('should place players into the fullest waiting public room', () => {
+      const small = roomManager.createRoom('Small', 'public', 'host-1', 'Host 1');
+      const big = roomManager.createRoom('Big', 'public', 'host-2', 'Host 2');
+      roomManager.joinRoom(big.id, 'player-1', 'Player 1');
+      roomManager.createRoom('Private', 'private', 'host-3', 'Host 3');
+
+      const result = roomManager.quickPlay('player-2', 'Player 2');
+
+      expect(result.created).toBe(false);
+      expect(result.room.id).toBe(big.id);
+      expect(result.room.id).not.toBe(small.id);
+      expect(roomManager.getRoomByPlayerId('player-2')?.id).toBe(big.id);
+    });
+
+    it('should skip rooms with a game in progress', () => {
+      const room = roomManager.createRoom('Busy', 'public', 'host-1', 'Host 1');
+      roomManager.joinRoom(room.id, 'player-1', 'Player 1');
+      roomManager.startGame(room.id);
+
+      const result = roomManager.quickPlay('player-2', 'Player 2');
+
+      expect(result.created).toBe(true);
+    });
+  });
+
+  describe('getStats', () => {
+    it('should count rooms, players and joinable rooms', () => {
+      const room = roomManager.createRoom('Public Room', 'public', 'host-1', 'Host 1');
+      roomManager.joinRoom(room.id, 'player-1', 'Player 1');
+      roomManager.createRoom('Private Room', 'private', 'host-2', 'Host 2');
+
+      expect(roomManager.getStats()).toEqual({ rooms: 2, players: 3, spectators: 0, joinableRooms: 1 });
+
+      roomManager.leaveRoom('host-2');
+      expect(roomManager.getStats().rooms).toBe(1);
+    });
   });
 
   describe('getPublicRooms', () => {
@@ -0,0 +1,75 @@
+import { DisconnectBatcher, ThrottledTask, loadBatchingConfig } from '../../server/batching';
+import { ManualClock } from '../../server/clock';
+
+describe('DisconnectBatcher', () => {
+  it('should flush disconnects inside the window as one batch', () => {
+    const clock = new ManualClock(0);
+    const flush = jest.fn();
+    const batcher = new DisconnectBatcher(flush, 50, clock);
+
+    batcher.add('a');
+    clock.advance(20);
+    batcher.add('b');
+    batcher.add('c');
+    expect(flush).not.toHaveBeenCalled();
+
+    clock.advance(30);
+    expect(flush).toHaveBeenCalledTimes(1);
+    expect(flush).toHaveBeenCalledWith(['a', 'b', 'c']);
+
+    batcher.add('d');
+    clock.advance(50);
+    expect(flush).toHaveBeenLastCalledWith(['d']);
+    expect(batcher.getStats()).toEqual({ pending: 0, batches: 2, largestBatch: 3 });
+  });
+
+  it('should flush early on drain and cancel the pending timer', () => {
+    const clock = new ManualClock(0);
+    const flush = jest.fn();
+    const batcher = new DisconnectBatcher(flush, 50, clock);
+
+    batcher.add('a');
+    batcher.drain();
+
+    expect(flush).toHaveBeenCalledWith(['a']);
+    expect(clock.pendingTimers).toBe(0);
+  });
+});
+
+describe('ThrottledTask', () => {
+  it('should run immediately and collapse requests inside the interval into one trailing run', () => {
+    const clock = new ManualClock(0);
+    const task = jest.fn();
+    const throttled = new ThrottledTask(task, 250, clock);
+
+    throttled.request();
+    expect(task).toHaveBeenCalledTimes(1);
+
+    for (let i = 0; i < 100; i++) {
+      throttled.request();
+    }
+    expect(task).toHaveBeenCalledTimes(1);
+
+    clock.advance(250);
+    expect(task).toHaveBeenCalledTimes(2);
+    expect(throttled.getStats()).toEqual({ requested: 101, runs: 2 });
+  });
+
+  it('should run every request when the interval is zero', () => {
+    const task = jest.fn();
+    const throttled = new ThrottledTask(task, 0, new ManualClock(0));
+
+    throttled.request();
+    throttled.request();
+
+    expect(task).toHaveBeenCalledTimes(2);
+  });
+});
+
+describe('loadBatchingConfig', () => {
+  it('should read windows from the environment and accept zero', () => {
+    expect(loadBatchingConfig({})).toEqual({ disconnectBatchMs: 50, roomsListIntervalMs: 250, guessBatchMs: 50 });
+    expect(loadBatchingConfig({ DISCONNECT_BATCH_MS: '0', ROOMS_LIST_INTERVAL_MS: 'abc', GUESS_BATCH_MS: '20' }))
+      .toEqual({ disconnectBatchMs: 0, roomsListIntervalMs: 250, guessBatchMs: 20 });
+  });
+});
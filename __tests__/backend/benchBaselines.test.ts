@@ -0,0 +1,41 @@
+import { compareToBaselines } from '../../bench/baselines';
+import { BenchResult, measure } from '../../bench/harness';
+
+const result = (name: string, nsPerOp: number): BenchResult => ({
+  name,
+  iterations: 1000,
+  samples: 10,
+  nsPerOp,
+  minNsPerOp: nsPerOp,
+  spread: 0
+});
+
+describe('benchmark regression gate', () => {
+  it('should flag only operations slower than the threshold', () => {
+    const comparisons = compareToBaselines(
+      { 'RoomManager / joinRoom': 100, 'RoomManager / leaveRoom': 100 },
+      'RoomManager',
+      [result('joinRoom', 120), result('leaveRoom', 130), result('addStroke', 500)],
+      0.25
+    );
+
+    expect(comparisons.map(({ key, regressed }) => [key, regressed])).toEqual([
+      ['RoomManager / joinRoom', false],
+      ['RoomManager / leaveRoom', true],
+      ['RoomManager / addStroke', false]
+    ]);
+    expect(comparisons[2].baseline).toBeNull();
+  });
+
+  it('should run setup before the warmup and every sample', () => {
+    const setup = jest.fn();
+    const fn = jest.fn();
+
+    const { samples, nsPerOp } = measure('noop', fn, { iterations: 10, samples: 3, warmup: 5, setup });
+
+    expect(setup).toHaveBeenCalledTimes(4);
+    expect(fn).toHaveBeenCalledTimes(35);
+    expect(samples).toBe(3);
+    expect(nsPerOp).toBeGreaterThan(0);
+  });
+});
@@ -0,0 +1,62 @@
+import { ManualClock, ScaledClock, createClock, systemClock } from '../../server/clock';
+
+describe('ManualClock', () => {
+  it('should only move time when advanced', () => {
+    const clock = new ManualClock(1000);
+
+    expect(clock.now()).toBe(1000);
+    clock.advance(250);
+    expect(clock.now()).toBe(1250);
+  });
+
+  it('should fire timeouts and intervals in due order', () => {
+    const clock = new ManualClock(0);
+    const fired: string[] = [];
+
+    clock.setTimeout(() => fired.push(`timeout@${clock.now()}`), 2500);
+    clock.setInterval(() => fired.push(`tick@${clock.now()}`), 1000);
+
+    clock.advance(3000);
+
+    expect(fired).toEqual(['tick@1000', 'tick@2000', 'timeout@2500', 'tick@3000']);
+    expect(clock.pendingTimers).toBe(1);
+  });
+
+  it('should not fire cancelled timers', () => {
+    const clock = new ManualClock(0);
+    const callback = jest.fn();
+
+    const cancel = clock.setInterval(callback, 100);
+    clock.advance(250);
+    cancel();
+    clock.advance(1000);
+
+    expect(callback).toHaveBeenCalledTimes(2);
+    expect(clock.pendingTimers).toBe(0);
+  });
+
+  it('should run timers scheduled from inside callbacks', () => {
+    const clock = new ManualClock(0);
+    const callback = jest.fn();
+
+    clock.setTimeout(() => clock.setTimeout(callback, 5000), 1000);
+    clock.advance(6000);
+
+    expect(callback).toHaveBeenCalledTimes(1);
+  });
+});
+
+describe('createClock', () => {
+  it('should use the system clock by default and in production', () => {
+    expect(createClock({})).toBe(systemClock);
+    expect(createClock({ TEST_CLOCK: 'manual', NODE_ENV: 'production' })).toBe(systemClock);
+  });
+
+  it('should build scaled and manual clocks from TEST_CLOCK', () => {
+    const scaled = createClock({ TEST_CLOCK: 'scaled:100' });
+
+    expect(scaled).toBeInstanceOf(ScaledClock);
+    expect((scaled as ScaledClock).scale).toBe(100);
+    expect(createClock({ TEST_CLOCK: 'manual' })).toBeInstanceOf(ManualClock);
+  });
+});
@@ -0,0 +1,117 @@
+import { EventEmitter } from 'events';
+import { CompressionPolicy, loadCompressionConfig, perMessageDeflateOptions } from '../../server/compression';
+
+const roomPayload = (players: number) =>
+  '2["room:updated",' + JSON.stringify({
+    id: 'room-1',
+    players: Array.from({ length: players }, (_, i) => ({
+      id: `player-${i}`,
+      name: `Player ${i}`,
+      score: 0,
+      isHost: i === 0,
+      connected: true
+    }))
+  }) + ']';
+
+describe('compression config', () => {
+  it('should default to a threshold and skip strokes and clock pongs', () => {
+    const config = loadCompressionConfig({});
+    expect(config.thresholdBytes).toBe(1024);
+    expect(config.neverCompress).toEqual(['drawing:stroke', 'clock:pong']);
+
+    const policy = new CompressionPolicy(config);
+    expect(policy.shouldCompress('room:updated')).toBe(true);
+    expect(policy.shouldCompress('drawing:stroke')).toBe(false);
+  });
+
+  it('should read overrides and disable permessage-deflate entirely', () => {
+    const config = loadCompressionConfig({
+      COMPRESSION_ENABLED: 'false',
+      COMPRESSION_NEVER: 'rooms:list, game:end',
+      COMPRESSION_CONTEXT_TAKEOVER: 'false'
+    });
+    expect(config.neverCompress).toEqual(['rooms:list', 'game:end']);
+    expect(perMessageDeflateOptions(config)).toBe(false);
+    expect(perMessageDeflateOptions({ ...config, enabled: true })).toMatchObject({
+      threshold: 1024,
+      serverMaxWindowBits: 12,
+      zlibDeflateOptions: { memLevel: 5 },
+      serverNoContextTakeover: true
+    });
+  });
+
+  it('should keep window bits and memLevel within what zlib accepts', () => {
+    expect(loadCompressionConfig({ COMPRESSION_WINDOW_BITS: '20', COMPRESSION_MEM_LEVEL: '0' })).toMatchObject({
+      windowBits: 15,
+      memLevel: 1
+    });
+  });
+});
+
+describe('CompressionPolicy', () => {
+  it('should only sample messages that would be compressed', () => {
+    const policy = new CompressionPolicy({ ...loadCompressionConfig({}), sampleEvery: 1 });
+
+    policy.record('clock:pong', '2["clock:pong",{"clientTime":1,"serverTime":2}]', true);
+    policy.record('room:updated', roomPayload(30), true);
+    policy.record('room:updated', roomPayload(30), false);
+
+    const stats = policy.getStats();
+    expect(stats.events['clock:pong'].eligibleBytes).toBe(0);
+    expect(stats.events['room:updated'].messages).toBe(2);
+    expect(stats.events['room:updated'].eligibleMessages).toBe(1);
+    expect(stats.estimatedSavedBytes).toBeGreaterThan(0);
+    expect(stats.estimatedSavedBytes).toBeLessThan(stats.bytes);
+  });
+
+  it('should extrapolate from every Nth eligible message', () => {
+    const policy = new CompressionPolicy({ ...loadCompressionConfig({}), sampleEvery: 4 });
+
+    for (let i = 0; i < 8; i++) {
+      policy.record('room:updated', roomPayload(30), true);
+    }
+
+    const room = policy.getStats().events['room:updated'];
+    expect(room.sampledBytes * 4).toBe(room.eligibleBytes);
+    expect(room.estimatedSavedBytes).toBe((room.sampledBytes - room.sampledCompressedBytes) * 4);
+  });
+
+  it('should only credit room-shaped events with the room dictionary', () => {
+    const policy = new CompressionPolicy({ ...loadCompressionConfig({}), sampleEvery: 1 });
+    const payload = roomPayload(30);
+
+    policy.record('room:updated', payload, true);
+    policy.record('rooms:list', payload, true);
+
+    const { events } = policy.getStats();
+    expect(events['rooms:list'].bytes).toBe(Buffer.byteLength(payload));
+    expect(events['rooms:list'].sampledCompressedBytes).toBeGreaterThan(events['room:updated'].sampledCompressedBytes);
+  });
+
+  it('should bill binary attachments to the event that carried them', () => {
+    const policy = new CompressionPolicy(loadCompressionConfig({}));
+    const socket = new EventEmitter();
+    policy.observe(socket);
+
+    socket.emit('packetCreate', { type: 'message', data: '51-["drawing:stroke",{"_placeholder":true,"num":0}]' });
+    socket.emit('packetCreate', { type: 'message', data: new Uint8Array(64), options: { compress: false } });
+    socket.emit('packetCreate', { type: 'ping' });
+
+    expect(policy.getStats().events['drawing:stroke'].messages).toBe(2);
+  });
+
+  it('should count sockets holding a deflate context until they close', () => {
+    const policy = new CompressionPolicy(loadCompressionConfig({}));
+    const sockets = [new EventEmitter(), new EventEmitter()];
+    sockets.forEach(socket => policy.observe(socket));
+
+    sockets[0].emit('packetCreate', { type: 'message', data: roomPayload(30) });
+    sockets[0].emit('packetCreate', { type: 'message', data: roomPayload(30) });
+    sockets[1].emit('packetCreate', { type: 'message', data: '2["clock:pong",{"clientTime":1,"serverTime":2}]' });
+    expect(policy.getStats()).toMatchObject({ compressingSockets: 1, estimatedDeflateMemoryBytes: 32 * 1024 });
+
+    sockets[0].emit('close');
+    sockets[1].emit('close');
+    expect(policy.getStats().compressingSockets).toBe(0);
+  });
+});
@@ -0,0 +1,17 @@
+import { readNumber, readPositiveNumber } from '../../server/config';
+
+describe('config readers', () => {
+  it('should fall back on missing, invalid or negative values', () => {
+    const env = { ZERO: '0', HALF: '0.5', NEGATIVE: '-1', TEXT: 'fast' };
+    expect(readNumber(env, 'MISSING', 7)).toBe(7);
+    expect(readNumber(env, 'TEXT', 7)).toBe(7);
+    expect(readNumber(env, 'NEGATIVE', 7)).toBe(7);
+    expect(readNumber(env, 'ZERO', 7)).toBe(0);
+    expect(readNumber(env, 'HALF', 7)).toBe(0.5);
+  });
+
+  it('should also reject zero where a positive value is required', () => {
+    expect(readPositiveNumber({ ZERO: '0' }, 'ZERO', 7)).toBe(7);
+    expect(readPositiveNumber({ TWO: '2' }, 'TWO', 7)).toBe(2);
+  });
+});
@@ -0,0 +1,62 @@
+import { IncomingMessage, ServerResponse } from 'http';
+import { Lifecycle, handleHealthRequest, loadDrainConfig } from '../../server/health';
+
+const request = (lifecycle: Lifecycle, url: string) => {
+  const res = { writeHead: jest.fn(), end: jest.fn() };
+  const handled = handleHealthRequest(
+    lifecycle,
+    { method: 'GET', url } as IncomingMessage,
+    res as unknown as ServerResponse
+  );
+  return { handled, status: res.writeHead.mock.calls[0]?.[0], body: res.end.mock.calls[0] && JSON.parse(res.end.mock.calls[0][0]) };
+};
+
+describe('health endpoints', () => {
+  it('should stay live but turn unready once a drain starts', () => {
+    const lifecycle = new Lifecycle();
+    expect(request(lifecycle, '/healthz')).toMatchObject({ handled: true, status: 200, body: { status: 'ok' } });
+    expect(request(lifecycle, '/readyz')).toMatchObject({ handled: true, status: 200, body: { status: 'ready' } });
+
+    lifecycle.drain(() => 1, { timeoutMs: 60000, pollMs: 1000 });
+
+    expect(lifecycle.isDraining).toBe(true);
+    expect(request(lifecycle, '/healthz').status).toBe(200);
+    expect(request(lifecycle, '/readyz')).toMatchObject({ status: 503, body: { status: 'draining' } });
+    expect(request(lifecycle, '/metrics').handled).toBe(false);
+  });
+});
+
+describe('Lifecycle.drain', () => {
+  beforeEach(() => {
+    jest.useFakeTimers();
+  });
+
+  afterEach(() => {
+    jest.useRealTimers();
+  });
+
+  it('should resolve once the last active game ends', async () => {
+    const lifecycle = new Lifecycle();
+    let active = 2;
+    const drained = lifecycle.drain(() => active, { timeoutMs: 60000, pollMs: 1000 });
+
+    active = 0;
+    jest.advanceTimersByTime(1000);
+
+    await expect(drained).resolves.toEqual({ activeRounds: 0, timedOut: false });
+  });
+
+  it('should give up after the timeout', async () => {
+    const lifecycle = new Lifecycle();
+    const drained = lifecycle.drain(() => 3, { timeoutMs: 5000, pollMs: 1000 });
+
+    jest.advanceTimersByTime(5000);
+
+    await expect(drained).resolves.toEqual({ activeRounds: 3, timedOut: true });
+  });
+
+  it('should read the timeout from the environment', () => {
+    expect(loadDrainConfig({}).timeoutMs).toBe(120000);
+    expect(loadDrainConfig({ DRAIN_TIMEOUT_MS: '5000' }).timeoutMs).toBe(5000);
+  });
+});
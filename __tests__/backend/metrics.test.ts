@@ -0,0 +1,47 @@
+import { IncomingMessage, ServerResponse } from 'http';
+import { ServerMetrics, handleMetricsRequest } from '../../server/metrics';
+
+const request = (metrics: ServerMetrics, url: string) => {
+  const res = { writeHead: jest.fn(), end: jest.fn() };
+  const handled = handleMetricsRequest(
+    metrics,
+    { method: 'GET', url } as IncomingMessage,
+    res as unknown as ServerResponse
+  );
+  return { handled, body: res.end.mock.calls[0] && JSON.parse(res.end.mock.calls[0][0]) };
+};
+
+describe('metrics endpoint', () => {
+  let now: number;
+
+  beforeEach(() => {
+    now = 1000;
+    jest.spyOn(Date, 'now').mockImplementation(() => now);
+  });
+
+  afterEach(() => {
+    jest.restoreAllMocks();
+  });
+
+  it('should keep a separate CPU and lag window per named consumer', () => {
+    const metrics = new ServerMetrics();
+
+    now = 5000;
+    expect(request(metrics, '/metrics?window=soak').body.cpu.windowMs).toBe(4000);
+
+    // Neither another window nor an unnamed read restarts the soak window
+    now = 6000;
+    expect(request(metrics, '/metrics?window=storm').body.cpu.windowMs).toBe(5000);
+    expect(request(metrics, '/metrics').body.cpu.windowMs).toBe(5000);
+
+    now = 7000;
+    expect(request(metrics, '/metrics?window=soak').body.cpu.windowMs).toBe(2000);
+    expect(request(metrics, '/metrics').body).toMatchObject({ uptimeMs: 6000, cpu: { windowMs: 6000 } });
+  });
+
+  it('should only answer its own path', () => {
+    const metrics = new ServerMetrics();
+    expect(request(metrics, '/metricsz').handled).toBe(false);
+    expect(request(metrics, '/healthz').handled).toBe(false);
+  });
+});
@@ -0,0 +1,122 @@
+import { SpectatorFanout, loadSpectatorConfig, spectatorView } from '../../server/spectators';
+import { ManualClock } from '../../server/clock';
+import { RoomManager } from '../../server/RoomManager';
+import { unpackStrokes } from '../../lib/strokeCodec';
+
+// One-point stroke whose x coordinate tags it
+const stroke = (x: number) => new Uint8Array([1, 3, 0, 0, 0, 0, 1, 0, x, 0, x, 0]);
+
+const setup = () => {
+  const clock = new ManualClock(0);
+  const sink = { strokes: jest.fn(), delta: jest.fn() };
+  const fanout = new SpectatorFanout(sink, 250, clock);
+  const roomManager = new RoomManager(clock);
+  const room = roomManager.createRoom('Test Room', 'public', 'host', 'Host');
+  roomManager.joinRoom(room.id, 'guest', 'Guest');
+  return { clock, sink, fanout, roomManager, room };
+};
+
+describe('SpectatorFanout', () => {
+  it('should batch strokes into one packed buffer per flush window', () => {
+    const { clock, sink, fanout, room } = setup();
+    fanout.watch(room);
+
+    fanout.addStroke(room.id, stroke(1));
+    fanout.addStroke(room.id, stroke(2));
+    fanout.addStroke(room.id, stroke(3));
+    expect(sink.strokes).not.toHaveBeenCalled();
+
+    clock.advance(250);
+    expect(sink.strokes).toHaveBeenCalledTimes(1);
+    const [roomId, packed] = sink.strokes.mock.calls[0];
+    expect(roomId).toBe(room.id);
+    expect(unpackStrokes(packed).map((s) => s[8])).toEqual([1, 2, 3]);
+    expect(fanout.getStats()).toMatchObject({ strokeBatches: 1, strokes: 3 });
+  });
+
+  it('should ignore rooms nobody is watching', () => {
+    const { clock, sink, fanout, room } = setup();
+
+    fanout.addStroke(room.id, stroke(1));
+    fanout.roomChanged(room);
+    clock.advance(250);
+
+    expect(sink.strokes).not.toHaveBeenCalled();
+    expect(sink.delta).not.toHaveBeenCalled();
+  });
+
+  it('should send only the changed fields and never the word', () => {
+    const { clock, sink, fanout, roomManager, room } = setup();
+    fanout.watch(room);
+
+    roomManager.startGame(room.id);
+    fanout.roomChanged(room);
+    roomManager.selectWord(room.id, room.wordChoices[0]);
+    fanout.roomChanged(room);
+    clock.advance(250);
+
+    expect(sink.delta).toHaveBeenCalledTimes(1);
+    const delta = sink.delta.mock.calls[0][1];
+    expect(delta.gameState).toBe('drawing');
+    expect(delta.currentDrawer).toBe(room.currentDrawer);
+    expect(delta).not.toHaveProperty('players');
+    expect(delta).not.toHaveProperty('currentWord');
+    expect(delta).not.toHaveProperty('wordChoices');
+    expect(delta).not.toHaveProperty('canvas');
+
+    fanout.roomChanged(room);
+    clock.advance(250);
+    expect(sink.delta).toHaveBeenCalledTimes(1);
+  });
+
+  it('should tell spectators when the canvas is wiped by a new round', () => {
+    const { clock, sink, fanout, roomManager, room } = setup();
+    roomManager.startGame(room.id);
+    roomManager.selectWord(room.id, room.wordChoices[0]);
+    fanout.watch(room);
+
+    roomManager.addStroke(room.id, stroke(1));
+    fanout.addStroke(room.id, stroke(1));
+    clock.advance(250);
+
+    roomManager.endRound(room.id, []);
+    roomManager.nextRound(room.id);
+    fanout.roomChanged(room);
+    clock.advance(250);
+
+    expect(sink.delta.mock.calls[0][1].canvas).toEqual([]);
+  });
+
+  it('should flush a room early and drop its state when unwatched', () => {
+    const { sink, fanout, room } = setup();
+    fanout.watch(room);
+
+    fanout.addStroke(room.id, stroke(1));
+    fanout.flushRoom(room.id);
+    expect(sink.strokes).toHaveBeenCalledTimes(1);
+
+    fanout.addStroke(room.id, stroke(2));
+    fanout.unwatch(room.id);
+    fanout.flush();
+    expect(sink.strokes).toHaveBeenCalledTimes(1);
+    expect(fanout.getStats().watchedRooms).toBe(0);
+  });
+});
+
+describe('spectatorView', () => {
+  it('should hide the word and word choices', () => {
+    const { roomManager, room } = setup();
+    roomManager.startGame(room.id);
+    roomManager.selectWord(room.id, room.wordChoices[0]);
+
+    const view = spectatorView(room);
+    expect(view.currentWord).toBeNull();
+    expect(view.wordChoices).toEqual([]);
+    expect(room.currentWord).not.toBeNull();
+  });
+
+  it('should read its limits from the environment', () => {
+    expect(loadSpectatorConfig({})).toEqual({ flushMs: 250, maxSpectatorsPerRoom: 500 });
+    expect(loadSpectatorConfig({ SPECTATOR_FLUSH_MS: '1000' }).flushMs).toBe(1000);
+  });
+});
@@ -0,0 +1,69 @@
+import {
+  encodeStroke,
+  decodeStroke,
+  isValidEncodedStroke,
+  getStrokePointCount,
+  packStrokes,
+  unpackStrokes,
+  STROKE_HEADER_BYTES,
+  STROKE_POINT_BYTES,
+} from '../../lib/strokeCodec';
+
+describe('strokeCodec', () => {
+  const stroke = {
+    color: '#ff00a5',
+    width: 5,
+    points: [
+      { x: 10, y: 20 },
+      { x: 10.25, y: 599.5 },
+      { x: 799.75, y: 0 },
+    ],
+  };
+
+  it('should round-trip color, width and points', () => {
+    const encoded = encodeStroke(stroke);
+
+    expect(encoded.byteLength).toBe(STROKE_HEADER_BYTES + 3 * STROKE_POINT_BYTES);
+    expect(getStrokePointCount(encoded)).toBe(3);
+    expect(decodeStroke(encoded)).toEqual(stroke);
+  });
+
+  it('should decode from a plain ArrayBuffer', () => {
+    const encoded = encodeStroke(stroke);
+    const copy = encoded.buffer.slice(0);
+
+    expect(decodeStroke(copy)).toEqual(stroke);
+  });
+
+  it('should clamp coordinates outside the canvas', () => {
+    const decoded = decodeStroke(encodeStroke({ ...stroke, points: [{ x: -5, y: 20000 }] }));
+
+    expect(decoded.points[0].x).toBe(0);
+    expect(decoded.points[0].y).toBeLessThan(20000);
+  });
+
+  it('should validate encoded packets', () => {
+    const encoded = encodeStroke(stroke);
+
+    expect(isValidEncodedStroke(encoded, 10)).toBe(true);
+    expect(isValidEncodedStroke(encoded, 2)).toBe(false);
+    expect(isValidEncodedStroke(encoded.subarray(0, encoded.byteLength - 1), 10)).toBe(false);
+    expect(isValidEncodedStroke(encodeStroke({ ...stroke, points: [] }), 10)).toBe(false);
+    expect(isValidEncodedStroke(stroke, 10)).toBe(false);
+    expect(isValidEncodedStroke(null, 10)).toBe(false);
+  });
+
+  it('should pack a batch into one buffer and unpack views of each stroke', () => {
+    const first = encodeStroke(stroke);
+    const second = encodeStroke({ ...stroke, width: 8, points: stroke.points.slice(0, 2) });
+
+    const packed = packStrokes([first, second.buffer.slice(0)]);
+    const unpacked = unpackStrokes(packed);
+
+    expect(packed.byteLength).toBe(first.byteLength + second.byteLength);
+    expect(unpacked).toHaveLength(2);
+    expect(unpacked[0].buffer).toBe(packed);
+    expect(decodeStroke(unpacked[0])).toEqual(stroke);
+    expect(decodeStroke(unpacked[1])).toEqual(decodeStroke(second));
+  });
+});
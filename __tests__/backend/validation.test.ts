@@ -0,0 +1,71 @@
+import { EventValidator, arrayOf, object, oneOf, optional, rejectionMessage, string } from '../../server/validation';
+import { MAX_NAME_LENGTH } from '../../types';
+
+describe('validation checks', () => {
+  it('should check object fields and ignore extra keys', () => {
+    const check = object({ name: string(1, 5), kind: oneOf('a', 'b'), note: optional(string(0, 3)) });
+
+    expect(check({ name: 'Ann', kind: 'a', extra: true })).toBe(true);
+    expect(check({ name: 'Ann', kind: 'c' })).toBe(false);
+    expect(check({ name: 'Annabel', kind: 'a' })).toBe(false);
+    expect(check({ name: 'Ann', kind: 'a', note: 'long' })).toBe(false);
+    expect(check(null)).toBe(false);
+    expect(check(['Ann', 'a'])).toBe(false);
+  });
+
+  it('should bound arrays and check every item', () => {
+    const check = arrayOf(string(1, 10), 2);
+
+    expect(check(['a', 'b'])).toBe(true);
+    expect(check(['a', 'b', 'c'])).toBe(false);
+    expect(check(['a', 3])).toBe(false);
+  });
+});
+
+describe('EventValidator', () => {
+  let validator: EventValidator;
+
+  beforeEach(() => {
+    validator = new EventValidator();
+  });
+
+  it('should accept well-formed client events', () => {
+    expect(validator.isValid(['room:create', { roomName: 'Room', roomType: 'private', playerName: 'Ann' }])).toBe(true);
+    expect(validator.isValid(['game:select-word', { text: 'cat', difficulty: 'easy', points: 10 }])).toBe(true);
+    expect(validator.isValid(['drawing:stroke', new Uint8Array(12)])).toBe(true);
+    expect(validator.isValid(['leaderboard:fetch', { window: 'daily' }])).toBe(true);
+    expect(validator.isValid(['game:start'])).toBe(true);
+  });
+
+  it('should reject malformed payloads and count them per event', () => {
+    expect(validator.isValid(['room:join', { roomId: 'room-1' }])).toBe(false);
+    expect(validator.isValid(['game:select-word', { text: 'cat', difficulty: 'easy', points: '10' }])).toBe(false);
+    expect(validator.isValid(['drawing:stroke', [1, 2, 3]])).toBe(false);
+    expect(validator.isValid(['guess:submit', { text: 'cat' }])).toBe(false);
+    expect(validator.isValid(['clock:ping', NaN])).toBe(false);
+    expect(validator.isValid(['game:stop-timer', 'player-1'])).toBe(false);
+    expect(validator.isValid(['admin:shutdown'])).toBe(false);
+
+    expect(validator.getStats().rejected).toEqual({
+      'room:join': 1,
+      'game:select-word': 1,
+      'drawing:stroke': 1,
+      'guess:submit': 1,
+      'clock:ping': 1,
+      'game:stop-timer': 1,
+      unknown: 1
+    });
+  });
+
+  it('should explain rejected names and keep other rejections generic', () => {
+    const validator = new EventValidator();
+    const longName = 'x'.repeat(MAX_NAME_LENGTH + 1);
+    const join = ['room:join', { roomId: 'room-1', playerName: longName }];
+
+    expect(validator.isValid(join)).toBe(false);
+    expect(rejectionMessage(join)).toBe(`Names can be at most ${MAX_NAME_LENGTH} characters`);
+    expect(rejectionMessage(['room:create', { roomName: longName, roomType: 'public', playerName: 'Ann' }]))
+      .toContain('at most');
+    expect(rejectionMessage(['room:join', { roomId: 'room-1' }])).toBe('Invalid request');
+  });
+});
@@ -1,13 +1,13 @@
 import { render, screen, fireEvent } from '@testing-library/react';
 import Canvas from '../../components/Canvas';
-import { DrawingStroke } from '../../types';
+import { EncodedStroke } from '../../types';
 
 describe('Canvas Component', () => {
   const mockOnStroke = jest.fn();
   const mockOnClear = jest.fn();
 
   const defaultProps = {
-    strokes: [] as DrawingStroke[],
+    strokes: [] as EncodedStroke[],
     canDraw: true,
     onStroke: mockOnStroke,
     onClear: mockOnClear,
@@ -1,4 +1,4 @@
-import { render, screen } from '@testing-library/react';
+import { act, render, screen } from '@testing-library/react';
 import Timer from '../../components/Timer';
 
 describe('Timer Component', () => {
@@ -50,4 +50,37 @@ describe('Timer Component', () => {
     const progressBar = container.querySelector('.h-full');
     expect(progressBar).toHaveClass('bg-primary-500');
   });
+
+  describe('with a server deadline', () => {
+    beforeEach(() => {
+      jest.useFakeTimers();
+      jest.setSystemTime(100000);
+    });
+
+    afterEach(() => {
+      jest.useRealTimers();
+    });
+
+    it('should count down locally to the deadline', () => {
+      render(<Timer seconds={60} isActive={true} deadline={105000} clockOffset={0} duration={60} />);
+      expect(screen.getByText('5s')).toBeInTheDocument();
+
+      act(() => {
+        jest.advanceTimersByTime(2000);
+      });
+      expect(screen.getByText('3s')).toBeInTheDocument();
+
+      act(() => {
+        jest.advanceTimersByTime(10000);
+      });
+      expect(screen.getByText('0s')).toBeInTheDocument();
+    });
+
+    it('should correct for the server clock offset', () => {
+      // The server clock runs 3s ahead of this client
+      render(<Timer seconds={60} isActive={true} deadline={113000} clockOffset={3000} duration={60} />);
+
+      expect(screen.getByText('10s')).toBeInTheDocument();
+    });
+  });
 });
@@ -0,0 +1,37 @@
+import { ClockSync, secondsUntil } from '../../lib/clockSync';
+
+describe('ClockSync', () => {
+  it('should take the offset from the sample with the shortest round trip', () => {
+    const sync = new ClockSync();
+    expect(sync.hasSamples).toBe(false);
+    expect(sync.offset).toBe(0);
+
+    // Sent at 1000, server read 5050, back at 1100: one-way 50ms, offset 4000
+    expect(sync.addSample(1000, 5050, 1100)).toBe(4000);
+
+    // A slow round trip skews the estimate and is ignored
+    sync.addSample(2000, 6600, 2800);
+    expect(sync.offset).toBe(4000);
+
+    sync.addSample(3000, 7010, 3020);
+    expect(sync.offset).toBe(4000);
+  });
+
+  it('should forget old samples', () => {
+    const sync = new ClockSync();
+    sync.addSample(0, 10, 20);
+    for (let i = 1; i <= 5; i++) {
+      sync.addSample(i * 1000, i * 1000 + 600, i * 1000 + 200);
+    }
+
+    expect(sync.offset).toBe(500);
+  });
+});
+
+describe('secondsUntil', () => {
+  it('should round partial seconds up and never go negative', () => {
+    expect(secondsUntil(10000, 0, 8500)).toBe(2);
+    expect(secondsUntil(10000, 1000, 8500)).toBe(1);
+    expect(secondsUntil(10000, 0, 12000)).toBe(0);
+  });
+});
@@ -0,0 +1,147 @@
+import { EventEmitter } from 'events';
+import { useGameStore } from '../../lib/store';
+import { bindSocketToStore, sendStroke } from '../../lib/socketEvents';
+import { TypedSocket } from '../../lib/socket';
+import { Room } from '../../types';
+
+const makeRoom = (overrides: Partial<Room> = {}): Room => ({
+  id: 'room-1',
+  name: 'Test Room',
+  type: 'public',
+  players: [
+    { id: 'host', name: 'Host', score: 0, isHost: true, connected: true },
+    { id: 'guest', name: 'Guest', score: 0, isHost: false, connected: true },
+  ],
+  gameState: 'drawing',
+  currentDrawer: 'host',
+  currentWord: null,
+  selectedWord: null,
+  wordChoices: [],
+  turnOrder: ['host', 'guest'],
+  currentTurnIndex: 0,
+  scores: { host: 0, guest: 0 },
+  roundTimer: 60,
+  roundStartTime: null,
+  correctGuessers: [],
+  canvas: [],
+  hiddenStrokes: [],
+  hostId: 'host',
+  maxPlayers: 15,
+  roundDuration: 60,
+  ...overrides,
+});
+
+describe('game store', () => {
+  beforeEach(() => {
+    useGameStore.getState().reset();
+  });
+
+  it('should add strokes without touching the room or players slices', () => {
+    const store = useGameStore.getState();
+    store.setRoom(makeRoom());
+    const { room, players } = useGameStore.getState();
+
+    store.addStroke(new Uint8Array([1, 3, 0, 0, 0, 0, 0, 0]));
+
+    const state = useGameStore.getState();
+    expect(state.strokes).toHaveLength(1);
+    expect(state.room).toBe(room);
+    expect(state.players).toBe(players);
+  });
+
+  it('should only resync strokes from a room snapshot when the canvases disagree', () => {
+    const store = useGameStore.getState();
+    const stroke = new Uint8Array([1, 3, 0, 0, 0, 0, 0, 0]);
+    store.addStroke(stroke);
+    const strokes = useGameStore.getState().strokes;
+
+    store.setRoom(makeRoom({ canvas: [stroke] }));
+    expect(useGameStore.getState().strokes).toBe(strokes);
+
+    store.setRoom(makeRoom({ canvas: [] }));
+    expect(useGameStore.getState().strokes).toEqual([]);
+  });
+
+  it('should merge spectator deltas without resyncing batched strokes', () => {
+    const store = useGameStore.getState();
+    store.setRoom(makeRoom({ gameState: 'word-selection' }));
+    store.addStrokes([new Uint8Array([1, 3, 0, 0, 0, 0, 0, 0]), new Uint8Array([1, 3, 0, 0, 0, 0, 0, 0])]);
+
+    store.applyRoomDelta({ gameState: 'drawing', scores: { host: 5, guest: 0 } });
+    let state = useGameStore.getState();
+    expect(state.room?.gameState).toBe('drawing');
+    expect(state.room?.scores.host).toBe(5);
+    expect(state.room?.name).toBe('Test Room');
+    expect(state.strokes).toHaveLength(2);
+
+    store.applyRoomDelta({ canvas: [] });
+    state = useGameStore.getState();
+    expect(state.strokes).toEqual([]);
+  });
+
+  it('should tombstone and restore strokes by id', () => {
+    const store = useGameStore.getState();
+    store.hideStroke(2);
+    store.hideStroke(2);
+    store.hideStroke(5);
+    expect(useGameStore.getState().hiddenStrokes).toEqual([2, 5]);
+
+    store.showStroke(2);
+    expect(useGameStore.getState().hiddenStrokes).toEqual([5]);
+
+    store.clearStrokes();
+    expect(useGameStore.getState().hiddenStrokes).toEqual([]);
+  });
+});
+
+describe('bindSocketToStore', () => {
+  beforeEach(() => {
+    useGameStore.getState().reset();
+  });
+
+  it('should route events into the store and remove only its own handlers', () => {
+    const socket = new EventEmitter();
+    const otherListener = jest.fn();
+    socket.on('drawing:stroke', otherListener);
+
+    const unbind = bindSocketToStore(socket as unknown as TypedSocket);
+    socket.emit('game:round-start', { drawer: 'host', word: 'cat', timer: 45, deadline: 46000, serverTime: 1000 });
+    socket.emit('drawing:stroke', new Uint8Array([1, 3, 0, 0, 0, 0, 0, 0]));
+    socket.emit('guess:correct', [{ playerId: 'guest', playerName: 'Guest' }]);
+
+    const state = useGameStore.getState();
+    expect(state.currentWord).toBe('cat');
+    expect(state.timeLeft).toBe(45);
+    expect(state.deadline).toBe(46000);
+    expect(state.strokes).toHaveLength(1);
+    expect(state.correctGuessers).toEqual([{ playerId: 'guest', playerName: 'Guest' }]);
+    expect(state.showCorrectGuessers).toBe(true);
+
+    unbind();
+    expect(socket.listenerCount('game:round-start')).toBe(0);
+    expect(socket.listenerCount('clock:pong')).toBe(0);
+    expect(socket.listeners('drawing:stroke')).toEqual([otherListener]);
+  });
+
+  it('should keep only acked strokes so undo hits the stroke the server picked', () => {
+    const socket = new EventEmitter();
+    bindSocketToStore(socket as unknown as TypedSocket);
+
+    // Stands in for the server: the second stroke is rate-limited and never gets an id
+    let nextId = 0;
+    const server = {
+      emit: (_event: string, stroke: Uint8Array, ack: (strokeId: number | null) => void) =>
+        ack(stroke[0] === 2 ? null : nextId++),
+    };
+    const [a, b, c] = [1, 2, 3].map((tag) => new Uint8Array([tag, 3, 0, 0, 0, 0, 0, 0]));
+    [a, b, c].forEach((stroke) => sendStroke(server as unknown as TypedSocket, stroke));
+
+    expect(useGameStore.getState().strokes).toEqual([a, c]);
+
+    // The server's canvas is [a, c], so undo hides id 1: the drawer's c, not the dropped b
+    socket.emit('drawing:undo', 1);
+    const state = useGameStore.getState();
+    expect(state.hiddenStrokes).toEqual([1]);
+    expect(state.strokes[1]).toBe(c);
+  });
+});
@@ -0,0 +1,52 @@
+import { StrokeBuffer } from '../../lib/strokeBuffer';
+
+describe('StrokeBuffer', () => {
+  it('should grow past its initial capacity and keep every point', () => {
+    const buffer = new StrokeBuffer(2);
+
+    for (let i = 0; i < 10; i++) {
+      buffer.push(i, i * 2);
+    }
+
+    expect(buffer.length).toBe(10);
+    expect(buffer.x(9)).toBe(9);
+    expect(buffer.y(9)).toBe(18);
+  });
+
+  it('should build a DrawingStroke and reuse its storage after clear', () => {
+    const buffer = new StrokeBuffer();
+    buffer.push(1.5, 2.5);
+    buffer.push(3, 4);
+
+    expect(buffer.toStroke('#FF0000', 5)).toEqual({
+      color: '#FF0000',
+      width: 5,
+      points: [{ x: 1.5, y: 2.5 }, { x: 3, y: 4 }],
+    });
+
+    buffer.clear();
+    expect(buffer.length).toBe(0);
+    expect(buffer.toStroke('#000000', 3).points).toEqual([]);
+  });
+
+  it('should trace only the points added since the previous flush', () => {
+    const buffer = new StrokeBuffer();
+    const ctx = { moveTo: jest.fn(), lineTo: jest.fn() };
+    buffer.push(0, 0);
+    buffer.push(10, 0);
+
+    let drawn = buffer.trace(ctx as unknown as CanvasRenderingContext2D, 0);
+    expect(drawn).toBe(1);
+    expect(ctx.lineTo).toHaveBeenCalledTimes(1);
+
+    buffer.push(20, 0);
+    buffer.push(30, 0);
+    ctx.moveTo.mockClear();
+    ctx.lineTo.mockClear();
+    drawn = buffer.trace(ctx as unknown as CanvasRenderingContext2D, drawn);
+
+    expect(drawn).toBe(3);
+    expect(ctx.moveTo).toHaveBeenCalledWith(10, 0);
+    expect(ctx.lineTo.mock.calls).toEqual([[20, 0], [30, 0]]);
+  });
+});
@@ -0,0 +1,80 @@
+import { LayeredStrokeRenderer } from '../../lib/strokeLayers';
+import { StrokeContext, drawEncodedStroke, encodeStroke } from '../../lib/strokeCodec';
+
+// Records which strokes (by their x offset) reach a context
+const makeContext = () => {
+  const drawn: number[] = [];
+  let startX = 0;
+  const ctx = {
+    canvas: { width: 800, height: 600 },
+    fillRect: jest.fn(),
+    drawImage: jest.fn(),
+    beginPath: jest.fn(),
+    moveTo: jest.fn((x: number) => {
+      startX = x;
+    }),
+    lineTo: jest.fn(),
+    stroke: jest.fn(() => drawn.push(startX)),
+  };
+  return { ctx: ctx as unknown as StrokeContext, drawn };
+};
+
+const strokeAt = (x: number) =>
+  encodeStroke({ color: '#000000', width: 2, points: [{ x, y: 0 }, { x, y: 10 }] });
+
+describe('LayeredStrokeRenderer', () => {
+  it('should only redraw the live window when a recent stroke is undone', () => {
+    const target = makeContext();
+    const layer = makeContext();
+    const renderer = new LayeredStrokeRenderer(target.ctx, layer.ctx, 2);
+    renderer.reset([0, 1, 2, 3, 4].map(strokeAt));
+
+    expect(layer.drawn).toEqual([0, 1, 2]);
+    expect(target.drawn).toEqual([3, 4]);
+
+    target.drawn.length = 0;
+    layer.drawn.length = 0;
+    expect(renderer.setHidden(4, true)).toBe(true);
+    expect(target.drawn).toEqual([3]);
+    expect(layer.drawn).toEqual([]);
+
+    expect(renderer.setHidden(4, true)).toBe(false);
+  });
+
+  it('should rebuild the cached layer when an older stroke is restored', () => {
+    const target = makeContext();
+    const layer = makeContext();
+    const renderer = new LayeredStrokeRenderer(target.ctx, layer.ctx, 2);
+    renderer.reset([0, 1, 2, 3, 4].map(strokeAt), [1]);
+    expect(layer.drawn).toEqual([0, 2]);
+
+    layer.drawn.length = 0;
+    renderer.setHidden(1, false);
+    expect(layer.drawn).toEqual([0, 1, 2]);
+  });
+
+  it('should bake strokes into the layer once the live window overflows', () => {
+    const target = makeContext();
+    const layer = makeContext();
+    const renderer = new LayeredStrokeRenderer(target.ctx, layer.ctx, 2);
+    renderer.reset([]);
+
+    renderer.append([0, 1, 2, 3, 4].map(strokeAt));
+
+    expect(target.drawn).toEqual([0, 1, 2, 3, 4]);
+    expect(layer.drawn).toEqual([0, 1, 2]);
+    expect(renderer.count).toBe(5);
+  });
+});
+
+describe('drawEncodedStroke', () => {
+  it('should draw a one-point stroke as a round dot the width of the brush', () => {
+    const { ctx, drawn } = makeContext();
+    drawEncodedStroke(ctx, encodeStroke({ color: '#ff0000', width: 6, points: [{ x: 40, y: 30 }] }));
+
+    expect(drawn).toEqual([40]);
+    expect(ctx.lineTo).toHaveBeenCalledWith(40, 30);
+    expect(ctx.lineCap).toBe('round');
+    expect(ctx.lineWidth).toBe(6);
+  });
+});
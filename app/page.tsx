@@ -4,11 +4,14 @@ import { useState, useEffect } from 'react';
 import { useRouter } from 'next/navigation';
 import { getSocket } from '@/lib/socket';
 import { useGameStore } from '@/lib/store';
-import { RoomType } from '@/types';
+import { MAX_NAME_LENGTH, RoomType } from '@/types';
 
 export default function Home() {
   const router = useRouter();
-  const { setPlayerId, setPlayerName, setRoom } = useGameStore();
+  const setPlayerId = useGameStore((state) => state.setPlayerId);
+  const setPlayerName = useGameStore((state) => state.setPlayerName);
+  const setRoom = useGameStore((state) => state.setRoom);
+  const setSpectator = useGameStore((state) => state.setSpectator);
 
   const [view, setView] = useState<'home' | 'create' | 'join' | 'public'>('home');
   const [name, setName] = useState('');
@@ -29,6 +32,14 @@ export default function Home() {
 
     socket.on('room:joined', ({ room, playerId }) => {
       setPlayerId(playerId);
+      setSpectator(false);
+      setRoom(room);
+      router.push(`/room/${room.id}`);
+    });
+
+    socket.on('room:spectating', ({ room }) => {
+      setPlayerId(socket.id!);
+      setSpectator(true);
       setRoom(room);
       router.push(`/room/${room.id}`);
     });
@@ -48,10 +59,11 @@ export default function Home() {
     return () => {
       socket.off('room:created');
       socket.off('room:joined');
+      socket.off('room:spectating');
       socket.off('rooms:list');
       socket.off('error');
     };
-  }, [router, setPlayerId, setRoom]);
+  }, [router, setPlayerId, setRoom, setSpectator]);
 
   const handleCreateRoom = (e: React.FormEvent) => {
     e.preventDefault();
@@ -92,6 +104,20 @@ export default function Home() {
     });
   };
 
+  // Spectators need no name: they take no player slot and cannot guess
+  const handleWatchPublicRoom = (roomId: string) => {
+    const socket = getSocket();
+    socket.emit('room:spectate', { roomId });
+  };
+
+  const handleQuickPlay = () => {
+    if (!name.trim()) return;
+
+    setPlayerName(name.trim());
+    const socket = getSocket();
+    socket.emit('room:quick-play', { playerName: name.trim() });
+  };
+
   const fetchPublicRooms = () => {
     const socket = getSocket();
     socket.emit('rooms:fetch');
@@ -116,6 +142,7 @@ export default function Home() {
                 type="text"
                 value={name}
                 onChange={(e) => setName(e.target.value)}
+                maxLength={MAX_NAME_LENGTH}
                 placeholder="Enter your name"
                 className="w-full px-4 py-3 border-2 border-gray-300 dark:border-gray-600 rounded-lg focus:border-primary-500 focus:outline-none bg-white dark:bg-gray-700 text-gray-900 dark:text-gray-100 placeholder-gray-500 dark:placeholder-gray-400"
               />
@@ -127,6 +154,14 @@ export default function Home() {
               </div>
             )}
 
+            <button
+              onClick={handleQuickPlay}
+              disabled={!name.trim()}
+              className="w-full px-6 py-4 bg-yellow-500 text-white rounded-lg hover:bg-yellow-600 disabled:bg-gray-300 disabled:cursor-not-allowed transition-colors font-semibold text-lg"
+            >
+              Quick Play
+            </button>
+
             <button
               onClick={() => setView('create')}
               disabled={!name.trim()}
@@ -179,6 +214,7 @@ export default function Home() {
                   type="text"
                   value={roomName}
                   onChange={(e) => setRoomName(e.target.value)}
+                  maxLength={MAX_NAME_LENGTH}
                   placeholder="Enter room name"
                   className="w-full px-4 py-3 border-2 border-gray-300 dark:border-gray-600 rounded-lg focus:border-primary-500 focus:outline-none bg-white dark:bg-gray-700 text-gray-900 dark:text-gray-100 placeholder-gray-500 dark:placeholder-gray-400"
                   required
@@ -304,12 +340,20 @@ export default function Home() {
                         {room.playerCount} players · {room.gameState}
                       </div>
                     </div>
-                    <button
-                      onClick={() => handleJoinPublicRoom(room.id)}
-                      className="px-4 py-2 bg-primary-500 text-white rounded-lg hover:bg-primary-600 transition-colors font-medium"
-                    >
-                      Join
-                    </button>
+                    <div className="flex gap-2">
+                      <button
+                        onClick={() => handleWatchPublicRoom(room.id)}
+                        className="px-4 py-2 bg-gray-500 text-white rounded-lg hover:bg-gray-600 transition-colors font-medium"
+                      >
+                        Watch
+                      </button>
+                      <button
+                        onClick={() => handleJoinPublicRoom(room.id)}
+                        className="px-4 py-2 bg-primary-500 text-white rounded-lg hover:bg-primary-600 transition-colors font-medium"
+                      >
+                        Join
+                      </button>
+                    </div>
                   </div>
                 ))}
               </div>
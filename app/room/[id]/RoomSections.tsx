@@ -0,0 +1,270 @@
+'use client';
+
+import { TypedSocket } from '@/lib/socket';
+import { useGameStore, selectCurrentDrawer, selectGameState, selectIsDrawer, selectIsHost } from '@/lib/store';
+import Canvas from '@/components/Canvas';
+import Scoreboard from '@/components/Scoreboard';
+import GuessInput from '@/components/GuessInput';
+import WordSelection from '@/components/WordSelection';
+import Timer from '@/components/Timer';
+import CorrectGuessers from '@/components/CorrectGuessers';
+import { encodeStroke } from '@/lib/strokeCodec';
+import { sendStroke } from '@/lib/socketEvents';
+import { reportStrokeSent } from '@/lib/instrumentation';
+import { Word, DrawingStroke } from '@/types';
+
+// In-game sections of the room page, loaded as their own chunk (see page.tsx). Each one
+// selects only the store fields it renders, so a stroke re-renders the canvas, a round
+// start re-renders the timer, and so on.
+
+export function RoomScoreboard() {
+  const players = useGameStore((state) => state.players);
+  const currentDrawer = useGameStore(selectCurrentDrawer);
+  const playerId = useGameStore((state) => state.playerId);
+
+  return <Scoreboard players={players} currentDrawer={currentDrawer} currentPlayerId={playerId} />;
+}
+
+function RoomTimer() {
+  const timeLeft = useGameStore((state) => state.timeLeft);
+  const deadline = useGameStore((state) => state.deadline);
+  const clockOffset = useGameStore((state) => state.clockOffset);
+  const duration = useGameStore((state) => state.room?.roundDuration ?? 60);
+
+  return <Timer seconds={timeLeft} isActive={true} deadline={deadline} clockOffset={clockOffset} duration={duration} />;
+}
+
+export function GameStatus({ onStopRound }: { onStopRound: () => void }) {
+  const isDrawer = useGameStore(selectIsDrawer);
+  const gameState = useGameStore(selectGameState);
+  const currentWord = useGameStore((state) => state.currentWord);
+  const roundEndWord = useGameStore((state) => state.roundEndData?.word);
+  const drawerName = useGameStore((state) =>
+    state.players.find((p) => p.id === state.room?.currentDrawer)?.name
+  );
+
+  return (
+    <div className="bg-white dark:bg-gray-800 rounded-lg shadow-lg dark:shadow-gray-900/50 p-4">
+      <div className="flex items-center justify-between">
+        <div>
+          {isDrawer && gameState === 'drawing' && currentWord && (
+            <div>
+              <span className="text-sm text-gray-600 dark:text-gray-400">Your word:</span>
+              <span className="ml-2 text-2xl font-bold text-primary-500 dark:text-primary-400">{currentWord}</span>
+            </div>
+          )}
+          {!isDrawer && gameState === 'drawing' && (
+            <div className="text-lg font-semibold text-gray-700 dark:text-gray-200">
+              {drawerName} is drawing...
+            </div>
+          )}
+          {gameState === 'word-selection' && (
+            <div className="text-lg font-semibold text-gray-700 dark:text-gray-200">
+              {isDrawer ? 'Choose your word...' : 'Waiting for drawer to choose a word...'}
+            </div>
+          )}
+          {gameState === 'round-end' && roundEndWord !== undefined && (
+            <div className="text-lg font-semibold text-gray-700 dark:text-gray-200">
+              The word was: <span className="text-primary-500 dark:text-primary-400">{roundEndWord}</span>
+            </div>
+          )}
+        </div>
+        <div className="flex items-center gap-3">
+          {gameState === 'drawing' && <RoomTimer />}
+          {isDrawer && gameState === 'drawing' && (
+            <button
+              onClick={onStopRound}
+              className="px-4 py-2 bg-green-500 text-white rounded-lg hover:bg-green-600 transition-colors font-semibold whitespace-nowrap"
+            >
+              Stop Round
+            </button>
+          )}
+        </div>
+      </div>
+    </div>
+  );
+}
+
+export function RoomCanvas({ socket }: { socket: TypedSocket }) {
+  const strokes = useGameStore((state) => state.strokes);
+  const hiddenStrokes = useGameStore((state) => state.hiddenStrokes);
+  const canDraw = useGameStore((state) => selectIsDrawer(state) && selectGameState(state) === 'drawing');
+
+  const handleStroke = (stroke: DrawingStroke) => {
+    // The server does not echo strokes back to the drawer; its ack adds our own copy
+    sendStroke(socket, encodeStroke(stroke));
+    reportStrokeSent(stroke);
+  };
+
+  const handleClear = () => {
+    socket.emit('drawing:clear');
+  };
+
+  // The server picks the stroke and tells everyone (us included) which id to hide or restore
+  const handleUndo = () => {
+    socket.emit('drawing:undo');
+  };
+
+  const handleRedo = () => {
+    socket.emit('drawing:redo');
+  };
+
+  return (
+    <Canvas
+      strokes={strokes}
+      hiddenStrokes={hiddenStrokes}
+      canDraw={canDraw}
+      onStroke={handleStroke}
+      onClear={handleClear}
+      onUndo={handleUndo}
+      onRedo={handleRedo}
+    />
+  );
+}
+
+export function GuessArea({ socket }: { socket: TypedSocket }) {
+  const isDrawer = useGameStore(selectIsDrawer);
+  const canGuess = useGameStore((state) => !selectIsDrawer(state) && selectGameState(state) === 'drawing');
+  const guessResult = useGameStore((state) => state.guessResult);
+  const isSpectator = useGameStore((state) => state.isSpectator);
+
+  if (isDrawer || isSpectator) return null;
+
+  const handleGuess = (guess: string) => {
+    socket.emit('guess:submit', guess);
+  };
+
+  return (
+    <div className="relative">
+      <GuessInput onGuess={handleGuess} disabled={!canGuess} />
+      {guessResult && (
+        <div
+          className={`absolute top-0 right-0 m-4 px-4 py-2 rounded-lg font-semibold ${
+            guessResult.correct
+              ? 'bg-green-500 text-white'
+              : 'bg-red-500 text-white'
+          }`}
+        >
+          {guessResult.correct ? 'Correct!' : 'Wrong guess'}
+        </div>
+      )}
+    </div>
+  );
+}
+
+export function GameEndModal({ onLeave, onPlayAgain }: { onLeave: () => void; onPlayAgain: () => void }) {
+  const gameEndData = useGameStore((state) => state.gameEndData);
+  const players = useGameStore((state) => state.players);
+  const isHost = useGameStore(selectIsHost);
+
+  if (!gameEndData) return null;
+
+  const ranked = [...players].sort(
+    (a, b) => (gameEndData.finalScores[b.id] || 0) - (gameEndData.finalScores[a.id] || 0)
+  );
+
+  return (
+    <div className="fixed inset-0 bg-black bg-opacity-50 flex items-center justify-center z-50 p-4">
+      <div className="bg-white dark:bg-gray-800 rounded-2xl shadow-2xl dark:shadow-gray-900/50 max-w-2xl w-full p-8">
+        <h2 className="text-4xl font-bold text-center text-gray-800 dark:text-gray-100 mb-8">Game Over!</h2>
+
+        <div className="mb-8">
+          <div className="text-center mb-4">
+            <span className="text-2xl font-semibold text-gray-700 dark:text-gray-300">Winner:</span>
+            <span className="ml-2 text-3xl font-bold text-primary-500 dark:text-primary-400">
+              {players.find((p) => p.id === gameEndData.winner)?.name || 'Unknown'}
+            </span>
+          </div>
+
+          <div className="space-y-2">
+            {ranked.map((player, index) => (
+              <div
+                key={player.id}
+                className={`flex items-center justify-between p-4 rounded-lg ${
+                  player.id === gameEndData.winner
+                    ? 'bg-yellow-100 dark:bg-yellow-900 border-2 border-yellow-500'
+                    : 'bg-gray-100 dark:bg-gray-700'
+                }`}
+              >
+                <div className="flex items-center gap-3">
+                  <span className="text-2xl font-bold text-gray-500 dark:text-gray-400">#{index + 1}</span>
+                  <span className="text-xl font-semibold text-gray-800 dark:text-gray-100">{player.name}</span>
+                </div>
+                <span className="text-2xl font-bold text-primary-500 dark:text-primary-400">
+                  {gameEndData.finalScores[player.id] || 0}
+                </span>
+              </div>
+            ))}
+          </div>
+        </div>
+
+        <div className="flex gap-4">
+          <button
+            onClick={onLeave}
+            className="flex-1 px-6 py-3 bg-gray-500 text-white rounded-lg hover:bg-gray-600 transition-colors font-semibold"
+          >
+            Leave Room
+          </button>
+          {isHost && (
+            <button
+              onClick={onPlayAgain}
+              className="flex-1 px-6 py-3 bg-primary-500 text-white rounded-lg hover:bg-primary-600 transition-colors font-semibold"
+            >
+              Play Again
+            </button>
+          )}
+        </div>
+      </div>
+    </div>
+  );
+}
+
+export function WordSelectionModal({ socket }: { socket: TypedSocket }) {
+  const wordChoices = useGameStore((state) => state.wordChoices);
+  const isDrawer = useGameStore(selectIsDrawer);
+  const setWordChoices = useGameStore((state) => state.setWordChoices);
+
+  if (wordChoices.length === 0 || !isDrawer) return null;
+
+  const handleSelectWord = (word: Word) => {
+    socket.emit('game:select-word', word);
+    setWordChoices([]);
+  };
+
+  return <WordSelection words={wordChoices} onSelect={handleSelectWord} />;
+}
+
+export function CorrectGuessersModal({
+  socket,
+  manualMode,
+  onClose,
+}: {
+  socket: TypedSocket;
+  manualMode: boolean;
+  onClose: () => void;
+}) {
+  const showCorrectGuessers = useGameStore((state) => state.showCorrectGuessers);
+  const correctGuessers = useGameStore((state) => state.correctGuessers);
+  const players = useGameStore((state) => state.players);
+  const isDrawer = useGameStore(selectIsDrawer);
+  const currentDrawer = useGameStore(selectCurrentDrawer);
+  const setShowCorrectGuessers = useGameStore((state) => state.setShowCorrectGuessers);
+
+  if (!showCorrectGuessers || !isDrawer) return null;
+
+  const handleStopTimer = (selectedIds: string[]) => {
+    socket.emit('game:stop-timer', selectedIds);
+    setShowCorrectGuessers(false);
+    onClose();
+  };
+
+  return (
+    <CorrectGuessers
+      correctGuessers={correctGuessers}
+      allPlayers={players}
+      onStopTimer={handleStopTimer}
+      manualMode={manualMode}
+      currentDrawerId={currentDrawer || undefined}
+    />
+  );
+}
@@ -0,0 +1,40 @@
+'use client';
+
+import { useGameStore, selectIsHost } from '@/lib/store';
+
+// Part of the room page's first bundle, like the name prompt: it must not wait for the
+// game sections chunk
+export function WaitingLobby({ onStartGame }: { onStartGame: () => void }) {
+  const players = useGameStore((state) => state.players);
+  const isHost = useGameStore(selectIsHost);
+
+  return (
+    <div className="bg-white dark:bg-gray-800 rounded-lg shadow-lg dark:shadow-gray-900/50 p-8 text-center">
+      <h2 className="text-2xl font-bold text-gray-800 dark:text-gray-100 mb-4">Waiting for players...</h2>
+      <p className="text-gray-600 dark:text-gray-300 mb-6">
+        {players.length} player{players.length !== 1 ? 's' : ''} in room
+      </p>
+      <div className="flex flex-wrap gap-2 justify-center mb-6">
+        {players.map((player) => (
+          <div
+            key={player.id}
+            className="px-4 py-2 bg-primary-100 dark:bg-primary-900 text-primary-800 dark:text-primary-200 rounded-full font-medium"
+          >
+            {player.name} {player.isHost && '(Host)'}
+          </div>
+        ))}
+      </div>
+      {isHost && players.length >= 2 && (
+        <button
+          onClick={onStartGame}
+          className="px-8 py-4 bg-primary-500 text-white rounded-lg hover:bg-primary-600 transition-colors font-semibold text-lg"
+        >
+          Start Game
+        </button>
+      )}
+      {players.length < 2 && (
+        <p className="text-gray-500 dark:text-gray-400">Need at least 2 players to start</p>
+      )}
+    </div>
+  );
+}
@@ -1,183 +1,98 @@
 'use client';
 
-import { useEffect, useState, useRef } from 'react';
+import { useEffect, useRef, useState } from 'react';
+import dynamic from 'next/dynamic';
 import { useParams, useRouter } from 'next/navigation';
-import { getSocket, disconnectSocket } from '@/lib/socket';
-import { useGameStore } from '@/lib/store';
-import Canvas from '@/components/Canvas';
-import Scoreboard from '@/components/Scoreboard';
-import GuessInput from '@/components/GuessInput';
-import WordSelection from '@/components/WordSelection';
-import Timer from '@/components/Timer';
-import CorrectGuessers from '@/components/CorrectGuessers';
-import { Word, DrawingStroke, GuessResult } from '@/types';
+import { loadRoomConnection, withSocket } from '@/lib/roomConnection';
+import type { TypedSocket } from '@/lib/socket';
+import { useGameStore, selectGameState } from '@/lib/store';
+import { useCommitCounter } from '@/lib/instrumentation';
+import { MAX_NAME_LENGTH } from '@/types';
+import { WaitingLobby } from './WaitingLobby';
+
+// The name prompt, loading state and lobby render from this page's own bundle. The game
+// sections (canvas, scoreboard, modals) are one separate chunk, fetched on mount so it is
+// usually in place by the time a game starts.
+const loadSections = () => import('./RoomSections');
+const RoomScoreboard = dynamic(() => loadSections().then((m) => m.RoomScoreboard), { ssr: false });
+const GameStatus = dynamic(() => loadSections().then((m) => m.GameStatus), { ssr: false });
+const RoomCanvas = dynamic(() => loadSections().then((m) => m.RoomCanvas), { ssr: false });
+const GuessArea = dynamic(() => loadSections().then((m) => m.GuessArea), { ssr: false });
+const GameEndModal = dynamic(() => loadSections().then((m) => m.GameEndModal), { ssr: false });
+const WordSelectionModal = dynamic(() => loadSections().then((m) => m.WordSelectionModal), { ssr: false });
+const CorrectGuessersModal = dynamic(() => loadSections().then((m) => m.CorrectGuessersModal), { ssr: false });
 
 export default function RoomPage() {
   const params = useParams();
   const router = useRouter();
   const roomId = params.id as string;
+  useCommitCounter('RoomPage');
+
+  // Only the fields the page shell renders; everything else lives in the sections
+  const hasRoom = useGameStore((state) => state.room !== null);
+  const roomName = useGameStore((state) => state.room?.name);
+  const roomType = useGameStore((state) => state.room?.type);
+  const isSpectator = useGameStore((state) => state.isSpectator);
+  const gameState = useGameStore(selectGameState);
+  const setPlayerName = useGameStore((state) => state.setPlayerName);
+  const setShowCorrectGuessers = useGameStore((state) => state.setShowCorrectGuessers);
+  const reset = useGameStore((state) => state.reset);
 
-  const { room, playerId, playerName, setRoom, setPlayerName, reset } = useGameStore();
-
-  const [wordChoices, setWordChoices] = useState<Word[]>([]);
-  const [currentWord, setCurrentWord] = useState<string>('');
-  const [timer, setTimer] = useState(60);
-  const [correctGuessers, setCorrectGuessers] = useState<Array<{ playerId: string; playerName: string }>>([]);
-  const [showCorrectGuessers, setShowCorrectGuessers] = useState(false);
-  const [guessResult, setGuessResult] = useState<GuessResult | null>(null);
-  const [roundEndData, setRoundEndData] = useState<{ word: string; scores: Record<string, number> } | null>(null);
-  const [gameEndData, setGameEndData] = useState<{ finalScores: Record<string, number>; winner: string } | null>(null);
   const [nameInput, setNameInput] = useState('');
-  const [showNamePrompt, setShowNamePrompt] = useState(false);
+  // Decided on the first render (the server renders it too) so a direct link shows the
+  // prompt straight away instead of a loading spinner
+  const [showNamePrompt, setShowNamePrompt] = useState(() => {
+    const { room, playerName } = useGameStore.getState();
+    return !playerName && !room;
+  });
   const [manualStopMode, setManualStopMode] = useState(false);
-
-  const socketRef = useRef(getSocket());
-
-  const isDrawer = room?.currentDrawer === playerId;
-  const canGuess = !isDrawer && room?.gameState === 'drawing';
-
+  const [socket, setSocket] = useState<TypedSocket | null>(null);
+  // The server-rendered prompt stays disabled until hydration: text typed before then
+  // would be dropped and an early submit would reload the page
+  const [hydrated, setHydrated] = useState(false);
+  const nameInputRef = useRef<HTMLInputElement>(null);
+
+  // Load and connect the socket and prefetch the game sections in parallel; listeners are
+  // bound once for the lifetime of the page
   useEffect(() => {
-    const socket = socketRef.current;
-
-    // Show name prompt if accessing room directly without playerName
-    if (!playerName && !room) {
-      setShowNamePrompt(true);
-      // Don't return early! We still need to set up socket listeners below
-    } else if (playerId && playerName && !room) {
-      // Rejoin room if we have the state (but already have playerName)
-      socket.emit('room:join', { roomId, playerName });
-    }
-
-    socket.on('room:updated', (updatedRoom) => {
-      setRoom(updatedRoom);
-    });
-
-    socket.on('room:joined', ({ room: joinedRoom }) => {
-      setRoom(joinedRoom);
-    });
-
-    socket.on('game:started', (startedRoom) => {
-      setRoom(startedRoom);
-      setRoundEndData(null);
-      setGameEndData(null);
-    });
-
-    socket.on('game:word-selection', ({ wordChoices: choices }) => {
-      setWordChoices(choices);
-    });
-
-    socket.on('game:round-start', ({ word, timer: timerValue }) => {
-      if (word) {
-        setCurrentWord(word);
-      } else {
-        setCurrentWord('');
-      }
-      setTimer(timerValue);
-      setCorrectGuessers([]);
-      setShowCorrectGuessers(false);
-      setRoundEndData(null);
-    });
-
-    socket.on('game:timer-update', (seconds) => {
-      setTimer(seconds);
-    });
-
-    socket.on('game:timer-stopped', () => {
-      setShowCorrectGuessers(false);
-    });
-
-    socket.on('drawing:stroke', (stroke) => {
-      if (room) {
-        const updatedRoom = {
-          ...room,
-          canvas: [...room.canvas, stroke]  // Create new array to trigger re-render
-        };
-        setRoom(updatedRoom);
+    let cancelled = false;
+    let unbind: (() => void) | null = null;
+
+    setHydrated(true);
+    loadSections();
+    loadRoomConnection().then(({ getSocket, bindSocketToStore }) => {
+      if (cancelled) return;
+
+      const connection = getSocket();
+      unbind = bindSocketToStore(connection);
+      if (!connection.connected) {
+        connection.connect();
       }
+      setSocket(connection);
     });
 
-    socket.on('drawing:clear', () => {
-      if (room) {
-        const updatedRoom = { ...room };
-        updatedRoom.canvas = [];
-        setRoom(updatedRoom);
-      }
-    });
-
-    socket.on('guess:result', (result) => {
-      setGuessResult(result);
-      setTimeout(() => setGuessResult(null), 3000);
-    });
-
-    socket.on('guess:correct', ({ playerId: guesserId, playerName: guesserName }) => {
-      setCorrectGuessers((prev) => {
-        if (prev.find((g) => g.playerId === guesserId)) return prev;
-        return [...prev, { playerId: guesserId, playerName: guesserName }];
-      });
-      setShowCorrectGuessers(true);
-    });
-
-    socket.on('game:round-end', (data) => {
-      setRoundEndData(data);
-      setCurrentWord('');
-      setWordChoices([]);
-    });
-
-    socket.on('game:end', (data) => {
-      setGameEndData(data);
-    });
-
-    socket.on('error', (message) => {
-      alert(message);
-    });
-
-    if (!socket.connected) {
-      socket.connect();
-    }
-
     return () => {
-      socket.off('room:updated');
-      socket.off('room:joined');
-      socket.off('game:started');
-      socket.off('game:word-selection');
-      socket.off('game:round-start');
-      socket.off('game:timer-update');
-      socket.off('game:timer-stopped');
-      socket.off('drawing:stroke');
-      socket.off('drawing:clear');
-      socket.off('guess:result');
-      socket.off('guess:correct');
-      socket.off('game:round-end');
-      socket.off('game:end');
-      socket.off('error');
+      cancelled = true;
+      unbind?.();
     };
-  }, [roomId, playerId, playerName, room, setRoom]);
+  }, []);
 
-  const handleStartGame = () => {
-    socketRef.current.emit('game:start');
-  };
-
-  const handleSelectWord = (word: Word) => {
-    socketRef.current.emit('game:select-word', word);
-    setWordChoices([]);
-  };
-
-  const handleStroke = (stroke: DrawingStroke) => {
-    socketRef.current.emit('drawing:stroke', stroke);
-  };
+  // Stands in for autoFocus, which cannot focus the input while it is still disabled
+  useEffect(() => {
+    if (hydrated) nameInputRef.current?.focus();
+  }, [hydrated]);
 
-  const handleClear = () => {
-    socketRef.current.emit('drawing:clear');
-  };
+  useEffect(() => {
+    const { room, playerId, playerName } = useGameStore.getState();
 
-  const handleGuess = (guess: string) => {
-    socketRef.current.emit('guess:submit', guess);
-  };
+    // Rejoin room if we have the state (but already have playerName)
+    if (playerId && playerName && !room) {
+      withSocket((connection) => connection.emit('room:join', { roomId, playerName }));
+    }
+  }, [roomId]);
 
-  const handleStopTimer = (selectedIds: string[]) => {
-    socketRef.current.emit('game:stop-timer', selectedIds);
-    setShowCorrectGuessers(false);
-    setManualStopMode(false);
+  const handleStartGame = () => {
+    withSocket((connection) => connection.emit('game:start'));
   };
 
   const handleManualStopRound = () => {
@@ -186,9 +101,9 @@ export default function RoomPage() {
   };
 
   const handleLeaveRoom = () => {
-    socketRef.current.emit('room:leave');
+    withSocket((connection) => connection.emit('room:leave'));
+    loadRoomConnection().then(({ disconnectSocket }) => disconnectSocket());
     reset();
-    disconnectSocket();
     router.push('/');
   };
 
@@ -199,7 +114,7 @@ export default function RoomPage() {
     const trimmedName = nameInput.trim();
     setPlayerName(trimmedName);
     setShowNamePrompt(false);
-    socketRef.current.emit('room:join', { roomId, playerName: trimmedName });
+    withSocket((connection) => connection.emit('room:join', { roomId, playerName: trimmedName }));
   };
 
   const copyRoomLink = () => {
@@ -224,13 +139,16 @@ export default function RoomPage() {
               type="text"
               value={nameInput}
               onChange={(e) => setNameInput(e.target.value)}
+              maxLength={MAX_NAME_LENGTH}
               placeholder="Enter your name"
               className="w-full px-4 py-3 border-2 border-gray-300 dark:border-gray-600 rounded-lg focus:border-primary-500 focus:outline-none text-center text-lg bg-white dark:bg-gray-700 text-gray-900 dark:text-gray-100 placeholder-gray-500 dark:placeholder-gray-400"
-              autoFocus
+              ref={nameInputRef}
               required
+              disabled={!hydrated}
             />
             <button
               type="submit"
+              disabled={!hydrated}
               className="w-full px-6 py-3 bg-primary-500 text-white rounded-lg hover:bg-primary-600 transition-colors font-semibold text-lg"
             >
               Join Room
@@ -241,7 +159,7 @@ export default function RoomPage() {
     );
   }
 
-  if (!room) {
+  if (!hasRoom || !socket) {
     return (
       <div className="min-h-screen bg-gray-50 dark:bg-gray-900 flex items-center justify-center">
         <div className="text-center">
@@ -259,13 +177,14 @@ export default function RoomPage() {
         <div className="bg-white dark:bg-gray-800 rounded-lg shadow-lg dark:shadow-gray-900/50 p-4 mb-4">
           <div className="flex items-center justify-between flex-wrap gap-4">
             <div>
-              <h1 className="text-3xl font-bold text-gray-800 dark:text-gray-100">{room.name}</h1>
+              <h1 className="text-3xl font-bold text-gray-800 dark:text-gray-100">{roomName}</h1>
               <p className="text-sm text-gray-600 dark:text-gray-400">
-                Room ID: {roomId} · {room.type === 'private' ? 'Private' : 'Public'} Room
+                Room ID: {roomId} · {roomType === 'private' ? 'Private' : 'Public'} Room
+                {isSpectator && ' · Spectating'}
               </p>
             </div>
             <div className="flex items-center gap-2">
-              {room.type === 'private' && (
+              {roomType === 'private' && (
                 <button
                   onClick={copyRoomLink}
                   className="px-4 py-2 bg-purple-500 text-white rounded-lg hover:bg-purple-600 transition-colors font-medium"
@@ -284,191 +203,35 @@ export default function RoomPage() {
         </div>
 
         {/* Waiting Lobby */}
-        {room.gameState === 'waiting' && (
-          <div className="bg-white dark:bg-gray-800 rounded-lg shadow-lg dark:shadow-gray-900/50 p-8 text-center">
-            <h2 className="text-2xl font-bold text-gray-800 dark:text-gray-100 mb-4">Waiting for players...</h2>
-            <p className="text-gray-600 dark:text-gray-300 mb-6">
-              {room.players.length} player{room.players.length !== 1 ? 's' : ''} in room
-            </p>
-            <div className="flex flex-wrap gap-2 justify-center mb-6">
-              {room.players.map((player) => (
-                <div
-                  key={player.id}
-                  className="px-4 py-2 bg-primary-100 dark:bg-primary-900 text-primary-800 dark:text-primary-200 rounded-full font-medium"
-                >
-                  {player.name} {player.isHost && '(Host)'}
-                </div>
-              ))}
-            </div>
-            {room.hostId === playerId && room.players.length >= 2 && (
-              <button
-                onClick={handleStartGame}
-                className="px-8 py-4 bg-primary-500 text-white rounded-lg hover:bg-primary-600 transition-colors font-semibold text-lg"
-              >
-                Start Game
-              </button>
-            )}
-            {room.players.length < 2 && (
-              <p className="text-gray-500 dark:text-gray-400">Need at least 2 players to start</p>
-            )}
-          </div>
-        )}
+        {gameState === 'waiting' && <WaitingLobby onStartGame={handleStartGame} />}
 
         {/* Game in Progress */}
-        {room.gameState !== 'waiting' && room.gameState !== 'game-end' && (
+        {gameState !== 'waiting' && gameState !== 'game-end' && (
           <div className="grid grid-cols-1 lg:grid-cols-3 gap-4">
             {/* Left Sidebar */}
             <div className="space-y-4">
-              <Scoreboard
-                players={room.players}
-                currentDrawer={room.currentDrawer}
-                currentPlayerId={playerId}
-              />
+              <RoomScoreboard />
             </div>
 
             {/* Main Canvas Area */}
             <div className="lg:col-span-2 space-y-4">
-              {/* Game Status */}
-              <div className="bg-white dark:bg-gray-800 rounded-lg shadow-lg dark:shadow-gray-900/50 p-4">
-                <div className="flex items-center justify-between">
-                  <div>
-                    {isDrawer && room.gameState === 'drawing' && currentWord && (
-                      <div>
-                        <span className="text-sm text-gray-600 dark:text-gray-400">Your word:</span>
-                        <span className="ml-2 text-2xl font-bold text-primary-500 dark:text-primary-400">{currentWord}</span>
-                      </div>
-                    )}
-                    {!isDrawer && room.gameState === 'drawing' && (
-                      <div className="text-lg font-semibold text-gray-700 dark:text-gray-200">
-                        {room.players.find((p) => p.id === room.currentDrawer)?.name} is drawing...
-                      </div>
-                    )}
-                    {room.gameState === 'word-selection' && (
-                      <div className="text-lg font-semibold text-gray-700 dark:text-gray-200">
-                        {isDrawer ? 'Choose your word...' : 'Waiting for drawer to choose a word...'}
-                      </div>
-                    )}
-                    {room.gameState === 'round-end' && roundEndData && (
-                      <div className="text-lg font-semibold text-gray-700 dark:text-gray-200">
-                        The word was: <span className="text-primary-500 dark:text-primary-400">{roundEndData.word}</span>
-                      </div>
-                    )}
-                  </div>
-                  <div className="flex items-center gap-3">
-                    {room.gameState === 'drawing' && <Timer seconds={timer} isActive={true} />}
-                    {isDrawer && room.gameState === 'drawing' && (
-                      <button
-                        onClick={handleManualStopRound}
-                        className="px-4 py-2 bg-green-500 text-white rounded-lg hover:bg-green-600 transition-colors font-semibold whitespace-nowrap"
-                      >
-                        Stop Round
-                      </button>
-                    )}
-                  </div>
-                </div>
-              </div>
-
-              {/* Canvas */}
-              <Canvas
-                strokes={room.canvas}
-                canDraw={isDrawer && room.gameState === 'drawing'}
-                onStroke={handleStroke}
-                onClear={handleClear}
-              />
-
-              {/* Guess Input */}
-              {!isDrawer && (
-                <div className="relative">
-                  <GuessInput onGuess={handleGuess} disabled={!canGuess} />
-                  {guessResult && (
-                    <div
-                      className={`absolute top-0 right-0 m-4 px-4 py-2 rounded-lg font-semibold ${
-                        guessResult.correct
-                          ? 'bg-green-500 text-white'
-                          : 'bg-red-500 text-white'
-                      }`}
-                    >
-                      {guessResult.correct ? 'Correct!' : 'Wrong guess'}
-                    </div>
-                  )}
-                </div>
-              )}
+              <GameStatus onStopRound={handleManualStopRound} />
+              <RoomCanvas socket={socket} />
+              <GuessArea socket={socket} />
             </div>
           </div>
         )}
 
         {/* Game End */}
-        {gameEndData && (
-          <div className="fixed inset-0 bg-black bg-opacity-50 flex items-center justify-center z-50 p-4">
-            <div className="bg-white dark:bg-gray-800 rounded-2xl shadow-2xl dark:shadow-gray-900/50 max-w-2xl w-full p-8">
-              <h2 className="text-4xl font-bold text-center text-gray-800 dark:text-gray-100 mb-8">Game Over!</h2>
-
-              <div className="mb-8">
-                <div className="text-center mb-4">
-                  <span className="text-2xl font-semibold text-gray-700 dark:text-gray-300">Winner:</span>
-                  <span className="ml-2 text-3xl font-bold text-primary-500 dark:text-primary-400">
-                    {room.players.find((p) => p.id === gameEndData.winner)?.name || 'Unknown'}
-                  </span>
-                </div>
-
-                <div className="space-y-2">
-                  {room.players
-                    .sort((a, b) => (gameEndData.finalScores[b.id] || 0) - (gameEndData.finalScores[a.id] || 0))
-                    .map((player, index) => (
-                      <div
-                        key={player.id}
-                        className={`flex items-center justify-between p-4 rounded-lg ${
-                          player.id === gameEndData.winner
-                            ? 'bg-yellow-100 dark:bg-yellow-900 border-2 border-yellow-500'
-                            : 'bg-gray-100 dark:bg-gray-700'
-                        }`}
-                      >
-                        <div className="flex items-center gap-3">
-                          <span className="text-2xl font-bold text-gray-500 dark:text-gray-400">#{index + 1}</span>
-                          <span className="text-xl font-semibold text-gray-800 dark:text-gray-100">{player.name}</span>
-                        </div>
-                        <span className="text-2xl font-bold text-primary-500 dark:text-primary-400">
-                          {gameEndData.finalScores[player.id] || 0}
-                        </span>
-                      </div>
-                    ))}
-                </div>
-              </div>
-
-              <div className="flex gap-4">
-                <button
-                  onClick={handleLeaveRoom}
-                  className="flex-1 px-6 py-3 bg-gray-500 text-white rounded-lg hover:bg-gray-600 transition-colors font-semibold"
-                >
-                  Leave Room
-                </button>
-                {room.hostId === playerId && (
-                  <button
-                    onClick={handleStartGame}
-                    className="flex-1 px-6 py-3 bg-primary-500 text-white rounded-lg hover:bg-primary-600 transition-colors font-semibold"
-                  >
-                    Play Again
-                  </button>
-                )}
-              </div>
-            </div>
-          </div>
-        )}
+        <GameEndModal onLeave={handleLeaveRoom} onPlayAgain={handleStartGame} />
 
         {/* Modals */}
-        {wordChoices.length > 0 && isDrawer && (
-          <WordSelection words={wordChoices} onSelect={handleSelectWord} />
-        )}
-
-        {showCorrectGuessers && isDrawer && (
-          <CorrectGuessers
-            correctGuessers={correctGuessers}
-            allPlayers={room.players}
-            onStopTimer={handleStopTimer}
-            manualMode={manualStopMode}
-            currentDrawerId={room.currentDrawer || undefined}
-          />
-        )}
+        <WordSelectionModal socket={socket} />
+        <CorrectGuessersModal
+          socket={socket}
+          manualMode={manualStopMode}
+          onClose={() => setManualStopMode(false)}
+        />
       </div>
     </div>
   );
@@ -0,0 +1,47 @@
+import { existsSync, readFileSync, writeFileSync } from 'fs';
+import { BenchResult } from './harness';
+
+// Median ns/op per benchmark, keyed "<suite> / <name>"
+export type Baselines = Record<string, number>;
+
+export interface Comparison {
+  key: string;
+  nsPerOp: number;
+  baseline: number | null;
+  // nsPerOp / baseline - 1, e.g. 0.3 for 30% slower
+  change: number | null;
+  regressed: boolean;
+}
+
+export const baselineKey = (suite: string, name: string): string => `${suite} / ${name}`;
+
+export function loadBaselines(path: string): Baselines {
+  return existsSync(path) ? JSON.parse(readFileSync(path, 'utf8')) : {};
+}
+
+// Merges into what is already saved so a filtered run only replaces its own entries
+export function saveBaselines(path: string, suite: string, results: BenchResult[]): void {
+  const baselines = loadBaselines(path);
+  results.forEach(({ name, nsPerOp }) => {
+    baselines[baselineKey(suite, name)] = Math.round(nsPerOp * 10) / 10;
+  });
+
+  const sorted = Object.fromEntries(Object.entries(baselines).sort(([a], [b]) => a.localeCompare(b)));
+  writeFileSync(path, JSON.stringify(sorted, null, 2) + '\n');
+}
+
+// A benchmark regresses when its median is more than `threshold` (0.25 = 25%) above its
+// baseline; ones without a baseline are reported but never fail the gate
+export function compareToBaselines(
+  baselines: Baselines,
+  suite: string,
+  results: BenchResult[],
+  threshold: number
+): Comparison[] {
+  return results.map(({ name, nsPerOp }) => {
+    const key = baselineKey(suite, name);
+    const baseline = baselines[key] ?? null;
+    const change = baseline ? nsPerOp / baseline - 1 : null;
+    return { key, nsPerOp, baseline, change, regressed: change !== null && change > threshold };
+  });
+}
@@ -0,0 +1,42 @@
+import { RoomManager } from '../server/RoomManager';
+import { encodeStroke } from '../lib/strokeCodec';
+
+export interface Dataset {
+  manager: RoomManager;
+  roomIds: string[];
+  hostIds: string[];
+  guestIds: string[];
+}
+
+// `rooms` two-player rooms, alternating public and private; with `playing`, every room has
+// started its game and picked a word so guesses have something to match against
+export function createDataset(rooms: number, { playing = false }: { playing?: boolean } = {}): Dataset {
+  const manager = new RoomManager();
+  const roomIds: string[] = [];
+  const hostIds: string[] = [];
+  const guestIds: string[] = [];
+
+  for (let i = 0; i < rooms; i++) {
+    const room = manager.createRoom(`Room ${i}`, i % 2 === 0 ? 'public' : 'private', `host-${i}`, `Host ${i}`);
+    manager.joinRoom(room.id, `guest-${i}`, `Guest ${i}`);
+    if (playing) {
+      manager.startGame(room.id);
+      manager.selectWord(room.id, room.wordChoices[0]);
+    }
+
+    roomIds.push(room.id);
+    hostIds.push(`host-${i}`);
+    guestIds.push(`guest-${i}`);
+  }
+
+  return { manager, roomIds, hostIds, guestIds };
+}
+
+// A stroke in the wire format; benchmarks share one buffer across calls
+export function createStroke(points = 50): Uint8Array {
+  return encodeStroke({
+    points: Array.from({ length: points }, (_, i) => ({ x: i * 4, y: 100 + (i % 10) })),
+    color: '#000000',
+    width: 4
+  });
+}
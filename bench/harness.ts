@@ -0,0 +1,78 @@
+export interface BenchResult {
+  name: string;
+  iterations: number;
+  samples: number;
+  // Median ns/op across samples: what baselines store and the regression gate compares
+  nsPerOp: number;
+  minNsPerOp: number;
+  // Relative spread of the samples (median absolute deviation / median), in percent
+  spread: number;
+}
+
+export interface BenchOptions {
+  // Calls per sample
+  iterations?: number;
+  samples?: number;
+  warmup?: number;
+  // Runs untimed before the warmup and before every sample, e.g. to restore state the
+  // measured calls consume
+  setup?: () => void;
+}
+
+// Keeps results reachable so the JIT cannot drop the measured call as dead code
+let sink: unknown;
+
+const median = (values: number[]): number => {
+  const sorted = [...values].sort((a, b) => a - b);
+  const middle = sorted.length >> 1;
+  return sorted.length % 2 ? sorted[middle] : (sorted[middle - 1] + sorted[middle]) / 2;
+};
+
+// Time `fn` in several samples after a warmup that lets the JIT settle. `fn` gets the call
+// index within the sample so it can spread over a dataset. Per-op figures include the loop
+// itself, so compare against a baseline measured the same way.
+export function measure(name: string, fn: (i: number) => unknown, options: BenchOptions = {}): BenchResult {
+  const iterations = options.iterations ?? 100_000;
+  const samples = options.samples ?? 10;
+  const warmup = options.warmup ?? Math.min(iterations, 10_000);
+
+  options.setup?.();
+  for (let i = 0; i < warmup; i++) {
+    sink = fn(i);
+  }
+
+  const timings: number[] = [];
+  for (let s = 0; s < samples; s++) {
+    options.setup?.();
+    const start = process.hrtime.bigint();
+    for (let i = 0; i < iterations; i++) {
+      sink = fn(i);
+    }
+    timings.push(Number(process.hrtime.bigint() - start) / iterations);
+  }
+
+  const nsPerOp = median(timings);
+  const deviation = median(timings.map(timing => Math.abs(timing - nsPerOp)));
+
+  return {
+    name,
+    iterations,
+    samples,
+    nsPerOp,
+    minNsPerOp: Math.min(...timings),
+    spread: nsPerOp > 0 ? (deviation / nsPerOp) * 100 : 0
+  };
+}
+
+const formatNs = (ns: number): string =>
+  ns >= 1e6 ? `${(ns / 1e6).toFixed(2)} ms` : ns >= 1e3 ? `${(ns / 1e3).toFixed(2)} µs` : `${ns.toFixed(1)} ns`;
+
+export function report(suite: string, results: BenchResult[]): void {
+  console.log(`\n${suite}`);
+  results.forEach(({ name, nsPerOp, minNsPerOp, spread, samples, iterations }) => {
+    console.log(
+      `  ${name.padEnd(44)} ${formatNs(nsPerOp).padStart(11)}/op  min ${formatNs(minNsPerOp).padStart(11)}` +
+      `  ±${spread.toFixed(1)}%  (${samples} × ${iterations})`
+    );
+  });
+}
@@ -0,0 +1,64 @@
+import { join } from 'path';
+import { BenchResult, report } from './harness';
+import { compareToBaselines, loadBaselines, saveBaselines } from './baselines';
+import roomManagerBench from './roomManager.bench';
+import validationBench from './validation.bench';
+import wordsBench from './words.bench';
+
+// npm run bench [-- --filter=<text>]    measure and print
+// npm run bench:save                    ...and record the results as the new baselines
+// npm run bench:check                   ...and exit 1 if any benchmark regressed
+//
+// Baselines are machine specific: save them and check against them on the same machine
+// (or the same CI runner type), never across machines.
+const BASELINES_PATH = join(__dirname, 'baselines.json');
+
+const suites: Array<[string, () => BenchResult[]]> = [
+  ['RoomManager', roomManagerBench],
+  ['Words', wordsBench],
+  ['Event validation', validationBench]
+];
+
+const flag = (name: string): string | undefined => {
+  const arg = process.argv.find(value => value === `--${name}` || value.startsWith(`--${name}=`));
+  return arg === undefined ? undefined : arg.split('=')[1] ?? '';
+};
+
+const filter = flag('filter');
+const save = flag('save') !== undefined;
+const check = flag('check') !== undefined;
+const threshold = Number(flag('threshold') ?? process.env.BENCH_THRESHOLD ?? 0.25);
+
+const baselines = loadBaselines(BASELINES_PATH);
+let regressions = 0;
+
+for (const [suite, run] of suites) {
+  if (filter && !suite.toLowerCase().includes(filter.toLowerCase())) continue;
+
+  const results = run();
+  report(suite, results);
+
+  if (save) {
+    saveBaselines(BASELINES_PATH, suite, results);
+  }
+  if (check) {
+    compareToBaselines(baselines, suite, results, threshold).forEach(({ key, baseline, change, regressed }) => {
+      if (baseline === null) {
+        console.log(`  no baseline: ${key}`);
+      } else if (regressed) {
+        regressions++;
+        console.log(`  REGRESSION: ${key} is ${(change! * 100).toFixed(0)}% slower than its ${baseline} ns/op baseline`);
+      }
+    });
+  }
+}
+
+if (save) {
+  console.log(`\nBaselines saved to ${BASELINES_PATH}`);
+}
+if (check) {
+  console.log(regressions > 0
+    ? `\n${regressions} benchmark(s) regressed more than ${threshold * 100}%`
+    : `\nNo benchmark regressed more than ${threshold * 100}%`);
+  process.exitCode = regressions > 0 ? 1 : 0;
+}
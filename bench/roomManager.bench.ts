@@ -0,0 +1,84 @@
+import { createDataset, createStroke } from './datasets';
+import { measure, BenchResult } from './harness';
+
+// Sizes the hot paths are judged at; each operation gets a fresh dataset per size
+export const ROOM_COUNTS = [10_000, 100_000];
+
+const stroke = createStroke();
+
+export default function roomManagerBench(): BenchResult[] {
+  const results: BenchResult[] = [];
+
+  for (const rooms of ROOM_COUNTS) {
+    const at = `@${rooms / 1000}k rooms`;
+
+    {
+      // The rooms a sample created are deleted untimed before the next, so every sample runs
+      // at the labelled size instead of growing the dataset by warmup + samples × iterations
+      const { manager } = createDataset(rooms);
+      const iterations = 5_000;
+      const hostIds = Array.from({ length: iterations }, (_, i) => `bench-host-${i}`);
+      results.push(measure(`createRoom ${at}`, i => manager.createRoom('Bench Room', 'public', hostIds[i], 'Bench Host'), {
+        iterations,
+        setup: () => {
+          manager.leaveRooms(hostIds);
+        }
+      }));
+    }
+
+    {
+      // Spread over every room so none fills up: at most a few joins land in each
+      const { manager, roomIds } = createDataset(rooms);
+      let next = 0;
+      results.push(measure(`joinRoom ${at}`, () => {
+        const n = next++;
+        return manager.joinRoom(roomIds[(n * 7919) % rooms], `bench-player-${n}`, 'Bench Player');
+      }, { iterations: 5_000 }));
+    }
+
+    {
+      // Guests leave and are let back in untimed before each sample; hosts stay, so the
+      // rooms themselves are never deleted
+      const { manager, roomIds, guestIds } = createDataset(rooms);
+      const iterations = 5_000;
+      results.push(measure(`leaveRoom ${at}`, i => manager.leaveRoom(guestIds[i]), {
+        iterations,
+        setup: () => {
+          for (let i = 0; i < iterations; i++) {
+            if (!manager.getRoomByPlayerId(guestIds[i])) {
+              manager.joinRoom(roomIds[i], guestIds[i], 'Guest');
+            }
+          }
+        }
+      }));
+    }
+
+    {
+      const { manager, roomIds } = createDataset(rooms, { playing: true });
+      results.push(measure(`addStroke ${at}`, i => manager.addStroke(roomIds[i % rooms], stroke), {
+        iterations: 10_000
+      }));
+    }
+
+    {
+      const { manager, roomIds, guestIds } = createDataset(rooms, { playing: true });
+      results.push(measure(`submitGuess (wrong) ${at}`, i => {
+        const index = i % rooms;
+        return manager.submitGuess(roomIds[index], guestIds[index], 'definitely not it');
+      }, { iterations: 10_000 }));
+    }
+
+    {
+      // Scans every room, so fewer calls as the room count grows
+      const { manager } = createDataset(rooms);
+      const iterations = Math.ceil(1_000_000 / rooms);
+      results.push(measure(`getPublicRooms ${at}`, () => manager.getPublicRooms(), {
+        iterations,
+        samples: 5,
+        warmup: iterations
+      }));
+    }
+  }
+
+  return results;
+}
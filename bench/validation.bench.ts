@@ -0,0 +1,26 @@
+import { EventValidator } from '../server/validation';
+import { createStroke } from './datasets';
+import { measure, BenchResult } from './harness';
+
+const stroke = createStroke();
+
+const packets: Array<[string, unknown[]]> = [
+  ['room:create', ['room:create', { roomName: 'Friday night', roomType: 'public', playerName: 'Alice' }]],
+  ['game:select-word', ['game:select-word', { text: 'elephant', difficulty: 'hard', points: 30 }]],
+  ['game:stop-timer', ['game:stop-timer', ['socket-a', 'socket-b', 'socket-c', 'socket-d']]],
+  ['drawing:stroke', ['drawing:stroke', stroke]],
+  ['guess:submit', ['guess:submit', 'elephant']],
+  ['rejected: room:create', ['room:create', { roomName: 'Friday night', roomType: 'secret', playerName: 'Alice' }]],
+  ['rejected: unknown event', ['admin:shutdown', {}]]
+];
+
+export default function validationBench(): BenchResult[] {
+  const validator = new EventValidator();
+  // What socket.use costs without a check, so the rows below read as added latency
+  const baseline = measure('baseline (no check)', () => packets[0][1][0]);
+
+  return [
+    baseline,
+    ...packets.map(([name, packet]) => measure(name, () => validator.isValid(packet)))
+  ];
+}
@@ -0,0 +1,6 @@
+import { getRandomWords } from '../server/words';
+import { measure, BenchResult } from './harness';
+
+export default function wordsBench(): BenchResult[] {
+  return [measure('getRandomWords', () => getRandomWords())];
+}
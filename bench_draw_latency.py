@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Draw-to-render latency benchmark
+
+Opens one drawer and N guesser browser contexts in the same room, draws
+timestamped strokes with page.mouse and measures when each stroke appears on
+every guesser's canvas. Send and arrival times come from the page-side
+window.__pictionaryHooks (see lib/instrumentation.ts).
+
+Usage:
+    python3 bench_draw_latency.py [--guessers 1,2,4,8,14] [--strokes 20]
+"""
+import argparse
+import json
+import time
+
+from playwright.sync_api import sync_playwright
+from harness import (
+    create_room, draw_stroke, join_room, record_metric, running_servers, start_round, summarize,
+)
+
+MAX_PLAYERS = 15
+
+TIMING_HOOKS = """
+window.__strokeSent = [];
+window.__strokeArrivals = [];
+window.__pictionaryHooks = Object.assign(window.__pictionaryHooks || {}, {
+  onStrokeSent: () => window.__strokeSent.push(Date.now()),
+  onStrokeRendered: (count) => window.__strokeArrivals.push({ count, time: Date.now() }),
+});
+"""
+
+
+def stroke_points(index, segments=12):
+    """A short zig-zag stroke, offset per index so strokes don't overlap"""
+    y = 40 + (index * 27) % 520
+    return [(60 + i * 50, y + (15 if i % 2 else 0)) for i in range(segments)]
+
+
+def first_arrivals(arrivals, stroke_count):
+    """Map stroke number (1-based) to the first time the canvas held that many strokes"""
+    result = {}
+    for arrival in arrivals:
+        for k in range(1, min(arrival["count"], stroke_count) + 1):
+            result.setdefault(k, arrival["time"])
+    return result
+
+
+def measure(browser, guessers, strokes, timeout=10):
+    contexts = [browser.new_context() for _ in range(guessers + 1)]
+    pages = []
+    for context in contexts:
+        context.add_init_script(TIMING_HOOKS)
+        pages.append(context.new_page())
+
+    try:
+        room_id = create_room(pages[0], "Host", room_name=f"Latency x{guessers}")
+        for i, page in enumerate(pages[1:], start=1):
+            join_room(page, room_id, f"Guesser{i}")
+
+        drawer = start_round(pages[0], pages)
+        guesser_pages = [page for page in pages if page is not drawer]
+        for page in pages:
+            page.evaluate("window.__strokeSent = []; window.__strokeArrivals = []")
+
+        for i in range(strokes):
+            draw_stroke(drawer, stroke_points(i))
+
+        # Wait for every guesser to render every stroke
+        deadline = time.monotonic() + timeout
+        pending = list(guesser_pages)
+        while pending and time.monotonic() < deadline:
+            pending = [
+                page for page in pending
+                if page.evaluate("Math.max(0, ...window.__strokeArrivals.map((a) => a.count))") < strokes
+            ]
+            time.sleep(0.05)
+
+        sent = drawer.evaluate("window.__strokeSent")
+        latencies = []
+        for page in guesser_pages:
+            arrivals = first_arrivals(page.evaluate("window.__strokeArrivals"), strokes)
+            latencies.extend(arrivals[k] - sent[k - 1] for k in arrivals if k <= len(sent))
+
+        return {
+            "guessers": guessers,
+            "missing": strokes * guessers - len(latencies),
+            "latency_ms": summarize(latencies),
+        }
+    finally:
+        for context in contexts:
+            context.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--guessers", default="1,2,4,8,14", help="comma-separated guesser counts")
+    parser.add_argument("--strokes", type=int, default=20, help="strokes drawn per run")
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    counts = [int(n) for n in args.guessers.split(",")]
+    if any(n < 1 or n > MAX_PLAYERS - 1 for n in counts):
+        parser.error(f"guesser counts must be between 1 and {MAX_PLAYERS - 1}")
+
+    results = []
+    with running_servers(), sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        try:
+            for guessers in counts:
+                result = measure(browser, guessers, args.strokes)
+                results.append(result)
+                stats = result["latency_ms"]
+                for key in ("p50", "p90", "p99", "max"):
+                    if key in stats:
+                        record_metric(f"draw_to_render_{key}", stats[key], guessers=guessers)
+        finally:
+            browser.close()
+
+    print(f"\n{'guessers':>8} {'samples':>8} {'missing':>8} {'mean':>8} {'p50':>6} {'p90':>6} {'p99':>6} {'max':>6}  (ms)")
+    for result in results:
+        s = result["latency_ms"]
+        if not s["count"]:
+            print(f"{result['guessers']:>8} {0:>8} {result['missing']:>8}")
+            continue
+        print(f"{result['guessers']:>8} {s['count']:>8} {result['missing']:>8} {s['mean']:>8.1f} "
+              f"{s['p50']:>6} {s['p90']:>6} {s['p99']:>6} {s['max']:>6}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
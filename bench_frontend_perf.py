@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Frontend performance capture for scripted drawing and guessing sessions
+
+For each scenario, every page collects long tasks (PerformanceObserver),
+frame timings (requestAnimationFrame deltas), React commit counts per
+component (window.__pictionaryHooks.onCommit, see lib/instrumentation.ts) and
+CDP Performance metrics (JS heap, script/layout/style time). Chrome traces are
+recorded per scenario when --trace-dir is given. The per-scenario summary is
+printed, optionally written as JSON and appended to the metrics file.
+
+Usage:
+    python3 bench_frontend_perf.py [--guessers 3] [--duration 10] [--trace-dir /tmp/traces] [--json out.json]
+"""
+import argparse
+import json
+import os
+import time
+
+from playwright.sync_api import sync_playwright
+from harness import (
+    create_room, draw_stroke, join_room, record_metric, running_servers, start_round, summarize,
+)
+
+JANK_FRAME_MS = 50
+
+PERF_HOOKS = """
+window.__perf = { longTasks: [], frames: [], commits: {} };
+window.__pictionaryHooks = Object.assign(window.__pictionaryHooks || {}, {
+  onCommit: (component) => {
+    window.__perf.commits[component] = (window.__perf.commits[component] || 0) + 1;
+  },
+});
+try {
+  new PerformanceObserver((list) => {
+    for (const entry of list.getEntries()) {
+      window.__perf.longTasks.push(entry.duration);
+    }
+  }).observe({ type: 'longtask', buffered: true });
+} catch (e) {}
+(function () {
+  let last = performance.now();
+  const tick = (now) => {
+    window.__perf.frames.push(now - last);
+    last = now;
+    requestAnimationFrame(tick);
+  };
+  requestAnimationFrame(tick);
+})();
+"""
+
+CDP_METRICS = ("JSHeapUsedSize", "JSHeapTotalSize", "ScriptDuration", "TaskDuration", "LayoutCount", "RecalcStyleCount")
+
+TRACE_CATEGORIES = [
+    "devtools.timeline", "disabled-by-default-devtools.timeline", "disabled-by-default-devtools.timeline.frame",
+    "blink.user_timing", "v8.execute",
+]
+
+
+class PageRecorder:
+    """Per-page collection of page-side hooks plus CDP Performance metrics"""
+
+    def __init__(self, role, page):
+        self.role = role
+        self.page = page
+        self.cdp = page.context.new_cdp_session(page)
+        self.cdp.send("Performance.enable")
+        self._start_metrics = {}
+
+    def _metrics(self):
+        metrics = self.cdp.send("Performance.getMetrics")["metrics"]
+        return {m["name"]: m["value"] for m in metrics if m["name"] in CDP_METRICS}
+
+    def start(self):
+        self.page.evaluate("window.__perf.longTasks = []; window.__perf.frames = []; window.__perf.commits = {}")
+        self._start_metrics = self._metrics()
+
+    def stop(self):
+        perf = self.page.evaluate("window.__perf")
+        end = self._metrics()
+        long_tasks = perf["longTasks"]
+        frames = perf["frames"][1:]
+        return {
+            "role": self.role,
+            "long_tasks": {"count": len(long_tasks), "total_ms": sum(long_tasks), "max_ms": max(long_tasks, default=0)},
+            "frames_ms": summarize(frames),
+            "jank_frames": sum(1 for f in frames if f > JANK_FRAME_MS),
+            "commits": perf["commits"],
+            "js_heap_used_mb": end.get("JSHeapUsedSize", 0) / 1e6,
+            "script_ms": (end.get("ScriptDuration", 0) - self._start_metrics.get("ScriptDuration", 0)) * 1000,
+            "task_ms": (end.get("TaskDuration", 0) - self._start_metrics.get("TaskDuration", 0)) * 1000,
+            "layouts": end.get("LayoutCount", 0) - self._start_metrics.get("LayoutCount", 0),
+            "style_recalcs": end.get("RecalcStyleCount", 0) - self._start_metrics.get("RecalcStyleCount", 0),
+        }
+
+
+def scribble(index):
+    y = 50 + (index * 37) % 500
+    return [(40 + i * 18, y + (i * 7) % 40) for i in range(40)]
+
+
+def scenario_drawing(drawer, guessers, duration):
+    """Drawer draws long strokes as fast as possible while guessers watch"""
+    deadline = time.monotonic() + duration
+    strokes = 0
+    while time.monotonic() < deadline:
+        draw_stroke(drawer, scribble(strokes))
+        strokes += 1
+    return {"strokes": strokes}
+
+
+def scenario_guessing(drawer, guessers, duration):
+    """Drawer keeps drawing while every guesser types wrong guesses"""
+    deadline = time.monotonic() + duration
+    strokes = guesses = 0
+    while time.monotonic() < deadline:
+        draw_stroke(drawer, scribble(strokes))
+        strokes += 1
+        for page in guessers:
+            field = page.locator('input[placeholder*="guess" i]').first
+            field.fill(f"guess {guesses}")
+            field.press("Enter")
+            guesses += 1
+    return {"strokes": strokes, "guesses": guesses}
+
+
+SCENARIOS = {"drawing": scenario_drawing, "guessing": scenario_guessing}
+
+
+def run_scenario(browser, name, guesser_count, duration, trace_dir):
+    contexts = [browser.new_context() for _ in range(guesser_count + 1)]
+    pages = []
+    for context in contexts:
+        context.add_init_script(PERF_HOOKS)
+        pages.append(context.new_page())
+
+    try:
+        room_id = create_room(pages[0], "Host", room_name=f"Perf {name}")
+        for i, page in enumerate(pages[1:], start=1):
+            join_room(page, room_id, f"Guesser{i}")
+        drawer = start_round(pages[0], pages)
+        guessers = [page for page in pages if page is not drawer]
+
+        recorders = [PageRecorder("drawer", drawer)] + [PageRecorder("guesser", page) for page in guessers]
+        if trace_dir:
+            os.makedirs(trace_dir, exist_ok=True)
+            browser.start_tracing(page=guessers[0], path=os.path.join(trace_dir, f"{name}.json"),
+                                  categories=TRACE_CATEGORIES)
+        for recorder in recorders:
+            recorder.start()
+
+        workload = SCENARIOS[name](drawer, guessers, duration)
+
+        pages_summary = [recorder.stop() for recorder in recorders]
+        if trace_dir:
+            browser.stop_tracing()
+        return {"scenario": name, "guessers": guesser_count, "duration_s": duration,
+                "workload": workload, "pages": pages_summary}
+    finally:
+        for context in contexts:
+            context.close()
+
+
+def print_summary(result):
+    print(f"\n=== {result['scenario']} ({result['guessers']} guessers, {result['workload']}) ===")
+    print(f"{'role':>8} {'longtasks':>9} {'lt max':>7} {'frame p50':>9} {'p90':>6} {'max':>6} {'jank':>5} "
+          f"{'heap MB':>8} {'script ms':>9}  commits")
+    for page in result["pages"]:
+        frames = page["frames_ms"]
+        commits = ", ".join(f"{k}={v}" for k, v in sorted(page["commits"].items()))
+        print(f"{page['role']:>8} {page['long_tasks']['count']:>9} {page['long_tasks']['max_ms']:>7.0f} "
+              f"{frames.get('p50', 0):>9.1f} {frames.get('p90', 0):>6.1f} {frames.get('max', 0):>6.1f} "
+              f"{page['jank_frames']:>5} {page['js_heap_used_mb']:>8.1f} {page['script_ms']:>9.0f}  {commits}")
+
+
+def record(result):
+    for page in result["pages"]:
+        tags = {"scenario": result["scenario"], "role": page["role"]}
+        record_metric("frontend_long_task_ms", page["long_tasks"]["total_ms"], **tags)
+        record_metric("frontend_frame_p90_ms", page["frames_ms"].get("p90", 0), **tags)
+        record_metric("frontend_jank_frames", page["jank_frames"], unit="count", **tags)
+        record_metric("frontend_js_heap_mb", round(page["js_heap_used_mb"], 2), unit="MB", **tags)
+        record_metric("frontend_commits", sum(page["commits"].values()), unit="count", **tags)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="comma-separated scenario names")
+    parser.add_argument("--guessers", type=int, default=3)
+    parser.add_argument("--duration", type=float, default=10, help="seconds per scenario")
+    parser.add_argument("--trace-dir", help="record a Chrome trace per scenario into this directory")
+    parser.add_argument("--json", help="write the per-scenario summary to this file")
+    args = parser.parse_args()
+
+    results = []
+    with running_servers(), sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        try:
+            for name in args.scenarios.split(","):
+                result = run_scenario(browser, name, args.guessers, args.duration, args.trace_dir)
+                results.append(result)
+                print_summary(result)
+                record(result)
+        finally:
+            browser.close()
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+Canvas pixel verification for the E2E harness
+
+Reads the game canvas straight from the page (getImageData), renders a
+reference image of the recorded stroke log with NumPy and diffs the two with a
+tolerance mask around stroke edges, where browser anti-aliasing differs from
+the reference rasterizer. References are cached on disk by a hash of the
+stroke log, so repeated runs only pay for the diff.
+"""
+import base64
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+
+import numpy as np
+
+CANVAS_WIDTH = 800
+CANVAS_HEIGHT = 600
+BACKGROUND = (255, 255, 255)
+BASELINE_DIR = os.environ.get("PICTIONARY_BASELINE_DIR", "/tmp/pictionary_baselines")
+
+# Records every stroke the drawer sends and how many strokes the canvas last
+# rendered (see lib/instrumentation.ts)
+STROKE_LOG_HOOK = """
+window.__strokeLog = [];
+window.__renderedStrokeCount = 0;
+window.__pictionaryHooks = Object.assign(window.__pictionaryHooks || {}, {
+  onStrokeSent: (stroke) => window.__strokeLog.push(stroke),
+  onStrokeRendered: (count) => { window.__renderedStrokeCount = count; },
+});
+"""
+
+_READ_PIXELS = """
+() => {
+  const canvas = document.querySelector('canvas');
+  const data = canvas.getContext('2d').getImageData(0, 0, canvas.width, canvas.height).data;
+  let binary = '';
+  for (let i = 0; i < data.length; i += 0x8000) {
+    binary += String.fromCharCode.apply(null, data.subarray(i, i + 0x8000));
+  }
+  return { width: canvas.width, height: canvas.height, data: btoa(binary) };
+}
+"""
+
+
+@dataclass
+class DiffResult:
+    mismatched: int
+    compared: int
+    mask: np.ndarray
+
+    @property
+    def ratio(self):
+        return self.mismatched / self.compared if self.compared else 0.0
+
+
+def read_canvas_pixels(page):
+    """Return the page's canvas as an (H, W, 3) uint8 RGB array"""
+    result = page.evaluate(_READ_PIXELS)
+    pixels = np.frombuffer(base64.b64decode(result["data"]), dtype=np.uint8)
+    return pixels.reshape(result["height"], result["width"], 4)[:, :, :3]
+
+
+def read_stroke_log(page):
+    """Strokes recorded by STROKE_LOG_HOOK on the drawer's page"""
+    return page.evaluate("window.__strokeLog || []")
+
+
+def stroke_log_hash(strokes, width=CANVAS_WIDTH, height=CANVAS_HEIGHT):
+    canonical = json.dumps({"width": width, "height": height, "strokes": strokes}, sort_keys=True)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _parse_color(color):
+    value = int(color.lstrip("#")[:6], 16)
+    return np.array([(value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF], dtype=np.uint8)
+
+
+def render_reference(strokes, width=CANVAS_WIDTH, height=CANVAS_HEIGHT, edge_band=1.5):
+    """Rasterize strokes the way Canvas.tsx draws them (round caps and joins).
+
+    Returns (image, ignore_mask): ignore_mask marks pixels within `edge_band`
+    of any stroke outline, where anti-aliasing makes exact colors unreliable.
+    """
+    image = np.empty((height, width, 3), dtype=np.uint8)
+    image[:] = BACKGROUND
+    ignore = np.zeros((height, width), dtype=bool)
+
+    for stroke in strokes:
+        points = np.asarray([(p["x"], p["y"]) for p in stroke["points"]], dtype=np.float64)
+        if len(points) < 2:
+            continue
+        radius = stroke["width"] / 2
+        color = _parse_color(stroke["color"])
+        reach = radius + edge_band
+
+        x0 = max(int(np.floor(points[:, 0].min() - reach)), 0)
+        x1 = min(int(np.ceil(points[:, 0].max() + reach)) + 1, width)
+        y0 = max(int(np.floor(points[:, 1].min() - reach)), 0)
+        y1 = min(int(np.ceil(points[:, 1].max() + reach)) + 1, height)
+        if x0 >= x1 or y0 >= y1:
+            continue
+
+        # Pixel centers inside the stroke's bounding box
+        ys, xs = np.mgrid[y0:y1, x0:x1]
+        px = xs + 0.5
+        py = ys + 0.5
+        distance = np.full(px.shape, np.inf)
+
+        for a, b in zip(points[:-1], points[1:]):
+            d = b - a
+            length_sq = d @ d
+            if length_sq == 0:
+                t = np.zeros_like(px)
+            else:
+                t = np.clip(((px - a[0]) * d[0] + (py - a[1]) * d[1]) / length_sq, 0, 1)
+            np.minimum(distance, np.hypot(px - (a[0] + t * d[0]), py - (a[1] + t * d[1])), out=distance)
+
+        region = image[y0:y1, x0:x1]
+        region[distance <= radius] = color
+        # Later strokes paint over earlier ones, so only keep edges that are still visible
+        ignore[y0:y1, x0:x1] &= distance > radius + edge_band
+        ignore[y0:y1, x0:x1] |= np.abs(distance - radius) <= edge_band
+
+    return image, ignore
+
+
+def reference_for(strokes, width=CANVAS_WIDTH, height=CANVAS_HEIGHT):
+    """Reference image and ignore mask for a stroke log, cached by content hash"""
+    os.makedirs(BASELINE_DIR, exist_ok=True)
+    path = os.path.join(BASELINE_DIR, f"{stroke_log_hash(strokes, width, height)}.npz")
+    if os.path.exists(path):
+        cached = np.load(path)
+        return cached["image"], cached["ignore"]
+
+    image, ignore = render_reference(strokes, width, height)
+    np.savez_compressed(path, image=image, ignore=ignore)
+    return image, ignore
+
+
+def diff(actual, reference, ignore=None, tolerance=48):
+    """Count pixels whose largest channel difference exceeds `tolerance` outside `ignore`"""
+    if actual.shape != reference.shape:
+        raise ValueError(f"Canvas size {actual.shape} does not match reference {reference.shape}")
+
+    delta = np.abs(actual.astype(np.int16) - reference.astype(np.int16)).max(axis=2)
+    mask = delta > tolerance
+    compared = delta.size
+    if ignore is not None:
+        mask &= ~ignore
+        compared -= int(ignore.sum())
+    return DiffResult(mismatched=int(mask.sum()), compared=compared, mask=mask)
+
+
+def verify_canvas(page, strokes, max_ratio=0.002, save_failures=True):
+    """Diff a page's canvas against the reference for `strokes`; raises AssertionError on mismatch"""
+    actual = read_canvas_pixels(page)
+    reference, ignore = reference_for(strokes, actual.shape[1], actual.shape[0])
+    result = diff(actual, reference, ignore)
+
+    if result.ratio > max_ratio:
+        if save_failures:
+            name = stroke_log_hash(strokes)[:12]
+            np.save(os.path.join(BASELINE_DIR, f"failure_{name}_actual.npy"), actual)
+            np.save(os.path.join(BASELINE_DIR, f"failure_{name}_mask.npy"), result.mask)
+        raise AssertionError(
+            f"Canvas differs from reference in {result.mismatched} pixels ({result.ratio:.3%} > {max_ratio:.3%})"
+        )
+    return result
@@ -1,21 +1,69 @@
 'use client';
 
 import { useEffect, useRef, useState } from 'react';
-import { DrawingStroke } from '../types';
+import { DrawingStroke, EncodedStroke } from '../types';
+import { StrokeBuffer } from '../lib/strokeBuffer';
+import { StrokeRenderer, createCanvasRenderer } from '../lib/strokeLayers';
+import { reportStrokeRendered, useCommitCounter } from '../lib/instrumentation';
 
 interface CanvasProps {
-  strokes: DrawingStroke[];
+  strokes: EncodedStroke[];
+  hiddenStrokes?: number[];  // ids of undone strokes
   canDraw: boolean;
   onStroke: (stroke: DrawingStroke) => void;
   onClear: () => void;
+  onUndo?: () => void;
+  onRedo?: () => void;
 }
 
-export default function Canvas({ strokes, canDraw, onStroke, onClear }: CanvasProps) {
+const NO_HIDDEN_STROKES: number[] = [];
+
+type Rendered = { strokes: EncodedStroke[]; hiddenStrokes: number[] };
+
+// Long strokes are split so each packet stays well under the server's MAX_STROKE_POINTS
+const MAX_POINTS_PER_STROKE = 1000;
+
+// Opt-in: guesser canvases are replayed in a Web Worker. Off by default because the
+// canvas can no longer be read from the page (e.g. by the pixel-diff E2E tests).
+const OFFSCREEN_CANVAS_ENABLED = process.env.NEXT_PUBLIC_OFFSCREEN_CANVAS === 'true';
+
+const supportsOffscreenCanvas = (): boolean =>
+  typeof window !== 'undefined' &&
+  typeof Worker !== 'undefined' &&
+  typeof HTMLCanvasElement !== 'undefined' &&
+  'transferControlToOffscreen' in HTMLCanvasElement.prototype;
+
+type CoalescedPointerEvent = PointerEvent & { getCoalescedEvents?: () => PointerEvent[] };
+
+export default function Canvas({
+  strokes,
+  hiddenStrokes = NO_HIDDEN_STROKES,
+  canDraw,
+  onStroke,
+  onClear,
+  onUndo,
+  onRedo,
+}: CanvasProps) {
+  useCommitCounter('Canvas');
+
   const canvasRef = useRef<HTMLCanvasElement>(null);
-  const [isDrawing, setIsDrawing] = useState(false);
   const [currentColor, setCurrentColor] = useState('#000000');
   const [currentWidth, setCurrentWidth] = useState(3);
-  const [currentStroke, setCurrentStroke] = useState<{ x: number; y: number }[]>([]);
+
+  // Input state lives in refs: pointer moves never trigger a React render
+  const bufferRef = useRef(new StrokeBuffer());
+  const drawnRef = useRef(0);
+  const pointerIdRef = useRef<number | null>(null);
+  const rectRef = useRef<DOMRect | null>(null);
+  const frameRef = useRef<number | null>(null);
+
+  // What the renderer currently shows, so updates are applied as appends and toggles
+  const renderedRef = useRef<Rendered>({ strokes: [], hiddenStrokes: [] });
+  const latestRef = useRef<Rendered>({ strokes, hiddenStrokes });
+  latestRef.current = { strokes, hiddenStrokes };
+  const rendererRef = useRef<StrokeRenderer | null>(null);
+  const [offscreenAvailable, setOffscreenAvailable] = useState(false);
+  const offscreen = offscreenAvailable && !canDraw;
 
   const colors = [
     '#000000', '#FFFFFF', '#FF0000', '#00FF00', '#0000FF',
@@ -24,107 +72,200 @@ export default function Canvas({ strokes, canDraw, onStroke, onClear }: CanvasPr
 
   const widths = [1, 3, 5, 8, 12];
 
-  useEffect(() => {
-    const canvas = canvasRef.current;
-    if (!canvas) return;
+  const getContext = () => canvasRef.current?.getContext('2d') ?? null;
+
+  // Draw every point buffered since the last flush as one path
+  const flush = () => {
+    frameRef.current = null;
+    const buffer = bufferRef.current;
+    if (buffer.length === 0) return;
 
-    const ctx = canvas.getContext('2d');
+    const ctx = getContext();
     if (!ctx) return;
 
-    // Clear canvas
-    ctx.fillStyle = '#FFFFFF';
-    ctx.fillRect(0, 0, canvas.width, canvas.height);
+    ctx.strokeStyle = currentColor;
+    ctx.lineWidth = currentWidth;
+    ctx.lineCap = 'round';
+    ctx.lineJoin = 'round';
+    ctx.beginPath();
+    drawnRef.current = buffer.trace(ctx, drawnRef.current);
+    ctx.stroke();
+  };
 
-    // Draw all strokes
-    strokes.forEach((stroke) => {
-      if (stroke.points.length < 2) return;
+  const scheduleFlush = () => {
+    if (frameRef.current !== null) return;
+    if (typeof requestAnimationFrame === 'undefined') {
+      flush();
+      return;
+    }
+    frameRef.current = requestAnimationFrame(flush);
+  };
 
-      ctx.strokeStyle = stroke.color;
-      ctx.lineWidth = stroke.width;
-      ctx.lineCap = 'round';
-      ctx.lineJoin = 'round';
+  useEffect(() => {
+    setOffscreenAvailable(OFFSCREEN_CANVAS_ENABLED && supportsOffscreenCanvas());
+  }, []);
+
+  // A stroke still being drawn is wiped when the canvas is repainted; paint it again
+  const repaintStrokeInProgress = () => {
+    if (bufferRef.current.length > 0) {
+      drawnRef.current = 0;
+      scheduleFlush();
+    }
+  };
 
-      ctx.beginPath();
-      ctx.moveTo(stroke.points[0].x, stroke.points[0].y);
+  // Attach a renderer: a Web Worker for guessers when enabled, otherwise the main thread
+  useEffect(() => {
+    let cancelled = false;
+    const attach = (renderer: StrokeRenderer) => {
+      const latest = latestRef.current;
+      renderer.reset(latest.strokes, latest.hiddenStrokes);
+      renderedRef.current = latest;
+      rendererRef.current = renderer;
+    };
 
-      for (let i = 1; i < stroke.points.length; i++) {
-        ctx.lineTo(stroke.points[i].x, stroke.points[i].y);
-      }
+    if (offscreen) {
+      import('../lib/offscreenRenderer').then(({ createOffscreenRenderer }) => {
+        const canvas = canvasRef.current;
+        if (!cancelled && canvas) {
+          attach(createOffscreenRenderer(canvas, reportStrokeRendered));
+        }
+      });
+    } else if (canvasRef.current) {
+      const renderer = createCanvasRenderer(canvasRef.current, reportStrokeRendered);
+      if (renderer) attach(renderer);
+    }
 
-      ctx.stroke();
-    });
-  }, [strokes]);
+    return () => {
+      cancelled = true;
+      rendererRef.current?.dispose();
+      rendererRef.current = null;
+    };
+  }, [offscreen]);
 
-  const getCanvasCoordinates = (e: React.MouseEvent<HTMLCanvasElement>): { x: number; y: number } | null => {
-    const canvas = canvasRef.current;
-    if (!canvas) return null;
+  // New strokes are appended and undo/redo toggle single strokes; everything is only
+  // replayed after a clear or a resync
+  useEffect(() => {
+    const renderer = rendererRef.current;
+    if (!renderer) return;
+
+    const previous = renderedRef.current;
+    renderedRef.current = { strokes, hiddenStrokes };
+
+    // Either the same array (only hidden ids changed) or a longer one that extends it; a new
+    // array of the same length is a repaint request
+    const last = previous.strokes.length - 1;
+    const appended = last >= 0 && (
+      strokes === previous.strokes || (strokes.length > last + 1 && strokes[last] === previous.strokes[last])
+    );
+    if (!appended) {
+      renderer.reset(strokes, hiddenStrokes);
+      repaintStrokeInProgress();
+      return;
+    }
 
-    const rect = canvas.getBoundingClientRect();
-    const scaleX = canvas.width / rect.width;
-    const scaleY = canvas.height / rect.height;
+    if (strokes.length > last + 1) {
+      renderer.append(strokes.slice(last + 1));
+    }
 
-    return {
-      x: (e.clientX - rect.left) * scaleX,
-      y: (e.clientY - rect.top) * scaleY,
-    };
-  };
+    let repainted = false;
+    hiddenStrokes.forEach((id) => {
+      if (!previous.hiddenStrokes.includes(id)) {
+        renderer.setHidden(id, true);
+        repainted = true;
+      }
+    });
+    previous.hiddenStrokes.forEach((id) => {
+      if (!hiddenStrokes.includes(id)) {
+        renderer.setHidden(id, false);
+        repainted = true;
+      }
+    });
+    if (repainted) {
+      repaintStrokeInProgress();
+    }
+  }, [strokes, hiddenStrokes]);
 
-  const startDrawing = (e: React.MouseEvent<HTMLCanvasElement>) => {
-    if (!canDraw) return;
+  useEffect(() => {
+    return () => {
+      if (frameRef.current !== null) cancelAnimationFrame(frameRef.current);
+    };
+  }, []);
 
-    const coords = getCanvasCoordinates(e);
-    if (!coords) return;
+  const addPoint = (e: { clientX: number; clientY: number }) => {
+    const canvas = canvasRef.current;
+    const rect = rectRef.current;
+    if (!canvas || !rect) return;
 
-    setIsDrawing(true);
-    setCurrentStroke([coords]);
+    bufferRef.current.push(
+      (e.clientX - rect.left) * (canvas.width / rect.width),
+      (e.clientY - rect.top) * (canvas.height / rect.height)
+    );
   };
 
-  const draw = (e: React.MouseEvent<HTMLCanvasElement>) => {
-    if (!canDraw || !isDrawing) return;
-
-    const coords = getCanvasCoordinates(e);
-    if (!coords) return;
+  const emitStroke = () => {
+    const buffer = bufferRef.current;
+    if (buffer.length > 0) {
+      onStroke(buffer.toStroke(currentColor, currentWidth));
+    }
+  };
 
-    const newStroke = [...currentStroke, coords];
-    setCurrentStroke(newStroke);
+  const startDrawing = (e: React.PointerEvent<HTMLCanvasElement>) => {
+    if (!canDraw || pointerIdRef.current !== null || !e.isPrimary) return;
 
-    // Draw locally immediately for responsiveness
-    const canvas = canvasRef.current;
-    if (!canvas) return;
+    const canvas = e.currentTarget;
+    // Measure once per stroke instead of forcing layout on every move
+    rectRef.current = canvas.getBoundingClientRect();
+    pointerIdRef.current = e.pointerId;
+    canvas.setPointerCapture?.(e.pointerId);
 
-    const ctx = canvas.getContext('2d');
-    if (!ctx) return;
+    bufferRef.current.clear();
+    drawnRef.current = 0;
+    addPoint(e);
+    scheduleFlush();
+  };
 
-    ctx.strokeStyle = currentColor;
-    ctx.lineWidth = currentWidth;
-    ctx.lineCap = 'round';
-    ctx.lineJoin = 'round';
+  const draw = (e: React.PointerEvent<HTMLCanvasElement>) => {
+    if (!canDraw || e.pointerId !== pointerIdRef.current) return;
 
-    if (newStroke.length >= 2) {
-      const prevPoint = newStroke[newStroke.length - 2];
-      const currPoint = newStroke[newStroke.length - 1];
+    // High-rate pointers deliver several samples per frame; take all of them
+    const native = e.nativeEvent as CoalescedPointerEvent;
+    const samples = native.getCoalescedEvents?.() ?? [];
+    if (samples.length > 0) {
+      samples.forEach(addPoint);
+    } else {
+      addPoint(e);
+    }
 
-      ctx.beginPath();
-      ctx.moveTo(prevPoint.x, prevPoint.y);
-      ctx.lineTo(currPoint.x, currPoint.y);
-      ctx.stroke();
+    if (bufferRef.current.length >= MAX_POINTS_PER_STROKE) {
+      flush();
+      emitStroke();
+      // Continue the line from where the previous packet ended
+      const buffer = bufferRef.current;
+      const lastX = buffer.x(buffer.length - 1);
+      const lastY = buffer.y(buffer.length - 1);
+      buffer.clear();
+      buffer.push(lastX, lastY);
+      drawnRef.current = 0;
     }
+
+    scheduleFlush();
   };
 
-  const stopDrawing = () => {
-    if (!canDraw || !isDrawing) return;
+  const stopDrawing = (e: React.PointerEvent<HTMLCanvasElement>) => {
+    if (e.pointerId !== pointerIdRef.current) return;
 
-    if (currentStroke.length > 0) {
-      const stroke: DrawingStroke = {
-        color: currentColor,
-        width: currentWidth,
-        points: currentStroke,
-      };
-      onStroke(stroke);
+    if (frameRef.current !== null) {
+      cancelAnimationFrame(frameRef.current);
+    }
+    flush();
+    if (canDraw) {
+      emitStroke();
     }
 
-    setIsDrawing(false);
-    setCurrentStroke([]);
+    e.currentTarget.releasePointerCapture?.(e.pointerId);
+    pointerIdRef.current = null;
+    bufferRef.current.clear();
+    drawnRef.current = 0;
   };
 
   return (
@@ -170,25 +311,44 @@ export default function Canvas({ strokes, canDraw, onStroke, onClear }: CanvasPr
               </div>
             </div>
 
-            <button
-              onClick={onClear}
-              className="ml-auto px-4 py-2 bg-red-500 text-white rounded-lg hover:bg-red-600 transition-colors font-medium"
-            >
-              Clear Canvas
-            </button>
+            <div className="ml-auto flex gap-2">
+              {onUndo && (
+                <button
+                  onClick={onUndo}
+                  className="px-4 py-2 bg-gray-500 text-white rounded-lg hover:bg-gray-600 transition-colors font-medium"
+                >
+                  Undo
+                </button>
+              )}
+              {onRedo && (
+                <button
+                  onClick={onRedo}
+                  className="px-4 py-2 bg-gray-500 text-white rounded-lg hover:bg-gray-600 transition-colors font-medium"
+                >
+                  Redo
+                </button>
+              )}
+              <button
+                onClick={onClear}
+                className="px-4 py-2 bg-red-500 text-white rounded-lg hover:bg-red-600 transition-colors font-medium"
+              >
+                Clear Canvas
+              </button>
+            </div>
           </div>
         </div>
       )}
 
       <div className="bg-white rounded-lg shadow-xl dark:shadow-gray-900/50 overflow-hidden">
         <canvas
+          key={offscreen ? 'offscreen' : 'main'}
           ref={canvasRef}
           width={800}
           height={600}
-          onMouseDown={startDrawing}
-          onMouseMove={draw}
-          onMouseUp={stopDrawing}
-          onMouseLeave={stopDrawing}
+          onPointerDown={startDrawing}
+          onPointerMove={draw}
+          onPointerUp={stopDrawing}
+          onPointerCancel={stopDrawing}
           className={`w-full border-4 ${canDraw ? 'border-primary-500 cursor-crosshair' : 'border-gray-300 dark:border-gray-600 cursor-not-allowed'}`}
           style={{ touchAction: 'none' }}
         />
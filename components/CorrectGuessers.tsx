@@ -2,6 +2,7 @@
 
 import React from 'react';
 import { Player } from '../types';
+import { useCommitCounter } from '../lib/instrumentation';
 
 interface CorrectGuessersProps {
   correctGuessers: Array<{ playerId: string; playerName: string }>;
@@ -18,6 +19,8 @@ export default function CorrectGuessers({
   manualMode = false,
   currentDrawerId,
 }: CorrectGuessersProps) {
+  useCommitCounter('CorrectGuessers');
+
   // In manual mode, show all players except the drawer; otherwise show only correct guessers
   const playersToShow = manualMode
     ? allPlayers
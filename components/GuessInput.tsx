@@ -1,6 +1,7 @@
 'use client';
 
 import { useState } from 'react';
+import { useCommitCounter } from '../lib/instrumentation';
 
 interface GuessInputProps {
   onGuess: (guess: string) => void;
@@ -14,6 +15,8 @@ interface GuessMessage {
 }
 
 export default function GuessInput({ onGuess, disabled }: GuessInputProps) {
+  useCommitCounter('GuessInput');
+
   const [guess, setGuess] = useState('');
   const [messages, setMessages] = useState<GuessMessage[]>([]);
 
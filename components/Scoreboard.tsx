@@ -1,6 +1,7 @@
 'use client';
 
 import { Player } from '../types';
+import { useCommitCounter } from '../lib/instrumentation';
 
 interface ScoreboardProps {
   players: Player[];
@@ -9,6 +10,8 @@ interface ScoreboardProps {
 }
 
 export default function Scoreboard({ players, currentDrawer, currentPlayerId }: ScoreboardProps) {
+  useCommitCounter('Scoreboard');
+
   const sortedPlayers = [...players].sort((a, b) => b.score - a.score);
 
   return (
@@ -4,7 +4,10 @@ import { useEffect, useState } from 'react';
 import { useGameStore } from '@/lib/store';
 
 export default function ThemeToggle() {
-  const { theme, effectiveTheme, setTheme } = useGameStore();
+  // Select only theme fields; this sits in the layout and must not re-render on game events
+  const theme = useGameStore((state) => state.theme);
+  const effectiveTheme = useGameStore((state) => state.effectiveTheme);
+  const setTheme = useGameStore((state) => state.setTheme);
   const [mounted, setMounted] = useState(false);
 
   // Only render after mounting to avoid hydration mismatch
@@ -1,13 +1,45 @@
 'use client';
 
+import { useEffect, useState } from 'react';
+import { useCommitCounter } from '../lib/instrumentation';
+import { secondsUntil } from '../lib/clockSync';
+
 interface TimerProps {
   seconds: number;
   isActive: boolean;
+  // Server-clock deadline to count down to locally; `seconds` is shown without one
+  deadline?: number | null;
+  clockOffset?: number;
+  duration?: number;
 }
 
-export default function Timer({ seconds, isActive }: TimerProps) {
-  const percentage = (seconds / 60) * 100;
-  const isLowTime = seconds <= 10;
+export default function Timer({ seconds, isActive, deadline = null, clockOffset = 0, duration = 60 }: TimerProps) {
+  useCommitCounter('Timer');
+  const [remaining, setRemaining] = useState(() =>
+    deadline !== null ? secondsUntil(deadline, clockOffset) : seconds
+  );
+
+  // Wake up exactly when the displayed second changes instead of polling, so the
+  // countdown neither drifts nor re-renders more than once a second
+  useEffect(() => {
+    if (deadline === null || !isActive) return;
+
+    let timeout: ReturnType<typeof setTimeout>;
+    const tick = () => {
+      const msLeft = deadline - (Date.now() + clockOffset);
+      setRemaining(secondsUntil(deadline, clockOffset));
+      if (msLeft > 0) {
+        timeout = setTimeout(tick, msLeft % 1000 || 1000);
+      }
+    };
+    tick();
+
+    return () => clearTimeout(timeout);
+  }, [deadline, clockOffset, isActive]);
+
+  const shown = deadline !== null ? remaining : seconds;
+  const percentage = (shown / duration) * 100;
+  const isLowTime = shown <= 10;
 
   return (
     <div className="bg-white dark:bg-gray-800 rounded-lg shadow-lg dark:shadow-gray-900/50 p-4">
@@ -18,7 +50,7 @@ export default function Timer({ seconds, isActive }: TimerProps) {
             isLowTime ? 'text-red-500 dark:text-red-400 animate-pulse' : 'text-primary-500 dark:text-primary-400'
           }`}
         >
-          {seconds}s
+          {shown}s
         </span>
       </div>
       <div className="w-full bg-gray-200 dark:bg-gray-700 rounded-full h-3 overflow-hidden">
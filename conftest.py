@@ -0,0 +1,51 @@
+"""
+Session-wide fixtures for the Python E2E tests
+
+Boots the Next.js client and the Socket.IO server once on free ports and shares
+them across every test file. Environment knobs:
+  PICTIONARY_EXTERNAL_SERVERS=1  use servers that are already running (URLs from
+                                 PICTIONARY_CLIENT_URL / PICTIONARY_SERVER_URL)
+  PICTIONARY_SKIP_BUILD=1        reuse the existing build; the build must have been
+                                 made for PICTIONARY_SERVER_PORT
+  PICTIONARY_CLIENT_PORT / PICTIONARY_SERVER_PORT  pin ports instead of picking free ones
+"""
+import os
+
+import pytest
+
+from harness import ServerProcesses, find_free_port, record_metric
+
+EXTERNAL_SERVERS = os.environ.get("PICTIONARY_EXTERNAL_SERVERS") == "1"
+
+
+def pytest_configure(config):
+    # Publish URLs before test modules are imported so module-level URLs pick them up
+    if EXTERNAL_SERVERS:
+        return
+    client_port = int(os.environ.get("PICTIONARY_CLIENT_PORT") or find_free_port())
+    server_port = int(os.environ.get("PICTIONARY_SERVER_PORT") or find_free_port())
+    os.environ["PICTIONARY_CLIENT_PORT"] = str(client_port)
+    os.environ["PICTIONARY_SERVER_PORT"] = str(server_port)
+    os.environ["PICTIONARY_CLIENT_URL"] = f"http://localhost:{client_port}"
+    os.environ["PICTIONARY_SERVER_URL"] = f"http://localhost:{server_port}"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def pictionary_servers():
+    if EXTERNAL_SERVERS:
+        yield None
+        return
+
+    servers = ServerProcesses(
+        client_port=int(os.environ["PICTIONARY_CLIENT_PORT"]),
+        server_port=int(os.environ["PICTIONARY_SERVER_PORT"]),
+        build=os.environ.get("PICTIONARY_SKIP_BUILD") != "1",
+    )
+    servers.start()
+    record_metric("server_startup", round(servers.startup_seconds * 1000, 1))
+    record_metric("server_first_response", round(servers.server_first_response_seconds * 1000, 1))
+    record_metric("client_first_response", round(servers.client_first_response_seconds * 1000, 1))
+
+    yield servers
+
+    servers.stop()
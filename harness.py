@@ -0,0 +1,302 @@
+"""
+Shared helpers for the Python E2E scripts
+"""
+import contextlib
+import json
+import math
+import os
+import signal
+import socket
+import subprocess
+import time
+import urllib.error
+import urllib.request
+
+REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+METRICS_FILE = os.environ.get("PICTIONARY_METRICS_FILE", "/tmp/pictionary_metrics.jsonl")
+LOG_DIR = os.environ.get("PICTIONARY_LOG_DIR", "/tmp")
+
+
+def client_url():
+    """Base URL of the Next.js client (set by conftest.py when it boots the servers)"""
+    return os.environ.get("PICTIONARY_CLIENT_URL", "http://localhost:3000")
+
+
+def server_url():
+    """Base URL of the Socket.IO game server"""
+    return os.environ.get("PICTIONARY_SERVER_URL", "http://localhost:3001")
+
+
+def find_free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def record_metric(name, value, unit="ms", **tags):
+    """Append one measurement to the metrics file so it can be tracked across runs"""
+    entry = {"name": name, "value": value, "unit": unit, "timestamp": time.time(), "tags": tags}
+    with open(METRICS_FILE, "a") as f:
+        f.write(json.dumps(entry) + "\n")
+    return entry
+
+
+def probe(url, timeout=1.0):
+    """Cheap readiness probe: True once the server answers HTTP at all (any status)"""
+    try:
+        with urllib.request.urlopen(url, timeout=timeout):
+            return True
+    except urllib.error.HTTPError:
+        return True
+    except (urllib.error.URLError, ConnectionError, socket.timeout):
+        return False
+
+
+def probe_ready(url, timeout=1.0):
+    """Readiness probe for the game server's /readyz: True only on a 2xx answer"""
+    try:
+        with urllib.request.urlopen(url, timeout=timeout):
+            return True
+    except (urllib.error.URLError, ConnectionError, socket.timeout):
+        return False
+
+
+def timed_get(url, timeout=30):
+    """Return the seconds taken to receive a full response from `url`"""
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            response.read()
+    except urllib.error.HTTPError:
+        pass
+    return time.perf_counter() - started
+
+
+class ServerProcesses:
+    """Builds once and runs the Next.js client and Socket.IO server on the given ports"""
+
+    def __init__(self, client_port, server_port, build=True, extra_env=None, with_client=True):
+        self.with_client = with_client
+        self.client_port = client_port
+        self.server_port = server_port
+        self.build = build
+        self.extra_env = extra_env or {}
+        self.client_url = f"http://localhost:{client_port}"
+        self.server_url = f"http://localhost:{server_port}"
+        self.startup_seconds = None
+        self.client_first_response_seconds = None
+        self.server_first_response_seconds = None
+        self._processes = []
+        self._logs = []
+
+    def _env(self):
+        return {
+            **os.environ,
+            "PORT": str(self.server_port),
+            "CLIENT_URL": self.client_url,
+            "NEXT_PUBLIC_SERVER_URL": self.server_url,
+            # stop() waits 10s before SIGKILL, so a drain must not outlast that
+            "DRAIN_TIMEOUT_MS": "5000",
+            **self.extra_env,
+        }
+
+    def _spawn(self, name, command):
+        log = open(os.path.join(LOG_DIR, f"pictionary_{name}.log"), "w")
+        self._logs.append(log)
+        process = subprocess.Popen(
+            command, cwd=REPO_ROOT, env=self._env(), stdout=log, stderr=subprocess.STDOUT,
+            start_new_session=True,
+        )
+        self._processes.append((name, process))
+
+    def start(self, timeout=120):
+        if self.build:
+            # NEXT_PUBLIC_SERVER_URL is inlined at build time, so build with the chosen server port
+            command = ["npm", "run", "build"] if self.with_client else ["npx", "tsc", "--project", "tsconfig.server.json"]
+            subprocess.run(command, cwd=REPO_ROOT, env=self._env(), check=True, stdout=subprocess.DEVNULL)
+
+        started = time.perf_counter()
+        self._spawn("server", ["node", "dist/server/index.js"])
+        if self.with_client:
+            self._spawn("client", ["npx", "next", "start", "-p", str(self.client_port)])
+
+        try:
+            self.wait_ready(timeout)
+        except Exception:
+            self.stop()
+            raise
+        self.startup_seconds = time.perf_counter() - started
+        self.server_first_response_seconds = timed_get(self.server_url)
+        if self.with_client:
+            self.client_first_response_seconds = timed_get(self.client_url)
+        return self
+
+    def wait_ready(self, timeout):
+        deadline = time.monotonic() + timeout
+        # The game server reports readiness itself; the client only has to answer at all
+        checks = {f"{self.server_url}/readyz": probe_ready}
+        if self.with_client:
+            checks[self.client_url] = probe
+        pending = set(checks)
+        while pending:
+            for name, process in self._processes:
+                if process.poll() is not None:
+                    raise RuntimeError(f"{name} exited with code {process.returncode}, see {LOG_DIR}/pictionary_{name}.log")
+            pending = {url for url in pending if not checks[url](url)}
+            if pending and time.monotonic() > deadline:
+                raise TimeoutError(f"Servers not ready after {timeout}s: {sorted(pending)}")
+            if pending:
+                time.sleep(0.1)
+
+    def stop(self):
+        for _, process in self._processes:
+            if process.poll() is None:
+                os.killpg(process.pid, signal.SIGTERM)
+        for _, process in self._processes:
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                os.killpg(process.pid, signal.SIGKILL)
+        for log in self._logs:
+            log.close()
+        self._processes = []
+        self._logs = []
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def summarize(values):
+    """Distribution statistics (nearest-rank percentiles) for a list of numbers"""
+    ordered = sorted(values)
+    if not ordered:
+        return {"count": 0}
+
+    def percentile(p):
+        return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+    return {
+        "count": len(ordered),
+        "mean": sum(ordered) / len(ordered),
+        "min": ordered[0],
+        "p50": percentile(50),
+        "p90": percentile(90),
+        "p99": percentile(99),
+        "max": ordered[-1],
+    }
+
+
+@contextlib.contextmanager
+def running_servers(extra_env=None, with_client=True):
+    """Start servers for a standalone script (ports from PICTIONARY_*_PORT or free ones).
+    Yields None and uses the URLs from the environment when PICTIONARY_EXTERNAL_SERVERS=1."""
+    if os.environ.get("PICTIONARY_EXTERNAL_SERVERS") == "1":
+        yield None
+        return
+
+    servers = ServerProcesses(
+        client_port=int(os.environ.get("PICTIONARY_CLIENT_PORT") or find_free_port()),
+        server_port=int(os.environ.get("PICTIONARY_SERVER_PORT") or find_free_port()),
+        build=os.environ.get("PICTIONARY_SKIP_BUILD") != "1",
+        extra_env=extra_env,
+        with_client=with_client,
+    )
+    with servers:
+        os.environ["PICTIONARY_CLIENT_URL"] = servers.client_url
+        os.environ["PICTIONARY_SERVER_URL"] = servers.server_url
+        yield servers
+
+
+# ============================================================================
+# Browser game helpers (Playwright pages)
+# ============================================================================
+
+CANVAS_WIDTH = 800
+CANVAS_HEIGHT = 600
+
+
+def create_room(page, player_name, room_name="Test Room", private=True):
+    """Create a room from the home page and return its id"""
+    page.goto(client_url())
+    page.fill('input[placeholder="Enter your name"]', player_name)
+    page.click('button:has-text("Create Room")')
+    page.fill('input[placeholder="Enter room name"]', room_name)
+    if private:
+        page.click('button:has-text("Private")')
+    page.click('button[type="submit"]:has-text("Create Room")')
+    page.wait_for_selector("text=Waiting for players...", timeout=15000)
+    return page.url.split("/room/")[1].split("?")[0]
+
+
+def join_room(page, room_id, player_name):
+    """Join a room through its direct link and the name prompt"""
+    page.goto(f"{client_url()}/room/{room_id}")
+    page.fill('input[placeholder="Enter your name"]', player_name)
+    page.click('button[type="submit"]:has-text("Join Room")')
+    page.wait_for_selector("text=Waiting for players...", timeout=15000)
+
+
+def start_round(host_page, pages, timeout=15):
+    """Start the game as host, pick the first word as drawer and return the drawer's page"""
+    host_page.click('button:has-text("Start Game")')
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        for page in pages:
+            if page.locator("text=Choose a Word to Draw").is_visible():
+                page.locator('button:has-text("points")').first.click()
+                page.wait_for_selector("text=Your word:", timeout=5000)
+                return page
+        time.sleep(0.05)
+    raise TimeoutError("No player was offered a word")
+
+
+def draw_stroke(page, points):
+    """Draw one stroke given points in canvas pixels (800x600)"""
+    box = page.locator("canvas").bounding_box()
+    scale_x = box["width"] / CANVAS_WIDTH
+    scale_y = box["height"] / CANVAS_HEIGHT
+
+    def to_screen(point):
+        return box["x"] + point[0] * scale_x, box["y"] + point[1] * scale_y
+
+    page.mouse.move(*to_screen(points[0]))
+    page.mouse.down()
+    for point in points[1:]:
+        page.mouse.move(*to_screen(point))
+    page.mouse.up()
+
+
+class TestClock:
+    """Controls the game server's test clock (server started with TEST_CLOCK=manual or scaled:N)"""
+
+    __test__ = False
+
+    def __init__(self, base_url=None):
+        self.base_url = (base_url or server_url()).rstrip("/")
+
+    def _request(self, path, method="GET"):
+        request = urllib.request.Request(f"{self.base_url}{path}", method=method)
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return json.loads(response.read())
+
+    def status(self):
+        """Return {mode, now, scale} for the server clock"""
+        return self._request("/__test/clock")
+
+    def now(self):
+        return self.status()["now"]
+
+    def advance(self, seconds):
+        """Step a manual clock forward, firing any round timers that fall due"""
+        return self._request(f"/__test/clock/advance?ms={int(seconds * 1000)}", method="POST")
+
+    def sleep(self, seconds):
+        """Wait `seconds` of game time, stepping or sleeping depending on the clock mode"""
+        status = self.status()
+        if status["mode"] == "manual":
+            self.advance(seconds)
+        else:
+            time.sleep(seconds / status["scale"])
@@ -0,0 +1,42 @@
+import { unpackStrokes } from './strokeCodec';
+import { LayeredStrokeRenderer } from './strokeLayers';
+
+export type RendererMessage =
+  | { type: 'init'; canvas: OffscreenCanvas }
+  | { type: 'reset'; packed: ArrayBuffer; hidden: number[] }
+  | { type: 'append'; packed: ArrayBuffer }
+  | { type: 'hide' | 'show'; id: number };
+
+// Worker side of the offscreen guesser canvas (see lib/offscreenRenderer.ts)
+const scope = self as unknown as {
+  onmessage: ((event: MessageEvent<RendererMessage>) => void) | null;
+  postMessage: (message: { type: 'rendered'; count: number }) => void;
+};
+
+let renderer: LayeredStrokeRenderer | null = null;
+
+scope.onmessage = ({ data }) => {
+  if (data.type === 'init') {
+    const ctx = data.canvas.getContext('2d');
+    const layer = new OffscreenCanvas(data.canvas.width, data.canvas.height).getContext('2d');
+    if (ctx && layer) {
+      renderer = new LayeredStrokeRenderer(ctx, layer);
+    }
+    return;
+  }
+  if (!renderer) return;
+
+  switch (data.type) {
+    case 'reset':
+      renderer.reset(unpackStrokes(data.packed), data.hidden);
+      break;
+    case 'append':
+      renderer.append(unpackStrokes(data.packed));
+      break;
+    case 'hide':
+    case 'show':
+      renderer.setHidden(data.id, data.type === 'hide');
+      break;
+  }
+  scope.postMessage({ type: 'rendered', count: renderer.count });
+};
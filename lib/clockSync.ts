@@ -0,0 +1,38 @@
+const MAX_SAMPLES = 5;
+
+interface ClockSample {
+  offset: number;
+  roundTrip: number;
+}
+
+// Estimates serverTime - Date.now() from clock:ping round trips, assuming the reply
+// spent half the round trip in flight. The sample with the shortest round trip has the
+// least queuing delay in it, so the offset comes from that one.
+export class ClockSync {
+  private samples: ClockSample[] = [];
+
+  get hasSamples(): boolean {
+    return this.samples.length > 0;
+  }
+
+  get offset(): number {
+    let best: ClockSample | null = null;
+    for (const sample of this.samples) {
+      if (!best || sample.roundTrip < best.roundTrip) best = sample;
+    }
+    return best ? best.offset : 0;
+  }
+
+  addSample(sentAt: number, serverTime: number, receivedAt: number): number {
+    const roundTrip = Math.max(receivedAt - sentAt, 0);
+    this.samples.push({ offset: serverTime - (sentAt + roundTrip / 2), roundTrip });
+    if (this.samples.length > MAX_SAMPLES) {
+      this.samples.shift();
+    }
+    return this.offset;
+  }
+}
+
+// Whole seconds left until a server-clock deadline, as a countdown would display them
+export const secondsUntil = (deadline: number, clockOffset: number, now = Date.now()): number =>
+  Math.max(Math.ceil((deadline - (now + clockOffset)) / 1000), 0);
@@ -0,0 +1,35 @@
+import { useEffect } from 'react';
+import { DrawingStroke } from '../types';
+
+// Optional hooks that test harnesses install on window before the app loads
+// (e.g. via Playwright's add_init_script). They are no-ops in normal use.
+export interface PictionaryHooks {
+  onStrokeSent?: (stroke: DrawingStroke) => void;
+  onStrokeRendered?: (strokeCount: number) => void;
+  onCommit?: (component: string) => void;
+}
+
+declare global {
+  interface Window {
+    __pictionaryHooks?: PictionaryHooks;
+  }
+}
+
+const getHooks = (): PictionaryHooks | undefined =>
+  typeof window === 'undefined' ? undefined : window.__pictionaryHooks;
+
+export function reportStrokeSent(stroke: DrawingStroke): void {
+  getHooks()?.onStrokeSent?.(stroke);
+}
+
+export function reportStrokeRendered(strokeCount: number): void {
+  getHooks()?.onStrokeRendered?.(strokeCount);
+}
+
+// Counts React commits per component for perf traces. An effect without deps runs
+// after every commit of the component that calls it.
+export function useCommitCounter(name: string): void {
+  useEffect(() => {
+    getHooks()?.onCommit?.(name);
+  });
+}
@@ -0,0 +1,37 @@
+import { packStrokes } from './strokeCodec';
+import { StrokeRenderer } from './strokeLayers';
+import type { RendererMessage } from './canvasRenderer.worker';
+
+// Hands the canvas to a worker, which replays strokes off the main thread. Each batch is
+// packed into one buffer and transferred, not cloned. The canvas element can never be
+// drawn on from the main thread again, so callers mount a fresh element to switch back.
+// Only import this lazily: it relies on the bundler's worker support (import.meta.url).
+export function createOffscreenRenderer(
+  canvas: HTMLCanvasElement,
+  onRendered: (count: number) => void
+): StrokeRenderer {
+  const offscreen = canvas.transferControlToOffscreen();
+  const worker = new Worker(new URL('./canvasRenderer.worker.ts', import.meta.url));
+
+  worker.onmessage = (event: MessageEvent<{ type: 'rendered'; count: number }>) => {
+    onRendered(event.data.count);
+  };
+
+  const post = (message: RendererMessage, transfer: Transferable[] = []) => {
+    worker.postMessage(message, transfer);
+  };
+  post({ type: 'init', canvas: offscreen }, [offscreen]);
+
+  return {
+    reset: (strokes, hidden) => {
+      const packed = packStrokes(strokes);
+      post({ type: 'reset', packed, hidden }, [packed]);
+    },
+    append: (strokes) => {
+      const packed = packStrokes(strokes);
+      post({ type: 'append', packed }, [packed]);
+    },
+    setHidden: (id, hidden) => post({ type: hidden ? 'hide' : 'show', id }),
+    dispose: () => worker.terminate(),
+  };
+}
@@ -0,0 +1,23 @@
+import type { TypedSocket } from './socket';
+
+type RoomConnection = typeof import('./socket') & typeof import('./socketEvents');
+
+let loading: Promise<RoomConnection> | null = null;
+
+// The socket.io client and its store bindings as one lazily loaded chunk. The room page
+// starts loading it on mount, in parallel with hydration and the name prompt, instead of
+// shipping it in the bundle the prompt waits for.
+export function loadRoomConnection(): Promise<RoomConnection> {
+  if (!loading) {
+    loading = Promise.all([import('./socket'), import('./socketEvents')]).then(([socket, events]) => ({
+      ...socket,
+      ...events,
+    }));
+  }
+  return loading;
+}
+
+// Emit once the client has loaded; calls made before then go out in order
+export function withSocket(send: (socket: TypedSocket) => void): void {
+  loadRoomConnection().then(({ getSocket }) => send(getSocket()));
+}
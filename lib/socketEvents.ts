@@ -0,0 +1,106 @@
+import { TypedSocket } from './socket';
+import { useGameStore } from './store';
+import { ClockSync } from './clockSync';
+import { unpackStrokes } from './strokeCodec';
+import { EncodedStroke, GuessResult, Room, RoundStart, Word } from '../types';
+
+const GUESS_RESULT_MS = 3000;
+const CLOCK_SYNC_MS = 30000;
+
+// The drawer keeps a stroke only once the server has acked it with an id: ids are positions
+// in room.canvas, so a stroke the server dropped (rate limit, validation) must not take a
+// slot. It is already on screen from live drawing; a dropped one is painted out again.
+export function sendStroke(socket: TypedSocket, stroke: EncodedStroke): void {
+  socket.emit('drawing:stroke', stroke, (strokeId) => {
+    const store = useGameStore.getState();
+    if (strokeId === null) {
+      store.repaintStrokes();
+    } else {
+      store.addStroke(stroke);
+    }
+  });
+}
+
+// Route server events into the store. Registered once per socket (not per render), so
+// room updates and strokes never tear down and re-register listeners; components pick
+// up changes through store selectors. Store actions are stable, so the returned cleanup
+// removes exactly these handlers and nothing else listening on the socket.
+export function bindSocketToStore(socket: TypedSocket): () => void {
+  const store = useGameStore.getState();
+  let guessResultTimer: ReturnType<typeof setTimeout> | null = null;
+  const clockSync = new ClockSync();
+
+  // Timers count down locally to the server's deadline, so the only timing traffic is
+  // a ping at each round start and an occasional one while a round is running
+  const pingClock = () => socket.emit('clock:ping', Date.now());
+  const clockSyncTimer = setInterval(() => {
+    if (useGameStore.getState().deadline !== null) pingClock();
+  }, CLOCK_SYNC_MS);
+
+  const onRoomJoined = ({ room }: { room: Room }) => store.setRoom(room);
+  const onSpectatorStrokes = (packed: ArrayBuffer) => store.addStrokes(unpackStrokes(packed));
+  const onWordSelection = ({ wordChoices }: { wordChoices: Word[] }) => store.setWordChoices(wordChoices);
+  const onRoundStart = ({ word, timer, deadline, serverTime }: RoundStart) => {
+    // Until a round trip has been measured, the one-way estimate is better than nothing
+    if (!clockSync.hasSamples) store.setClockOffset(serverTime - Date.now());
+    store.startRound(word, timer, deadline);
+    pingClock();
+  };
+  const onClockPong = ({ clientTime, serverTime }: { clientTime: number; serverTime: number }) => {
+    store.setClockOffset(clockSync.addSample(clientTime, serverTime, Date.now()));
+  };
+  const onTimerStopped = () => store.setShowCorrectGuessers(false);
+  const onGuessResult = (result: GuessResult) => {
+    store.setGuessResult(result);
+    if (guessResultTimer) clearTimeout(guessResultTimer);
+    guessResultTimer = setTimeout(() => store.setGuessResult(null), GUESS_RESULT_MS);
+  };
+  const onError = (message: string) => {
+    alert(message);
+  };
+
+  socket.on('room:updated', store.setRoom);
+  socket.on('room:joined', onRoomJoined);
+  socket.on('room:spectating', onRoomJoined);
+  socket.on('room:delta', store.applyRoomDelta);
+  socket.on('game:started', store.startGame);
+  socket.on('game:word-selection', onWordSelection);
+  socket.on('game:round-start', onRoundStart);
+  socket.on('game:timer-stopped', onTimerStopped);
+  socket.on('drawing:stroke', store.addStroke);
+  socket.on('spectate:strokes', onSpectatorStrokes);
+  socket.on('drawing:clear', store.clearStrokes);
+  socket.on('drawing:undo', store.hideStroke);
+  socket.on('drawing:redo', store.showStroke);
+  socket.on('guess:result', onGuessResult);
+  socket.on('guess:correct', store.addCorrectGuessers);
+  socket.on('game:round-end', store.endRound);
+  socket.on('game:end', store.endGame);
+  socket.on('clock:pong', onClockPong);
+  socket.on('error', onError);
+
+  return () => {
+    socket.off('room:updated', store.setRoom);
+    socket.off('room:joined', onRoomJoined);
+    socket.off('room:spectating', onRoomJoined);
+    socket.off('room:delta', store.applyRoomDelta);
+    socket.off('game:started', store.startGame);
+    socket.off('game:word-selection', onWordSelection);
+    socket.off('game:round-start', onRoundStart);
+    socket.off('game:timer-stopped', onTimerStopped);
+    socket.off('drawing:stroke', store.addStroke);
+    socket.off('spectate:strokes', onSpectatorStrokes);
+    socket.off('drawing:clear', store.clearStrokes);
+    socket.off('drawing:undo', store.hideStroke);
+    socket.off('drawing:redo', store.showStroke);
+    socket.off('guess:result', onGuessResult);
+    socket.off('guess:correct', store.addCorrectGuessers);
+    socket.off('game:round-end', store.endRound);
+    socket.off('game:end', store.endGame);
+    socket.off('clock:pong', onClockPong);
+    socket.off('error', onError);
+
+    if (guessResultTimer) clearTimeout(guessResultTimer);
+    clearInterval(clockSyncTimer);
+  };
+}
@@ -1,9 +1,13 @@
-import { create } from 'zustand';
-import { Room, Player } from '../types';
+import { create, StateCreator } from 'zustand';
+import { Room, Player, Word, EncodedStroke, GuessResult } from '../types';
 
 type Theme = 'light' | 'dark' | 'system';
 type EffectiveTheme = 'light' | 'dark';
 
+export type Guesser = { playerId: string; playerName: string };
+export type RoundEndData = { word: string; scores: Record<string, number> };
+export type GameEndData = { finalScores: Record<string, number>; winner: string };
+
 // Helper functions for theme management
 const getStoredTheme = (): Theme => {
   if (typeof window === 'undefined') return 'system';
@@ -19,26 +23,123 @@ const getEffectiveTheme = (theme: Theme): EffectiveTheme => {
   return theme === 'system' ? getSystemTheme() : theme;
 };
 
-interface GameStore {
+// The store is split into slices so components subscribe (via selectors) only to the
+// part an event touches: a stroke changes `strokes`, a round start changes `deadline`,
+// and neither re-renders the scoreboard.
+
+interface SessionSlice {
   room: Room | null;
   playerId: string | null;
   playerName: string | null;
+  isSpectator: boolean;
   theme: Theme;
   effectiveTheme: EffectiveTheme;
   setRoom: (room: Room) => void;
+  applyRoomDelta: (delta: Partial<Room>) => void;
+  setSpectator: (isSpectator: boolean) => void;
   setPlayerId: (id: string) => void;
   setPlayerName: (name: string) => void;
   setTheme: (theme: Theme) => void;
   reset: () => void;
 }
 
-export const useGameStore = create<GameStore>((set) => ({
+interface CanvasSlice {
+  strokes: EncodedStroke[];
+  hiddenStrokes: number[];
+  addStroke: (stroke: EncodedStroke) => void;
+  addStrokes: (strokes: EncodedStroke[]) => void;
+  repaintStrokes: () => void;
+  clearStrokes: () => void;
+  hideStroke: (id: number) => void;
+  showStroke: (id: number) => void;
+}
+
+interface PlayersSlice {
+  players: Player[];
+}
+
+interface TimerSlice {
+  timeLeft: number;
+  deadline: number | null;
+  clockOffset: number;
+  setClockOffset: (offset: number) => void;
+}
+
+interface RoundSlice {
+  wordChoices: Word[];
+  currentWord: string;
+  correctGuessers: Guesser[];
+  showCorrectGuessers: boolean;
+  guessResult: GuessResult | null;
+  roundEndData: RoundEndData | null;
+  gameEndData: GameEndData | null;
+  startGame: (room: Room) => void;
+  setWordChoices: (words: Word[]) => void;
+  startRound: (word: string | undefined, seconds: number, deadline: number) => void;
+  addCorrectGuessers: (guessers: Guesser[]) => void;
+  setShowCorrectGuessers: (show: boolean) => void;
+  setGuessResult: (result: GuessResult | null) => void;
+  endRound: (data: RoundEndData) => void;
+  endGame: (data: GameEndData) => void;
+}
+
+type GameStore = SessionSlice & CanvasSlice & PlayersSlice & TimerSlice & RoundSlice;
+
+const initialGameState = {
+  room: null,
+  isSpectator: false,
+  strokes: [],
+  hiddenStrokes: [],
+  players: [],
+  timeLeft: 60,
+  deadline: null,
+  wordChoices: [],
+  currentWord: '',
+  correctGuessers: [],
+  showCorrectGuessers: false,
+  guessResult: null,
+  roundEndData: null,
+  gameEndData: null
+};
+
+const sameIds = (a: number[], b: number[]) =>
+  a.length === b.length && a.every((id) => b.includes(id));
+
+const createSessionSlice: StateCreator<GameStore, [], [], SessionSlice> = (set, get) => ({
   room: null,
   playerId: null,
   playerName: null,
+  isSpectator: false,
   theme: getStoredTheme(),
   effectiveTheme: getEffectiveTheme(getStoredTheme()),
-  setRoom: (room) => set({ room }),
+  // Room snapshots replace the room and players; strokes are only resynced when the
+  // server's canvas disagrees with the incrementally built one (late join, dropped stroke).
+  // The round deadline is derived too, so late joiners count down without a round-start.
+  setRoom: (room) => {
+    const { strokes, hiddenStrokes } = get();
+    const update: Partial<GameStore> = {
+      room,
+      players: room.players,
+      deadline: room.gameState === 'drawing' && room.roundStartTime !== null
+        ? room.roundStartTime + room.roundDuration * 1000
+        : null
+    };
+    if (room.canvas.length !== strokes.length) {
+      update.strokes = room.canvas;
+    }
+    if (!sameIds(room.hiddenStrokes, hiddenStrokes)) {
+      update.hiddenStrokes = room.hiddenStrokes;
+    }
+    set(update);
+  },
+  // Spectators get only the changed fields. Their strokes arrive separately, so the canvas
+  // is taken from the store unless the delta wipes it.
+  applyRoomDelta: (delta) => {
+    const { room, strokes } = get();
+    if (!room) return;
+    get().setRoom({ ...room, ...delta, canvas: delta.canvas ?? strokes });
+  },
+  setSpectator: (isSpectator) => set({ isSpectator }),
   setPlayerId: (id) => set({ playerId: id }),
   setPlayerName: (name) => set({ playerName: name }),
   setTheme: (theme) => {
@@ -50,5 +151,85 @@ export const useGameStore = create<GameStore>((set) => ({
       effectiveTheme: getEffectiveTheme(theme)
     });
   },
-  reset: () => set({ room: null, playerId: null, playerName: null }),
+  reset: () => set({ ...initialGameState, playerId: null, playerName: null }),
+});
+
+const createCanvasSlice: StateCreator<GameStore, [], [], CanvasSlice> = (set) => ({
+  strokes: [],
+  hiddenStrokes: [],
+  addStroke: (stroke) => set((state) => ({ strokes: [...state.strokes, stroke] })),
+  addStrokes: (strokes) => set((state) => ({ strokes: [...state.strokes, ...strokes] })),
+  // Same strokes, new array: the canvas repaints from them, wiping anything drawn live
+  repaintStrokes: () => set((state) => ({ strokes: [...state.strokes] })),
+  clearStrokes: () => set({ strokes: [], hiddenStrokes: [] }),
+  hideStroke: (id) => set((state) =>
+    state.hiddenStrokes.includes(id) ? state : { hiddenStrokes: [...state.hiddenStrokes, id] }
+  ),
+  showStroke: (id) => set((state) => ({ hiddenStrokes: state.hiddenStrokes.filter((hidden) => hidden !== id) })),
+});
+
+const createPlayersSlice: StateCreator<GameStore, [], [], PlayersSlice> = () => ({
+  players: [],
+});
+
+const createTimerSlice: StateCreator<GameStore, [], [], TimerSlice> = (set) => ({
+  timeLeft: 60,
+  deadline: null,
+  clockOffset: 0,
+  setClockOffset: (offset) => set({ clockOffset: offset }),
+});
+
+const createRoundSlice: StateCreator<GameStore, [], [], RoundSlice> = (set, get) => ({
+  wordChoices: [],
+  currentWord: '',
+  correctGuessers: [],
+  showCorrectGuessers: false,
+  guessResult: null,
+  roundEndData: null,
+  gameEndData: null,
+  startGame: (room) => {
+    get().setRoom(room);
+    set({ roundEndData: null, gameEndData: null });
+  },
+  setWordChoices: (words) => set({ wordChoices: words }),
+  startRound: (word, seconds, deadline) => set({
+    currentWord: word || '',
+    timeLeft: seconds,
+    deadline,
+    correctGuessers: [],
+    showCorrectGuessers: false,
+    roundEndData: null
+  }),
+  // One update per server batch, so the guessers list re-renders once however many got it
+  addCorrectGuessers: (guessers) => set((state) => {
+    const known = new Set(state.correctGuessers.map((g) => g.playerId));
+    const added = guessers.filter((g) => {
+      if (known.has(g.playerId)) return false;
+      known.add(g.playerId);
+      return true;
+    });
+    if (added.length === 0) {
+      return { showCorrectGuessers: true };
+    }
+    return { correctGuessers: [...state.correctGuessers, ...added], showCorrectGuessers: true };
+  }),
+  setShowCorrectGuessers: (show) => set({ showCorrectGuessers: show }),
+  setGuessResult: (result) => set({ guessResult: result }),
+  endRound: (data) => set({ roundEndData: data, currentWord: '', wordChoices: [], deadline: null }),
+  endGame: (data) => set({ gameEndData: data }),
+});
+
+export const useGameStore = create<GameStore>()((...args) => ({
+  ...createSessionSlice(...args),
+  ...createCanvasSlice(...args),
+  ...createPlayersSlice(...args),
+  ...createTimerSlice(...args),
+  ...createRoundSlice(...args),
 }));
+
+// Selectors shared by the room page sections
+export const selectIsDrawer = (state: GameStore) =>
+  !!state.room && state.room.currentDrawer === state.playerId;
+export const selectGameState = (state: GameStore) => state.room?.gameState;
+export const selectCurrentDrawer = (state: GameStore) => state.room?.currentDrawer ?? null;
+export const selectIsHost = (state: GameStore) => !!state.room && state.room.hostId === state.playerId;
@@ -0,0 +1,64 @@
+import { DrawingStroke } from '../types';
+
+// Growable x/y buffer for the stroke being drawn. Points are written in place, so
+// pointer input allocates nothing until the buffer doubles or the stroke is finished.
+export class StrokeBuffer {
+  private data: Float32Array;
+  private count = 0;
+
+  constructor(initialPoints = 256) {
+    this.data = new Float32Array(Math.max(initialPoints, 1) * 2);
+  }
+
+  get length(): number {
+    return this.count;
+  }
+
+  push(x: number, y: number): void {
+    if ((this.count + 1) * 2 > this.data.length) {
+      const grown = new Float32Array(this.data.length * 2);
+      grown.set(this.data);
+      this.data = grown;
+    }
+    this.data[this.count * 2] = x;
+    this.data[this.count * 2 + 1] = y;
+    this.count++;
+  }
+
+  x(index: number): number {
+    return this.data[index * 2];
+  }
+
+  y(index: number): number {
+    return this.data[index * 2 + 1];
+  }
+
+  clear(): void {
+    this.count = 0;
+  }
+
+  // Trace the polyline from point `from` to the end onto the current path; returns the
+  // index of the last point so the next flush continues from there
+  trace(ctx: CanvasRenderingContext2D, from: number): number {
+    const start = Math.max(from, 0);
+    if (this.count === 0 || start >= this.count) return start;
+
+    ctx.moveTo(this.x(start), this.y(start));
+    if (this.count === 1) {
+      // A tap: a zero-length segment still paints a round cap
+      ctx.lineTo(this.x(0), this.y(0));
+    }
+    for (let i = start + 1; i < this.count; i++) {
+      ctx.lineTo(this.x(i), this.y(i));
+    }
+    return this.count - 1;
+  }
+
+  toStroke(color: string, width: number): DrawingStroke {
+    const points = new Array<{ x: number; y: number }>(this.count);
+    for (let i = 0; i < this.count; i++) {
+      points[i] = { x: this.x(i), y: this.y(i) };
+    }
+    return { color, width, points };
+  }
+}
@@ -0,0 +1,150 @@
+import { DrawingStroke, EncodedStroke } from '../types';
+
+// Binary stroke layout (little-endian), shared by client and server:
+//   [0]      format version
+//   [1]      line width
+//   [2..4]   RGB color
+//   [5]      reserved
+//   [6..7]   point count (uint16)
+//   [8..]    points as uint16 x/y pairs in fixed point (COORD_SCALE units per pixel)
+export const STROKE_FORMAT_VERSION = 1;
+export const STROKE_HEADER_BYTES = 8;
+export const STROKE_POINT_BYTES = 4;
+export const COORD_SCALE = 4;
+
+const MAX_COORD = 0xffff / COORD_SCALE;
+
+export type StrokeContext = CanvasRenderingContext2D | OffscreenCanvasRenderingContext2D;
+
+const toView = (data: EncodedStroke): DataView =>
+  data instanceof ArrayBuffer
+    ? new DataView(data)
+    : new DataView(data.buffer, data.byteOffset, data.byteLength);
+
+const toFixed = (value: number): number =>
+  Math.round(Math.min(Math.max(value, 0), MAX_COORD) * COORD_SCALE);
+
+const byteToHex = (value: number): string => value.toString(16).padStart(2, '0');
+
+export function encodeStroke(stroke: DrawingStroke): Uint8Array {
+  const count = Math.min(stroke.points.length, 0xffff);
+  const bytes = new Uint8Array(STROKE_HEADER_BYTES + count * STROKE_POINT_BYTES);
+  const view = new DataView(bytes.buffer);
+  const color = parseInt(stroke.color.slice(1, 7), 16) || 0;
+
+  view.setUint8(0, STROKE_FORMAT_VERSION);
+  view.setUint8(1, Math.min(Math.max(Math.round(stroke.width), 1), 0xff));
+  view.setUint8(2, (color >> 16) & 0xff);
+  view.setUint8(3, (color >> 8) & 0xff);
+  view.setUint8(4, color & 0xff);
+  view.setUint16(6, count, true);
+
+  for (let i = 0; i < count; i++) {
+    const offset = STROKE_HEADER_BYTES + i * STROKE_POINT_BYTES;
+    view.setUint16(offset, toFixed(stroke.points[i].x), true);
+    view.setUint16(offset + 2, toFixed(stroke.points[i].y), true);
+  }
+
+  return bytes;
+}
+
+// Header-only check: the packet is validated once on receipt and then relayed untouched
+export function isValidEncodedStroke(data: unknown, maxPoints: number): data is EncodedStroke {
+  if (!(data instanceof Uint8Array) && !(data instanceof ArrayBuffer)) return false;
+  if (data.byteLength < STROKE_HEADER_BYTES) return false;
+
+  const view = toView(data);
+  const count = view.getUint16(6, true);
+
+  return (
+    view.getUint8(0) === STROKE_FORMAT_VERSION &&
+    view.getUint8(1) > 0 &&
+    count > 0 &&
+    count <= maxPoints &&
+    data.byteLength === STROKE_HEADER_BYTES + count * STROKE_POINT_BYTES
+  );
+}
+
+export function getStrokePointCount(data: EncodedStroke): number {
+  return toView(data).getUint16(6, true);
+}
+
+export function getStrokeColor(data: EncodedStroke): string {
+  const view = toView(data);
+  return `#${byteToHex(view.getUint8(2))}${byteToHex(view.getUint8(3))}${byteToHex(view.getUint8(4))}`;
+}
+
+export function getStrokeWidth(data: EncodedStroke): number {
+  return toView(data).getUint8(1);
+}
+
+export function decodeStroke(data: EncodedStroke): DrawingStroke {
+  const view = toView(data);
+  const count = view.getUint16(6, true);
+  const points: { x: number; y: number }[] = new Array(count);
+
+  for (let i = 0; i < count; i++) {
+    const offset = STROKE_HEADER_BYTES + i * STROKE_POINT_BYTES;
+    points[i] = {
+      x: view.getUint16(offset, true) / COORD_SCALE,
+      y: view.getUint16(offset + 2, true) / COORD_SCALE,
+    };
+  }
+
+  return {
+    color: getStrokeColor(data),
+    width: view.getUint8(1),
+    points,
+  };
+}
+
+// Concatenate strokes into one buffer (each stroke is self-delimiting through its point
+// count), e.g. to hand a batch to a worker as a single transferable
+export function packStrokes(strokes: EncodedStroke[]): ArrayBuffer {
+  const total = strokes.reduce((sum, stroke) => sum + stroke.byteLength, 0);
+  const packed = new Uint8Array(total);
+  let offset = 0;
+  strokes.forEach((stroke) => {
+    packed.set(stroke instanceof ArrayBuffer ? new Uint8Array(stroke) : stroke, offset);
+    offset += stroke.byteLength;
+  });
+  return packed.buffer;
+}
+
+// Views onto the strokes inside a packed buffer; nothing is copied
+export function unpackStrokes(packed: ArrayBuffer): Uint8Array[] {
+  const view = new DataView(packed);
+  const strokes: Uint8Array[] = [];
+  let offset = 0;
+  while (offset + STROKE_HEADER_BYTES <= packed.byteLength) {
+    const length = STROKE_HEADER_BYTES + view.getUint16(offset + 6, true) * STROKE_POINT_BYTES;
+    if (offset + length > packed.byteLength) break;
+    strokes.push(new Uint8Array(packed, offset, length));
+    offset += length;
+  }
+  return strokes;
+}
+
+// Draws straight from the binary layout without materialising point objects
+export function drawEncodedStroke(ctx: StrokeContext, data: EncodedStroke): void {
+  const view = toView(data);
+  const count = view.getUint16(6, true);
+  if (count === 0) return;
+
+  ctx.strokeStyle = getStrokeColor(data);
+  ctx.lineWidth = view.getUint8(1);
+  ctx.lineCap = 'round';
+  ctx.lineJoin = 'round';
+
+  ctx.beginPath();
+  ctx.moveTo(view.getUint16(STROKE_HEADER_BYTES, true) / COORD_SCALE, view.getUint16(STROKE_HEADER_BYTES + 2, true) / COORD_SCALE);
+
+  // A single tap is a zero-length segment, which the round cap draws as a dot the size of
+  // the brush, as it looked on the drawer's live canvas
+  for (let i = count > 1 ? 1 : 0; i < count; i++) {
+    const offset = STROKE_HEADER_BYTES + i * STROKE_POINT_BYTES;
+    ctx.lineTo(view.getUint16(offset, true) / COORD_SCALE, view.getUint16(offset + 2, true) / COORD_SCALE);
+  }
+
+  ctx.stroke();
+}
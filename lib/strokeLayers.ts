@@ -0,0 +1,123 @@
+import { EncodedStroke } from '../types';
+import { StrokeContext, drawEncodedStroke } from './strokeCodec';
+
+const BACKGROUND = '#FFFFFF';
+
+// Renders a stroke list (ids are indices) onto a target canvas. All but the newest
+// `window` strokes are baked into a cached layer, so new strokes draw on top and undoing
+// or restoring a recent stroke costs one layer blit plus at most 2 * window strokes.
+// Only edits to strokes older than that rebuild the layer.
+export class LayeredStrokeRenderer {
+  private strokes: EncodedStroke[] = [];
+  private hidden = new Set<number>();
+  private baked = 0;
+
+  constructor(
+    private target: StrokeContext,
+    private layer: StrokeContext,
+    private window = 32
+  ) {}
+
+  get count(): number {
+    return this.strokes.length;
+  }
+
+  reset(strokes: EncodedStroke[], hidden: Iterable<number> = []): void {
+    this.strokes = strokes.slice();
+    this.hidden = new Set(hidden);
+    this.baked = Math.max(this.strokes.length - this.window, 0);
+    this.rebuildLayer();
+    this.composite();
+  }
+
+  append(strokes: EncodedStroke[]): void {
+    strokes.forEach((stroke) => {
+      this.strokes.push(stroke);
+      this.drawIfVisible(this.target, this.strokes.length - 1);
+    });
+
+    if (this.strokes.length - this.baked > this.window * 2) {
+      const until = this.strokes.length - this.window;
+      for (let id = this.baked; id < until; id++) {
+        this.drawIfVisible(this.layer, id);
+      }
+      this.baked = until;
+    }
+  }
+
+  // Returns whether the target was repainted
+  setHidden(id: number, hidden: boolean): boolean {
+    if (id < 0 || id >= this.strokes.length || this.hidden.has(id) === hidden) return false;
+
+    if (hidden) {
+      this.hidden.add(id);
+    } else {
+      this.hidden.delete(id);
+    }
+
+    if (id < this.baked) {
+      this.rebuildLayer();
+    }
+    this.composite();
+    return true;
+  }
+
+  private drawIfVisible(ctx: StrokeContext, id: number): void {
+    if (!this.hidden.has(id)) {
+      drawEncodedStroke(ctx, this.strokes[id]);
+    }
+  }
+
+  private rebuildLayer(): void {
+    this.layer.fillStyle = BACKGROUND;
+    this.layer.fillRect(0, 0, this.layer.canvas.width, this.layer.canvas.height);
+    for (let id = 0; id < this.baked; id++) {
+      this.drawIfVisible(this.layer, id);
+    }
+  }
+
+  private composite(): void {
+    this.target.drawImage(this.layer.canvas, 0, 0);
+    for (let id = this.baked; id < this.strokes.length; id++) {
+      this.drawIfVisible(this.target, id);
+    }
+  }
+}
+
+export interface StrokeRenderer {
+  reset: (strokes: EncodedStroke[], hidden: number[]) => void;
+  append: (strokes: EncodedStroke[]) => void;
+  setHidden: (id: number, hidden: boolean) => void;
+  dispose: () => void;
+}
+
+// Main-thread renderer; the cached layer is a detached canvas of the same size
+export function createCanvasRenderer(
+  canvas: HTMLCanvasElement,
+  onRendered: (count: number) => void
+): StrokeRenderer | null {
+  const layerCanvas = document.createElement('canvas');
+  layerCanvas.width = canvas.width;
+  layerCanvas.height = canvas.height;
+
+  const ctx = canvas.getContext('2d');
+  const layer = layerCanvas.getContext('2d');
+  if (!ctx || !layer) return null;
+
+  const layers = new LayeredStrokeRenderer(ctx, layer);
+  return {
+    reset: (strokes, hidden) => {
+      layers.reset(strokes, hidden);
+      onRendered(layers.count);
+    },
+    append: (strokes) => {
+      layers.append(strokes);
+      onRendered(layers.count);
+    },
+    setHidden: (id, hidden) => {
+      layers.setHidden(id, hidden);
+      onRendered(layers.count);
+    },
+    dispose: () => {},
+  };
+}
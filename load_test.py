@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+"""
+Socket-level load tool for the game server
+
+Simulated players talk to the Socket.IO server directly (python-socketio), so
+many players fit on one machine without browsers. Server health is sampled
+from the game server's GET /metrics endpoint.
+
+Modes:
+    soak   churn rooms, joins, disconnects and full games for a long time while
+           sampling heap, handle counts and event-loop lag; fails when memory
+           or handles keep growing instead of plateauing
+    storm  fill many rooms, then drop and reconnect a large fraction of players
+           at once; reports how long the server takes to settle and its CPU and
+           event-loop lag during the storm
+
+Usage:
+    python3 load_test.py soak --duration 3600 --rooms 20 --players 4
+    python3 load_test.py storm --rooms 100 --players 8 --fraction 0.8 --cycles 3
+
+Without PICTIONARY_EXTERNAL_SERVERS=1 a game server is started with
+TEST_CLOCK=scaled:<--clock-scale> so full games finish quickly.
+"""
+import argparse
+import json
+import random
+import struct
+import sys
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import socketio
+
+from harness import record_metric, running_servers, server_url, summarize
+
+STROKE_FORMAT_VERSION = 1
+COORD_SCALE = 4
+
+
+def encode_stroke(points, color=0x000000, width=3):
+    """Binary stroke layout from lib/strokeCodec.ts"""
+    header = struct.pack(
+        "<BBBBBBH", STROKE_FORMAT_VERSION, width, (color >> 16) & 0xFF, (color >> 8) & 0xFF, color & 0xFF, 0, len(points)
+    )
+    return header + b"".join(struct.pack("<HH", int(x * COORD_SCALE), int(y * COORD_SCALE)) for x, y in points)
+
+
+def fetch_metrics(window=None, base_url=None):
+    """One /metrics snapshot; a named window reports CPU and lag since that name's previous fetch"""
+    query = f"?window={window}" if window else ""
+    with urllib.request.urlopen(f"{base_url or server_url()}/metrics{query}", timeout=10) as response:
+        return json.loads(response.read())
+
+
+class SimPlayer:
+    """One simulated player on its own Socket.IO connection"""
+
+    def __init__(self, name, strokes_per_turn=5):
+        self.name = name
+        self.strokes_per_turn = strokes_per_turn
+        self.room = None
+        self.in_room = threading.Event()
+        self.game_over = threading.Event()
+        self.errors = []
+        self.rooms_lists_received = 0
+        self.client = self._new_client()
+
+    def _new_client(self):
+        client = socketio.Client(reconnection=False)
+        on = client.on
+        on("room:created", self._on_room)
+        on("room:joined", self._on_room)
+        on("room:updated", self._on_room_updated)
+        on("game:started", self._on_room_updated)
+        on("game:word-selection", self._on_word_selection)
+        on("game:round-start", self._on_round_start)
+        on("game:end", lambda data: self.game_over.set())
+        on("rooms:list", self._on_rooms_list)
+        on("error", lambda message: self.errors.append(message))
+        return client
+
+    @property
+    def sid(self):
+        return self.client.get_sid()
+
+    def connect(self, url=None):
+        self.client.connect(url or server_url(), transports=["websocket"])
+
+    def disconnect(self):
+        if self.client.connected:
+            self.client.disconnect()
+
+    def drop(self):
+        """Tear down the transport without the Socket.IO disconnect handshake"""
+        self.client.eio.disconnect(abort=True)
+
+    def reconnect(self, url=None):
+        """Fresh connection (new socket id), rejoining the previous room"""
+        room_id = self.room["id"]
+        self.client = self._new_client()
+        self.in_room.clear()
+        self.connect(url)
+        self.join_room(room_id)
+
+    def create_room(self, room_name, room_type="public", timeout=10):
+        self.client.emit("room:create", {"roomName": room_name, "roomType": room_type, "playerName": self.name})
+        if not self.in_room.wait(timeout):
+            raise TimeoutError(f"{self.name} could not create a room: {self.errors}")
+        return self.room["id"]
+
+    def join_room(self, room_id, timeout=10):
+        self.client.emit("room:join", {"roomId": room_id, "playerName": self.name})
+        if not self.in_room.wait(timeout):
+            raise TimeoutError(f"{self.name} could not join {room_id}: {self.errors}")
+
+    def leave_room(self):
+        self.client.emit("room:leave")
+
+    def start_game(self):
+        self.game_over.clear()
+        self.client.emit("game:start")
+
+    def _on_room(self, data):
+        self.room = data["room"]
+        self.in_room.set()
+
+    def _on_rooms_list(self, rooms):
+        self.rooms_lists_received += 1
+
+    def _on_room_updated(self, room):
+        self.room = room
+
+    def _on_word_selection(self, data):
+        self.client.emit("game:select-word", data["wordChoices"][0])
+
+    def _on_round_start(self, data):
+        if data.get("word"):
+            self.client.start_background_task(self._draw_turn)
+        else:
+            self.client.emit("guess:submit", random.choice(["cat", "house", "dragon", "guitar"]))
+
+    def _draw_turn(self):
+        for i in range(self.strokes_per_turn):
+            y = random.uniform(20, 580)
+            self.client.emit("drawing:stroke", encode_stroke([(40 + j * 30, y + (j % 2) * 10) for j in range(20)]))
+            self.client.sleep(0.02)
+        others = [p["id"] for p in (self.room or {}).get("players", []) if p["id"] != self.sid]
+        self.client.emit("game:stop-timer", others[:1])
+
+
+class MetricsSampler(threading.Thread):
+    """Polls /metrics on an interval and keeps (elapsed seconds, snapshot) pairs"""
+
+    def __init__(self, interval):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.samples = []
+        self.failures = 0
+        self._stop_event = threading.Event()
+        self._started = time.monotonic()
+
+    def run(self):
+        while not self._stop_event.is_set():
+            try:
+                self.samples.append((time.monotonic() - self._started, fetch_metrics("soak")))
+            except OSError:
+                self.failures += 1
+            self._stop_event.wait(self.interval)
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+
+def regression_slope(xs, ys):
+    """Least-squares slope of ys over xs"""
+    n = len(xs)
+    mean_x = sum(xs) / n
+    mean_y = sum(ys) / n
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    if variance == 0:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / variance
+
+
+def total_handles(snapshot):
+    return sum(snapshot["handles"].values())
+
+
+def analyze_growth(samples, warmup_fraction, max_heap_mb_per_hour, max_handles_per_hour):
+    """Fit growth after warmup; a healthy server plateaus, a leaking one keeps a positive slope"""
+    steady = samples[int(len(samples) * warmup_fraction):]
+    if len(steady) < 3:
+        return {"ok": True, "reason": "not enough samples"}
+
+    hours = [t / 3600 for t, _ in steady]
+    heap_slope = regression_slope(hours, [s["memory"]["heapUsed"] / 1e6 for _, s in steady])
+    rss_slope = regression_slope(hours, [s["memory"]["rss"] / 1e6 for _, s in steady])
+    handle_slope = regression_slope(hours, [total_handles(s) for _, s in steady])
+    lag_p99 = [s["eventLoopLagMs"]["p99"] for _, s in steady]
+
+    failures = []
+    if heap_slope > max_heap_mb_per_hour:
+        failures.append(f"heap grows {heap_slope:.1f} MB/h (limit {max_heap_mb_per_hour})")
+    if handle_slope > max_handles_per_hour:
+        failures.append(f"handles grow {handle_slope:.1f}/h (limit {max_handles_per_hour})")
+
+    return {
+        "ok": not failures,
+        "failures": failures,
+        "heap_mb_per_hour": heap_slope,
+        "rss_mb_per_hour": rss_slope,
+        "handles_per_hour": handle_slope,
+        "event_loop_lag_p99_ms": summarize(lag_p99),
+        "samples": len(steady),
+    }
+
+
+def churn_room(index, players, play_game, rng):
+    """One room lifecycle: create, fill, optionally play a full game, then everyone leaves"""
+    members = [SimPlayer(f"Soak{index}-{i}") for i in range(players)]
+    try:
+        for member in members:
+            member.connect()
+        room_id = members[0].create_room(f"Soak {index}", rng.choice(["public", "private"]))
+        for member in members[1:]:
+            member.join_room(room_id)
+
+        # Some players drop and rejoin on a fresh connection before the game
+        if players > 2 and rng.random() < 0.3:
+            members[-1].disconnect()
+            members[-1] = SimPlayer(f"Soak{index}-rejoin")
+            members[-1].connect()
+            members[-1].join_room(room_id)
+
+        if play_game:
+            members[0].start_game()
+            members[0].game_over.wait(timeout=120)
+    finally:
+        for i, member in enumerate(members):
+            if i % 2 and member.client.connected:
+                member.leave_room()
+            member.disconnect()
+
+
+def run_soak(args):
+    rng = random.Random(args.seed)
+    sampler = MetricsSampler(args.sample_interval)
+    sampler.start()
+    deadline = time.monotonic() + args.duration
+    waves = errors = 0
+
+    try:
+        with ThreadPoolExecutor(max_workers=args.rooms) as pool:
+            while time.monotonic() < deadline:
+                futures = [
+                    pool.submit(churn_room, waves * args.rooms + i, args.players,
+                                rng.random() < args.game_fraction, random.Random(rng.random()))
+                    for i in range(args.rooms)
+                ]
+                for future in futures:
+                    try:
+                        future.result()
+                    except Exception as e:  # keep soaking; count and report failures
+                        errors += 1
+                        print(f"[WARN] room churn failed: {e}")
+                waves += 1
+                if waves % 10 == 0:
+                    latest = sampler.samples[-1][1] if sampler.samples else None
+                    if latest:
+                        print(f"[INFO] wave {waves}: heap {latest['memory']['heapUsed'] / 1e6:.1f} MB, "
+                              f"handles {total_handles(latest)}, rooms {latest['game']['rooms']}, "
+                              f"lag p99 {latest['eventLoopLagMs']['p99']:.1f} ms")
+    finally:
+        sampler.stop()
+
+    result = analyze_growth(sampler.samples, args.warmup, args.max_heap_slope, args.max_handle_slope)
+    result.update({"waves": waves, "churn_errors": errors, "sample_failures": sampler.failures})
+
+    record_metric("soak_heap_slope", result.get("heap_mb_per_hour", 0), unit="MB/h")
+    record_metric("soak_handle_slope", result.get("handles_per_hour", 0), unit="handles/h")
+    if args.samples_out:
+        with open(args.samples_out, "w") as f:
+            json.dump([{"t": t, **s} for t, s in sampler.samples], f)
+
+    print(json.dumps(result, indent=2))
+    return 0 if result["ok"] else 1
+
+
+def wait_for_players(expected, timeout, poll_interval=0.05):
+    """Poll /metrics until the server tracks `expected` players and has no queued disconnects.
+
+    Returns (seconds waited or None on timeout, peak CPU percent, peak event-loop lag ms).
+    """
+    started = time.monotonic()
+    cpu_peak = lag_peak = 0.0
+    while time.monotonic() - started < timeout:
+        snapshot = fetch_metrics("storm")
+        cpu_peak = max(cpu_peak, snapshot["cpu"]["percent"])
+        lag_peak = max(lag_peak, snapshot["eventLoopLagMs"]["max"])
+        game = snapshot["game"]
+        if game["players"] == expected and game["disconnects"]["pending"] == 0:
+            return time.monotonic() - started, cpu_peak, lag_peak
+        time.sleep(poll_interval)
+    return None, cpu_peak, lag_peak
+
+
+def fill_room(index, players):
+    members = [SimPlayer(f"Storm{index}-{i}") for i in range(players)]
+    for member in members:
+        member.connect()
+    room_id = members[0].create_room(f"Storm {index}", "public")
+    for member in members[1:]:
+        member.join_room(room_id)
+    return members
+
+
+def run_storm(args):
+    rng = random.Random(args.seed)
+    total = args.rooms * args.players
+    lobby = SimPlayer("Lobby")
+    lobby.connect()
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        rooms = list(pool.map(lambda i: fill_room(i, args.players), range(args.rooms)))
+        settled, _, _ = wait_for_players(total, args.timeout)
+        if settled is None:
+            print(f"[FAIL] only part of the {total} players joined")
+            return 1
+        print(f"[INFO] {args.rooms} rooms with {total} players connected")
+
+        # One player per room stays connected so every room survives the storm and
+        # reconnecting players have something to rejoin; hosts may drop (host handover)
+        candidates = [member for members in rooms for member in members[:-1]]
+        cycles = []
+        try:
+            for cycle in range(args.cycles):
+                dropped = rng.sample(candidates, int(len(candidates) * args.fraction))
+                fetch_metrics("storm")  # start a fresh CPU / lag window
+                lists_before = lobby.rooms_lists_received
+
+                started = time.monotonic()
+                list(pool.map(SimPlayer.drop, dropped))
+                drop_settle, drop_cpu, drop_lag = wait_for_players(total - len(dropped), args.timeout)
+                drop_ms = (time.monotonic() - started) * 1000 if drop_settle is not None else None
+                lobby_lists = lobby.rooms_lists_received - lists_before
+
+                started = time.monotonic()
+                failed = [player for player, ok in zip(dropped, pool.map(_try_reconnect, dropped)) if not ok]
+                failures = len(failed)
+                rejoin_settle, rejoin_cpu, rejoin_lag = wait_for_players(total - failures, args.timeout)
+                rejoin_ms = (time.monotonic() - started) * 1000 if rejoin_settle is not None else None
+
+                result = {
+                    "cycle": cycle,
+                    "dropped": len(dropped),
+                    "disconnect_settle_ms": drop_ms,
+                    "disconnect_cpu_peak_percent": drop_cpu,
+                    "disconnect_lag_peak_ms": drop_lag,
+                    "lobby_rooms_list_messages": lobby_lists,
+                    "reconnect_settle_ms": rejoin_ms,
+                    "reconnect_cpu_peak_percent": rejoin_cpu,
+                    "reconnect_lag_peak_ms": rejoin_lag,
+                    "reconnect_failures": failures,
+                }
+                cycles.append(result)
+                print(json.dumps(result))
+
+                for name in ("disconnect_settle_ms", "reconnect_settle_ms"):
+                    if result[name] is not None:
+                        record_metric(f"storm_{name[:-3]}", round(result[name], 1), dropped=len(dropped))
+                record_metric("storm_cpu_peak", round(max(drop_cpu, rejoin_cpu), 1), unit="percent")
+                record_metric("storm_lag_peak", round(max(drop_lag, rejoin_lag), 1))
+                total -= failures
+                candidates = [player for player in candidates if player not in failed]
+        finally:
+            for members in rooms:
+                pool.map(SimPlayer.disconnect, members)
+            lobby.disconnect()
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(cycles, f, indent=2)
+
+    settled_all = all(c["disconnect_settle_ms"] is not None and c["reconnect_settle_ms"] is not None for c in cycles)
+    return 0 if settled_all else 1
+
+
+def _try_reconnect(player):
+    try:
+        player.reconnect()
+        return True
+    except Exception as e:  # a failed rejoin is reported, not fatal
+        print(f"[WARN] {player.name} could not reconnect: {e}")
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clock-scale", type=int, default=20, help="TEST_CLOCK scale for a server started here")
+    modes = parser.add_subparsers(dest="mode", required=True)
+
+    soak = modes.add_parser("soak", help="long-running churn with leak detection")
+    soak.add_argument("--duration", type=float, default=3600, help="seconds to run")
+    soak.add_argument("--rooms", type=int, default=20, help="rooms churned concurrently per wave")
+    soak.add_argument("--players", type=int, default=4, help="players per room")
+    soak.add_argument("--game-fraction", type=float, default=0.5, help="share of rooms that play a full game")
+    soak.add_argument("--sample-interval", type=float, default=10, help="seconds between /metrics samples")
+    soak.add_argument("--warmup", type=float, default=0.25, help="fraction of samples ignored as warmup")
+    soak.add_argument("--max-heap-slope", type=float, default=5.0, help="allowed heap growth in MB/hour")
+    soak.add_argument("--max-handle-slope", type=float, default=10.0, help="allowed handle growth per hour")
+    soak.add_argument("--samples-out", help="write raw samples as JSON")
+    soak.add_argument("--seed", type=int, default=None)
+
+    storm = modes.add_parser("storm", help="mass disconnect / reconnect chaos run")
+    storm.add_argument("--rooms", type=int, default=100)
+    storm.add_argument("--players", type=int, default=8, help="players per room")
+    storm.add_argument("--fraction", type=float, default=0.8, help="share of players dropped per cycle")
+    storm.add_argument("--cycles", type=int, default=3)
+    storm.add_argument("--concurrency", type=int, default=200, help="threads driving connects and drops")
+    storm.add_argument("--timeout", type=float, default=60, help="seconds allowed for the server to settle")
+    storm.add_argument("--json", help="write per-cycle results to this file")
+    storm.add_argument("--seed", type=int, default=None)
+
+    args = parser.parse_args()
+    with running_servers(extra_env={"TEST_CLOCK": f"scaled:{args.clock_scale}"}, with_client=False):
+        if args.mode == "soak":
+            return run_soak(args)
+        return run_storm(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
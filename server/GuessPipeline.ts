@@ -0,0 +1,139 @@
+import { GuessResult } from '../types';
+import { RoomManager } from './RoomManager';
+import { CancelTimer, Clock, systemClock } from './clock';
+
+export interface GuessSink {
+  // One result per guesser per batch: correct if any of their guesses in it was
+  result: (playerId: string, result: GuessResult) => void;
+  // Everyone who got the word in this batch, sent to the drawer in one message
+  correct: (drawerId: string, guessers: Array<{ playerId: string; playerName: string }>) => void;
+}
+
+export interface GuessPipelineStats {
+  pending: number;
+  guesses: number;
+  batches: number;
+  largestBatch: number;
+  dropped: number;
+  correct: number;
+  results: number;
+  drawerUpdates: number;
+}
+
+interface PendingGuess {
+  playerId: string;
+  guess: string;
+}
+
+// Guesses are queued per room and checked together once per tick. A flood of guesses
+// then costs one pass per room per tick and one message per guesser and per drawer,
+// however many guesses each player typed in between.
+export class GuessPipeline {
+  private pending: Map<string, PendingGuess[]> = new Map();
+  private cancelFlush: CancelTimer | null = null;
+  private stats: Omit<GuessPipelineStats, 'pending'> = {
+    guesses: 0,
+    batches: 0,
+    largestBatch: 0,
+    dropped: 0,
+    correct: 0,
+    results: 0,
+    drawerUpdates: 0
+  };
+
+  constructor(
+    private roomManager: RoomManager,
+    private sink: GuessSink,
+    private tickMs: number,
+    private clock: Clock = systemClock
+  ) {}
+
+  submit(roomId: string, playerId: string, guess: string): void {
+    this.stats.guesses++;
+    const queue = this.pending.get(roomId);
+    if (queue) {
+      queue.push({ playerId, guess });
+    } else {
+      this.pending.set(roomId, [{ playerId, guess }]);
+    }
+
+    if (!this.cancelFlush) {
+      this.cancelFlush = this.clock.setTimeout(() => {
+        this.cancelFlush = null;
+        this.flush();
+      }, this.tickMs);
+    }
+  }
+
+  // Check a room's queued guesses now, e.g. before its round ends. Returns the players the
+  // batch made correct, who have been told so and must be scored.
+  flushRoom(roomId: string): string[] {
+    const batch = this.pending.get(roomId);
+    if (!batch) return [];
+
+    this.pending.delete(roomId);
+    this.stats.batches++;
+    this.stats.largestBatch = Math.max(this.stats.largestBatch, batch.length);
+
+    const room = this.roomManager.getRoom(roomId);
+    if (!room || room.gameState !== 'drawing' || !room.currentDrawer) {
+      this.stats.dropped += batch.length;
+      return [];
+    }
+
+    const names = new Map(room.players.map(player => [player.id, player.name]));
+    const results = new Map<string, GuessResult>();
+    const newlyCorrect: Array<{ playerId: string; playerName: string }> = [];
+
+    for (const { playerId, guess } of batch) {
+      const playerName = names.get(playerId);
+      // Gone since guessing, or already right in this batch
+      if (playerName === undefined || results.get(playerId)?.correct) {
+        this.stats.dropped++;
+        continue;
+      }
+
+      const alreadyCorrect = room.correctGuessers.includes(playerId);
+      const correct = this.roomManager.submitGuess(roomId, playerId, guess);
+      results.set(playerId, { correct, playerId, playerName });
+      if (correct && !alreadyCorrect) {
+        newlyCorrect.push({ playerId, playerName });
+      }
+    }
+
+    results.forEach((result, playerId) => this.sink.result(playerId, result));
+    this.stats.results += results.size;
+
+    if (newlyCorrect.length > 0) {
+      this.stats.correct += newlyCorrect.length;
+      this.stats.drawerUpdates++;
+      this.sink.correct(room.currentDrawer, newlyCorrect);
+    }
+    return newlyCorrect.map(({ playerId }) => playerId);
+  }
+
+  flush(): void {
+    if (this.cancelFlush) {
+      this.cancelFlush();
+      this.cancelFlush = null;
+    }
+    Array.from(this.pending.keys()).forEach(roomId => this.flushRoom(roomId));
+  }
+
+  // Forget a deleted room's queue without checking it
+  drop(roomId: string): void {
+    const batch = this.pending.get(roomId);
+    if (batch) {
+      this.stats.dropped += batch.length;
+      this.pending.delete(roomId);
+    }
+  }
+
+  getStats(): GuessPipelineStats {
+    let pending = 0;
+    this.pending.forEach(batch => {
+      pending += batch.length;
+    });
+    return { pending, ...this.stats };
+  }
+}
@@ -0,0 +1,152 @@
+import { LeaderboardEntry, LeaderboardWindow } from '../types';
+import { Clock, systemClock } from './clock';
+import { readNumber } from './config';
+
+export interface LeaderboardConfig {
+  size: number;
+  maxTracked: number;
+}
+
+// Points one player earned in a round, as reported by RoomManager.endRound
+export interface ScoreDelta {
+  playerId: string;
+  name: string;
+  points: number;
+}
+
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+export function loadLeaderboardConfig(env: NodeJS.ProcessEnv = process.env): LeaderboardConfig {
+  const size = Math.max(readNumber(env, 'LEADERBOARD_SIZE', 100), 1);
+  return {
+    size,
+    // Never track fewer players than the board shows, or trimming could drop a ranked one
+    maxTracked: Math.max(readNumber(env, 'LEADERBOARD_MAX_TRACKED', 10000), size * 2)
+  };
+}
+
+interface Tally {
+  name: string;
+  score: number;
+}
+
+// One window's totals plus its top `size` entries kept sorted as scores arrive. Scores only
+// grow, so a player outside the top can only move in and a ranked one only moves up: each
+// delta costs at most one pass over the top list and a query just copies it.
+export class ScoreBoard {
+  private tallies: Map<string, Tally> = new Map();
+  private top: Tally[] = [];
+
+  constructor(private size: number, private maxTracked: number) {}
+
+  get tracked(): number {
+    return this.tallies.size;
+  }
+
+  add(key: string, name: string, points: number): void {
+    let tally = this.tallies.get(key);
+    if (!tally) {
+      tally = { name, score: 0 };
+      this.tallies.set(key, tally);
+    }
+    tally.name = name;
+    tally.score += points;
+
+    let index = this.top.indexOf(tally);
+    if (index === -1) {
+      const last = this.top[this.top.length - 1];
+      if (this.top.length >= this.size && last.score >= tally.score) {
+        this.trim();
+        return;
+      }
+      if (this.top.length >= this.size) this.top.pop();
+      this.top.push(tally);
+      index = this.top.length - 1;
+    }
+
+    // Ties keep their earlier rank, so whoever got there first stays ahead
+    while (index > 0 && this.top[index - 1].score < tally.score) {
+      this.top[index] = this.top[index - 1];
+      index--;
+    }
+    this.top[index] = tally;
+    this.trim();
+  }
+
+  entries(limit: number = this.size): LeaderboardEntry[] {
+    return this.top.slice(0, limit).map((tally, i) => ({ rank: i + 1, name: tally.name, score: tally.score }));
+  }
+
+  reset(): void {
+    this.tallies.clear();
+    this.top = [];
+  }
+
+  // Bound memory by forgetting the lowest unranked players once there are too many. Trimming
+  // to three quarters of the cap keeps the sort amortised over many new players; a forgotten
+  // player starts from zero if they score again, which only matters far below the board.
+  private trim(): void {
+    if (this.tallies.size <= this.maxTracked) return;
+
+    const ranked = new Set(this.top);
+    const unranked = Array.from(this.tallies).filter(([, tally]) => !ranked.has(tally));
+    unranked.sort((a, b) => a[1].score - b[1].score);
+
+    const excess = this.tallies.size - Math.floor(this.maxTracked * 0.75);
+    unranked.slice(0, excess).forEach(([key]) => this.tallies.delete(key));
+  }
+}
+
+// Process-wide rankings fed by round results. There are no accounts, so players are keyed
+// by display name (case-insensitive) and keep their points across rooms and games. The
+// daily board starts over at UTC midnight.
+export class Leaderboard {
+  private allTime: ScoreBoard;
+  private daily: ScoreBoard;
+  private day: number;
+  private rounds = 0;
+
+  constructor(private config: LeaderboardConfig, private clock: Clock = systemClock) {
+    this.allTime = new ScoreBoard(config.size, config.maxTracked);
+    this.daily = new ScoreBoard(config.size, config.maxTracked);
+    this.day = this.currentDay();
+  }
+
+  record(deltas: ScoreDelta[]): void {
+    this.rollDay();
+    this.rounds++;
+
+    deltas.forEach(({ name, points }) => {
+      if (points <= 0) return;
+
+      const key = name.trim().toLowerCase();
+      this.allTime.add(key, name, points);
+      this.daily.add(key, name, points);
+    });
+  }
+
+  top(window: LeaderboardWindow, limit: number = this.config.size): LeaderboardEntry[] {
+    this.rollDay();
+    return (window === 'daily' ? this.daily : this.allTime).entries(limit);
+  }
+
+  getStats(): { rounds: number; trackedDaily: number; trackedAllTime: number } {
+    return {
+      rounds: this.rounds,
+      trackedDaily: this.daily.tracked,
+      trackedAllTime: this.allTime.tracked
+    };
+  }
+
+  private currentDay(): number {
+    return Math.floor(this.clock.now() / DAY_MS);
+  }
+
+  private rollDay(): void {
+    const day = this.currentDay();
+    if (day !== this.day) {
+      this.day = day;
+      this.daily.reset();
+    }
+  }
+}
@@ -0,0 +1,107 @@
+import { Room } from '../types';
+
+interface HeapEntry {
+  roomId: string;
+  freeSlots: number;
+  sequence: number;
+}
+
+// Indexed binary min-heap over joinable public rooms, keyed by free slots so the
+// fullest waiting room is always at the root. Ties go to the oldest room.
+export class Matchmaker {
+  private heap: HeapEntry[] = [];
+  private positions: Map<string, number> = new Map();
+  private nextSequence = 0;
+
+  static isJoinable(room: Room): boolean {
+    return room.type === 'public' && room.gameState === 'waiting' && room.players.length < room.maxPlayers;
+  }
+
+  get size(): number {
+    return this.heap.length;
+  }
+
+  // Re-key, insert or drop a room after any change to its players or state
+  update(room: Room): void {
+    if (!Matchmaker.isJoinable(room)) {
+      this.remove(room.id);
+      return;
+    }
+
+    const freeSlots = room.maxPlayers - room.players.length;
+    const index = this.positions.get(room.id);
+
+    if (index === undefined) {
+      this.heap.push({ roomId: room.id, freeSlots, sequence: this.nextSequence++ });
+      this.positions.set(room.id, this.heap.length - 1);
+      this.siftUp(this.heap.length - 1);
+      return;
+    }
+
+    const previous = this.heap[index].freeSlots;
+    this.heap[index].freeSlots = freeSlots;
+    if (freeSlots < previous) {
+      this.siftUp(index);
+    } else if (freeSlots > previous) {
+      this.siftDown(index);
+    }
+  }
+
+  remove(roomId: string): void {
+    const index = this.positions.get(roomId);
+    if (index === undefined) return;
+
+    const last = this.heap.length - 1;
+    this.swap(index, last);
+    this.heap.pop();
+    this.positions.delete(roomId);
+
+    if (index < this.heap.length) {
+      this.siftUp(index);
+      this.siftDown(index);
+    }
+  }
+
+  // Fullest joinable room, or undefined when every public room is full or in progress
+  peek(): string | undefined {
+    return this.heap[0]?.roomId;
+  }
+
+  private less(a: HeapEntry, b: HeapEntry): boolean {
+    return a.freeSlots < b.freeSlots || (a.freeSlots === b.freeSlots && a.sequence < b.sequence);
+  }
+
+  private siftUp(index: number): void {
+    while (index > 0) {
+      const parent = (index - 1) >> 1;
+      if (!this.less(this.heap[index], this.heap[parent])) break;
+      this.swap(index, parent);
+      index = parent;
+    }
+  }
+
+  private siftDown(index: number): void {
+    const length = this.heap.length;
+    for (;;) {
+      const left = 2 * index + 1;
+      const right = left + 1;
+      let smallest = index;
+
+      if (left < length && this.less(this.heap[left], this.heap[smallest])) smallest = left;
+      if (right < length && this.less(this.heap[right], this.heap[smallest])) smallest = right;
+      if (smallest === index) break;
+
+      this.swap(index, smallest);
+      index = smallest;
+    }
+  }
+
+  private swap(i: number, j: number): void {
+    if (i === j) return;
+    const entry = this.heap[i];
+    this.heap[i] = this.heap[j];
+    this.heap[j] = entry;
+    this.positions.set(this.heap[i].roomId, i);
+    this.positions.set(this.heap[j].roomId, j);
+  }
+}
@@ -0,0 +1,172 @@
+import { isValidEncodedStroke } from '../lib/strokeCodec';
+import { Clock, systemClock } from './clock';
+import { readPositiveNumber } from './config';
+
+export type LimitedEvent = 'drawing:stroke' | 'guess:submit';
+
+export type RejectionReason = 'socket-rate' | 'room-rate' | 'payload';
+
+export interface BucketConfig {
+  ratePerSecond: number;
+  burst: number;
+}
+
+export interface RateLimiterConfig {
+  perSocket: Record<LimitedEvent, BucketConfig>;
+  perRoom: Record<LimitedEvent, BucketConfig>;
+  maxStrokePoints: number;
+  maxGuessLength: number;
+  maxPayloadBytes: number;
+}
+
+export interface RateLimiterStats {
+  accepted: Record<LimitedEvent, number>;
+  rejected: Record<LimitedEvent, Record<RejectionReason, number>>;
+}
+
+const LIMITED_EVENTS: LimitedEvent[] = ['drawing:stroke', 'guess:submit'];
+
+export class TokenBucket {
+  private tokens: number;
+  private lastRefill: number;
+
+  constructor(private config: BucketConfig, now: number) {
+    this.tokens = config.burst;
+    this.lastRefill = now;
+  }
+
+  tryRemove(now: number): boolean {
+    const elapsed = now - this.lastRefill;
+    if (elapsed > 0) {
+      this.tokens = Math.min(this.config.burst, this.tokens + (elapsed / 1000) * this.config.ratePerSecond);
+      this.lastRefill = now;
+    }
+
+    if (this.tokens < 1) return false;
+
+    this.tokens -= 1;
+    return true;
+  }
+}
+
+export function loadRateLimiterConfig(env: NodeJS.ProcessEnv = process.env): RateLimiterConfig {
+  return {
+    perSocket: {
+      'drawing:stroke': {
+        ratePerSecond: readPositiveNumber(env, 'STROKE_RATE_PER_SOCKET', 30),
+        burst: readPositiveNumber(env, 'STROKE_BURST_PER_SOCKET', 60)
+      },
+      'guess:submit': {
+        ratePerSecond: readPositiveNumber(env, 'GUESS_RATE_PER_SOCKET', 3),
+        burst: readPositiveNumber(env, 'GUESS_BURST_PER_SOCKET', 5)
+      }
+    },
+    perRoom: {
+      'drawing:stroke': {
+        ratePerSecond: readPositiveNumber(env, 'STROKE_RATE_PER_ROOM', 60),
+        burst: readPositiveNumber(env, 'STROKE_BURST_PER_ROOM', 120)
+      },
+      'guess:submit': {
+        ratePerSecond: readPositiveNumber(env, 'GUESS_RATE_PER_ROOM', 30),
+        burst: readPositiveNumber(env, 'GUESS_BURST_PER_ROOM', 60)
+      }
+    },
+    maxStrokePoints: readPositiveNumber(env, 'MAX_STROKE_POINTS', 2000),
+    maxGuessLength: readPositiveNumber(env, 'MAX_GUESS_LENGTH', 100),
+    maxPayloadBytes: readPositiveNumber(env, 'MAX_PAYLOAD_BYTES', 100000)
+  };
+}
+
+export class RateLimiter {
+  private socketBuckets: Record<LimitedEvent, Map<string, TokenBucket>> = {
+    'drawing:stroke': new Map(),
+    'guess:submit': new Map()
+  };
+  private roomBuckets: Record<LimitedEvent, Map<string, TokenBucket>> = {
+    'drawing:stroke': new Map(),
+    'guess:submit': new Map()
+  };
+  private stats: RateLimiterStats = {
+    accepted: { 'drawing:stroke': 0, 'guess:submit': 0 },
+    rejected: {
+      'drawing:stroke': { 'socket-rate': 0, 'room-rate': 0, payload: 0 },
+      'guess:submit': { 'socket-rate': 0, 'room-rate': 0, payload: 0 }
+    }
+  };
+
+  constructor(
+    private config: RateLimiterConfig = loadRateLimiterConfig(),
+    private clock: Clock = systemClock
+  ) {}
+
+  get maxPayloadBytes(): number {
+    return this.config.maxPayloadBytes;
+  }
+
+  // Per-socket bucket and payload shape; runs before any room lookup
+  checkSocket(event: LimitedEvent, socketId: string, payload: unknown, now: number = this.clock.now()): boolean {
+    if (!this.isPayloadAllowed(event, payload)) {
+      this.stats.rejected[event].payload++;
+      return false;
+    }
+
+    if (!this.take(this.socketBuckets[event], this.config.perSocket[event], socketId, now)) {
+      this.stats.rejected[event]['socket-rate']++;
+      return false;
+    }
+
+    return true;
+  }
+
+  checkRoom(event: LimitedEvent, roomId: string, now: number = this.clock.now()): boolean {
+    if (!this.take(this.roomBuckets[event], this.config.perRoom[event], roomId, now)) {
+      this.stats.rejected[event]['room-rate']++;
+      return false;
+    }
+
+    this.stats.accepted[event]++;
+    return true;
+  }
+
+  releaseSocket(socketId: string): void {
+    LIMITED_EVENTS.forEach(event => this.socketBuckets[event].delete(socketId));
+  }
+
+  releaseRoom(roomId: string): void {
+    LIMITED_EVENTS.forEach(event => this.roomBuckets[event].delete(roomId));
+  }
+
+  getStats(): RateLimiterStats {
+    return {
+      accepted: { ...this.stats.accepted },
+      rejected: {
+        'drawing:stroke': { ...this.stats.rejected['drawing:stroke'] },
+        'guess:submit': { ...this.stats.rejected['guess:submit'] }
+      }
+    };
+  }
+
+  getRejectedTotal(): number {
+    return LIMITED_EVENTS.reduce((total, event) => {
+      const rejected = this.stats.rejected[event];
+      return total + rejected['socket-rate'] + rejected['room-rate'] + rejected.payload;
+    }, 0);
+  }
+
+  private take(buckets: Map<string, TokenBucket>, config: BucketConfig, key: string, now: number): boolean {
+    let bucket = buckets.get(key);
+    if (!bucket) {
+      bucket = new TokenBucket(config, now);
+      buckets.set(key, bucket);
+    }
+    return bucket.tryRemove(now);
+  }
+
+  private isPayloadAllowed(event: LimitedEvent, payload: unknown): boolean {
+    if (event === 'guess:submit') {
+      return typeof payload === 'string' && payload.length <= this.config.maxGuessLength;
+    }
+
+    return isValidEncodedStroke(payload, this.config.maxStrokePoints);
+  }
+}
@@ -1,10 +1,30 @@
-import { Room, Player, RoomType, Word, DrawingStroke } from '../types';
+import { Room, Player, RoomType, Word, EncodedStroke } from '../types';
 import { v4 as uuidv4 } from 'uuid';
 import { getRandomWords } from './words';
+import { Matchmaker } from './Matchmaker';
+import { Clock, systemClock } from './clock';
+import { ScoreDelta } from './Leaderboard';
+
+const QUICK_PLAY_ROOM_NAME = 'Quick Play';
 
 export class RoomManager {
   private rooms: Map<string, Room> = new Map();
   private playerToRoom: Map<string, string> = new Map();
+  // Spectators are tracked apart from players: they don't count toward maxPlayers and
+  // have no score, turn or guesses
+  private spectators: Map<string, Set<string>> = new Map();
+  private spectatorToRoom: Map<string, string> = new Map();
+  private matchmaker = new Matchmaker();
+  // Strokes undone since the last new stroke, most recent last; only these can be redone
+  private redoStacks: Map<string, number[]> = new Map();
+  // Ids of each room's visible strokes, ascending, so undo pops the newest in O(1)
+  private visibleStrokes: Map<string, number[]> = new Map();
+
+  // onRoundScored receives the points each player earned whenever a round ends
+  constructor(
+    private clock: Clock = systemClock,
+    private onRoundScored: (deltas: ScoreDelta[]) => void = () => {}
+  ) {}
 
   createRoom(roomName: string, roomType: RoomType, hostId: string, hostName: string): Room {
     const roomId = uuidv4();
@@ -34,6 +54,7 @@ export class RoomManager {
       roundStartTime: null,
       correctGuessers: [],
       canvas: [],
+      hiddenStrokes: [],
       hostId: hostId,
       maxPlayers: 15,
       roundDuration: 60
@@ -41,6 +62,7 @@ export class RoomManager {
 
     this.rooms.set(roomId, room);
     this.playerToRoom.set(hostId, roomId);
+    this.matchmaker.update(room);
 
     return room;
   }
@@ -64,35 +86,118 @@ export class RoomManager {
     room.players.push(player);
     room.scores[playerId] = 0;
     this.playerToRoom.set(playerId, roomId);
+    this.matchmaker.update(room);
 
     return { room, player };
   }
 
+  // Place a player into the fullest joinable public room, creating one if none fits
+  quickPlay(playerId: string, playerName: string): { room: Room; player: Player; created: boolean } {
+    const roomId = this.matchmaker.peek();
+    if (roomId) {
+      const result = this.joinRoom(roomId, playerId, playerName);
+      if (result) return { ...result, created: false };
+    }
+
+    const room = this.createRoom(QUICK_PLAY_ROOM_NAME, 'public', playerId, playerName);
+    return { room, player: room.players[0], created: true };
+  }
+
   leaveRoom(playerId: string): { roomId: string; room: Room | null } | null {
-    const roomId = this.playerToRoom.get(playerId);
-    if (!roomId) return null;
+    const [result] = this.leaveRooms([playerId]);
+    return result ? { roomId: result.roomId, room: result.room } : null;
+  }
+
+  // Remove many players at once; each affected room is filtered and re-indexed a single time
+  leaveRooms(playerIds: string[]): Array<{ roomId: string; room: Room | null; playerIds: string[] }> {
+    const leavingByRoom = new Map<string, Set<string>>();
+    for (const playerId of playerIds) {
+      const roomId = this.playerToRoom.get(playerId);
+      if (!roomId || !this.rooms.has(roomId)) continue;
+
+      this.playerToRoom.delete(playerId);
+      let leaving = leavingByRoom.get(roomId);
+      if (!leaving) {
+        leaving = new Set();
+        leavingByRoom.set(roomId, leaving);
+      }
+      leaving.add(playerId);
+    }
+
+    const results: Array<{ roomId: string; room: Room | null; playerIds: string[] }> = [];
+    for (const [roomId, leaving] of leavingByRoom) {
+      const room = this.rooms.get(roomId)!;
+
+      room.players = room.players.filter(p => !leaving.has(p.id));
+      for (const playerId of leaving) {
+        delete room.scores[playerId];
+      }
+
+      // Reassign host if host left
+      if (leaving.has(room.hostId) && room.players.length > 0) {
+        const newHost = room.players[0];
+        newHost.isHost = true;
+        room.hostId = newHost.id;
+      }
+
+      // Delete room if empty
+      if (room.players.length === 0) {
+        this.rooms.delete(roomId);
+        this.matchmaker.remove(roomId);
+        this.redoStacks.delete(roomId);
+        this.visibleStrokes.delete(roomId);
+        this.spectators.get(roomId)?.forEach(spectatorId => this.spectatorToRoom.delete(spectatorId));
+        this.spectators.delete(roomId);
+        results.push({ roomId, room: null, playerIds: Array.from(leaving) });
+        continue;
+      }
+
+      this.matchmaker.update(room);
+      results.push({ roomId, room, playerIds: Array.from(leaving) });
+    }
+
+    return results;
+  }
 
+  spectateRoom(roomId: string, spectatorId: string): Room | null {
     const room = this.rooms.get(roomId);
     if (!room) return null;
 
-    room.players = room.players.filter(p => p.id !== playerId);
-    delete room.scores[playerId];
-    this.playerToRoom.delete(playerId);
-
-    // Reassign host if host left
-    if (room.hostId === playerId && room.players.length > 0) {
-      const newHost = room.players[0];
-      newHost.isHost = true;
-      room.hostId = newHost.id;
+    this.stopSpectating([spectatorId]);
+    let spectators = this.spectators.get(roomId);
+    if (!spectators) {
+      spectators = new Set();
+      this.spectators.set(roomId, spectators);
     }
+    spectators.add(spectatorId);
+    this.spectatorToRoom.set(spectatorId, roomId);
+
+    return room;
+  }
+
+  // Returns the rooms the given spectators left, with how many spectators each still has
+  stopSpectating(spectatorIds: string[]): Array<{ roomId: string; remaining: number }> {
+    const left = new Set<string>();
+    for (const spectatorId of spectatorIds) {
+      const roomId = this.spectatorToRoom.get(spectatorId);
+      if (!roomId) continue;
 
-    // Delete room if empty
-    if (room.players.length === 0) {
-      this.rooms.delete(roomId);
-      return { roomId, room: null };
+      this.spectatorToRoom.delete(spectatorId);
+      this.spectators.get(roomId)?.delete(spectatorId);
+      left.add(roomId);
     }
 
-    return { roomId, room };
+    return Array.from(left, roomId => {
+      const remaining = this.spectators.get(roomId)?.size ?? 0;
+      if (remaining === 0) {
+        this.spectators.delete(roomId);
+      }
+      return { roomId, remaining };
+    });
+  }
+
+  getSpectatorCount(roomId: string): number {
+    return this.spectators.get(roomId)?.size ?? 0;
   }
 
   getRoom(roomId: string): Room | undefined {
@@ -104,6 +209,24 @@ export class RoomManager {
     return roomId ? this.rooms.get(roomId) : undefined;
   }
 
+  getStats(): { rooms: number; players: number; spectators: number; joinableRooms: number } {
+    return {
+      rooms: this.rooms.size,
+      players: this.playerToRoom.size,
+      spectators: this.spectatorToRoom.size,
+      joinableRooms: this.matchmaker.size
+    };
+  }
+
+  // Games between start and game-end, i.e. what a drain waits for
+  getActiveGameCount(): number {
+    let active = 0;
+    this.rooms.forEach(room => {
+      if (room.gameState !== 'waiting' && room.gameState !== 'game-end') active++;
+    });
+    return active;
+  }
+
   getPublicRooms(): Array<{ id: string; name: string; playerCount: number; gameState: string }> {
     return Array.from(this.rooms.values())
       .filter(room => room.type === 'public')
@@ -126,7 +249,8 @@ export class RoomManager {
     room.gameState = 'word-selection';
     room.currentDrawer = room.turnOrder[0];
     room.wordChoices = getRandomWords();
-    room.canvas = [];
+    this.resetCanvas(room);
+    this.matchmaker.remove(roomId);
 
     return room;
   }
@@ -138,26 +262,70 @@ export class RoomManager {
     room.selectedWord = word;
     room.currentWord = word;
     room.gameState = 'drawing';
-    room.roundStartTime = Date.now();
+    room.roundStartTime = this.clock.now();
     room.correctGuessers = [];
 
     return room;
   }
 
-  addStroke(roomId: string, stroke: DrawingStroke): void {
+  // A stroke's id is its index in room.canvas; undone strokes stay in place as
+  // tombstones (hiddenStrokes) so ids never shift
+  addStroke(roomId: string, stroke: EncodedStroke): number | null {
     const room = this.rooms.get(roomId);
-    if (room) {
-      room.canvas.push(stroke);
+    if (!room) return null;
+
+    room.canvas.push(stroke);
+    this.redoStacks.delete(roomId);
+    const id = room.canvas.length - 1;
+    const visible = this.visibleStrokes.get(roomId);
+    if (visible) {
+      visible.push(id);
+    } else {
+      this.visibleStrokes.set(roomId, [id]);
     }
+    return id;
+  }
+
+  // Hide the newest visible stroke; returns its id, or null when there is nothing to undo
+  undoStroke(roomId: string): number | null {
+    const room = this.rooms.get(roomId);
+    const id = this.visibleStrokes.get(roomId)?.pop();
+    if (!room || id === undefined) return null;
+
+    room.hiddenStrokes.push(id);
+    const redoStack = this.redoStacks.get(roomId) || [];
+    redoStack.push(id);
+    this.redoStacks.set(roomId, redoStack);
+    return id;
+  }
+
+  // Restore the most recently undone stroke, unless a new stroke was drawn since
+  redoStroke(roomId: string): number | null {
+    const room = this.rooms.get(roomId);
+    const id = this.redoStacks.get(roomId)?.pop();
+    if (!room || id === undefined) return null;
+
+    // hiddenStrokes is in undo order and the redo stack empties whenever a stroke is drawn,
+    // so the stroke to restore is the last one hidden, and newer than every visible one
+    room.hiddenStrokes.pop();
+    this.visibleStrokes.get(roomId)!.push(id);
+    return id;
   }
 
   clearCanvas(roomId: string): void {
     const room = this.rooms.get(roomId);
     if (room) {
-      room.canvas = [];
+      this.resetCanvas(room);
     }
   }
 
+  private resetCanvas(room: Room): void {
+    room.canvas = [];
+    room.hiddenStrokes = [];
+    this.redoStacks.delete(room.id);
+    this.visibleStrokes.delete(room.id);
+  }
+
   submitGuess(roomId: string, playerId: string, guess: string): boolean {
     const room = this.rooms.get(roomId);
     if (!room || !room.currentWord) return false;
@@ -171,30 +339,50 @@ export class RoomManager {
     return isCorrect;
   }
 
+  // A round is scored once, and only for players in the room: the list comes from the
+  // drawer and its scores feed the process-wide leaderboard
   endRound(roomId: string, selectedGuessers: string[]): Room | null {
     const room = this.rooms.get(roomId);
-    if (!room || !room.currentWord) return null;
+    if (!room || !room.currentWord || room.gameState !== 'drawing') return null;
+
+    const points = room.currentWord.points;
+    const earned = new Map<string, number>();
+    const selected = new Set(selectedGuessers);
+    const guessers = room.players
+      .filter(player => player.id !== room.currentDrawer && selected.has(player.id))
+      .map(player => player.id);
 
     // Award points to drawer if anyone guessed correctly
-    if (selectedGuessers.length > 0 && room.currentDrawer) {
-      room.scores[room.currentDrawer] = (room.scores[room.currentDrawer] || 0) + room.currentWord.points;
+    if (guessers.length > 0 && room.currentDrawer) {
+      earned.set(room.currentDrawer, points);
     }
 
     // Award points to correct guessers
-    selectedGuessers.forEach(playerId => {
-      if (room.currentWord) {
-        room.scores[playerId] = (room.scores[playerId] || 0) + room.currentWord.points;
-      }
+    guessers.forEach(playerId => {
+      earned.set(playerId, points);
+    });
+
+    earned.forEach((delta, playerId) => {
+      room.scores[playerId] = (room.scores[playerId] || 0) + delta;
     });
 
     // Update player scores
+    const deltas: ScoreDelta[] = [];
     room.players.forEach(player => {
       player.score = room.scores[player.id] || 0;
+      const delta = earned.get(player.id);
+      if (delta) {
+        deltas.push({ playerId: player.id, name: player.name, points: delta });
+      }
     });
 
     room.gameState = 'round-end';
     room.roundStartTime = null;
 
+    if (deltas.length > 0) {
+      this.onRoundScored(deltas);
+    }
+
     return room;
   }
 
@@ -216,17 +404,30 @@ export class RoomManager {
     room.wordChoices = getRandomWords();
     room.currentWord = null;
     room.selectedWord = null;
-    room.canvas = [];
+    this.resetCanvas(room);
     room.correctGuessers = [];
 
     return room;
   }
 
+  // End the game after the current round, e.g. when the server is draining
+  endGame(roomId: string): Room | null {
+    const room = this.rooms.get(roomId);
+    if (!room) return null;
+
+    room.gameState = 'game-end';
+    return room;
+  }
+
+  // Highest score wins; ties go to whoever joined first
   getWinner(roomId: string): string | null {
     const room = this.rooms.get(roomId);
     if (!room) return null;
 
-    const sortedPlayers = [...room.players].sort((a, b) => b.score - a.score);
-    return sortedPlayers[0]?.id || null;
+    let winner: Player | null = null;
+    for (const player of room.players) {
+      if (!winner || player.score > winner.score) winner = player;
+    }
+    return winner?.id || null;
   }
 }
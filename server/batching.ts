@@ -0,0 +1,105 @@
+import { CancelTimer, Clock, systemClock } from './clock';
+import { readNumber } from './config';
+
+export interface BatchingConfig {
+  disconnectBatchMs: number;
+  roomsListIntervalMs: number;
+  guessBatchMs: number;
+}
+
+// Zero is allowed: disconnects then flush on the next timer tick and rooms:list is sent unthrottled
+export function loadBatchingConfig(env: NodeJS.ProcessEnv = process.env): BatchingConfig {
+  return {
+    disconnectBatchMs: readNumber(env, 'DISCONNECT_BATCH_MS', 50),
+    roomsListIntervalMs: readNumber(env, 'ROOMS_LIST_INTERVAL_MS', 250),
+    guessBatchMs: readNumber(env, 'GUESS_BATCH_MS', 50)
+  };
+}
+
+// Collects disconnects that arrive close together (e.g. a network partition) and hands
+// them over as one batch, so each affected room is updated and broadcast once
+export class DisconnectBatcher {
+  private pending: string[] = [];
+  private cancelFlush: CancelTimer | null = null;
+  private batches = 0;
+  private largestBatch = 0;
+
+  constructor(
+    private flush: (playerIds: string[]) => void,
+    private windowMs: number,
+    private clock: Clock = systemClock
+  ) {}
+
+  add(playerId: string): void {
+    this.pending.push(playerId);
+    if (!this.cancelFlush) {
+      this.cancelFlush = this.clock.setTimeout(() => this.drain(), this.windowMs);
+    }
+  }
+
+  drain(): void {
+    if (this.cancelFlush) {
+      this.cancelFlush();
+      this.cancelFlush = null;
+    }
+    if (this.pending.length === 0) return;
+
+    const batch = this.pending;
+    this.pending = [];
+    this.batches++;
+    this.largestBatch = Math.max(this.largestBatch, batch.length);
+    this.flush(batch);
+  }
+
+  getStats(): { pending: number; batches: number; largestBatch: number } {
+    return { pending: this.pending.length, batches: this.batches, largestBatch: this.largestBatch };
+  }
+}
+
+// Runs a task at most once per interval; requests inside the interval collapse into a
+// single trailing run, so bursts of lobby changes produce one rooms:list broadcast
+export class ThrottledTask {
+  private lastRunAt = -Infinity;
+  private cancelTrailing: CancelTimer | null = null;
+  private requested = 0;
+  private runs = 0;
+
+  constructor(
+    private task: () => void,
+    private intervalMs: number,
+    private clock: Clock = systemClock
+  ) {}
+
+  request(): void {
+    this.requested++;
+    if (this.cancelTrailing) return;
+
+    const wait = this.lastRunAt + this.intervalMs - this.clock.now();
+    if (wait <= 0) {
+      this.run();
+      return;
+    }
+
+    this.cancelTrailing = this.clock.setTimeout(() => {
+      this.cancelTrailing = null;
+      this.run();
+    }, wait);
+  }
+
+  cancel(): void {
+    if (this.cancelTrailing) {
+      this.cancelTrailing();
+      this.cancelTrailing = null;
+    }
+  }
+
+  getStats(): { requested: number; runs: number } {
+    return { requested: this.requested, runs: this.runs };
+  }
+
+  private run(): void {
+    this.lastRunAt = this.clock.now();
+    this.runs++;
+    this.task();
+  }
+}
@@ -0,0 +1,164 @@
+import { IncomingMessage, ServerResponse } from 'http';
+
+export type CancelTimer = () => void;
+
+export interface Clock {
+  readonly mode: 'system' | 'scaled' | 'manual';
+  now(): number;
+  setTimeout(callback: () => void, ms: number): CancelTimer;
+  setInterval(callback: () => void, ms: number): CancelTimer;
+}
+
+export const systemClock: Clock = {
+  mode: 'system',
+  now: () => Date.now(),
+  setTimeout: (callback, ms) => {
+    const timeout = setTimeout(callback, ms);
+    return () => clearTimeout(timeout);
+  },
+  setInterval: (callback, ms) => {
+    const interval = setInterval(callback, ms);
+    return () => clearInterval(interval);
+  }
+};
+
+// Runs game time `scale` times faster than wall time (test only)
+export class ScaledClock implements Clock {
+  readonly mode = 'scaled';
+  private origin = Date.now();
+
+  constructor(readonly scale: number) {}
+
+  now(): number {
+    return this.origin + (Date.now() - this.origin) * this.scale;
+  }
+
+  setTimeout(callback: () => void, ms: number): CancelTimer {
+    return systemClock.setTimeout(callback, ms / this.scale);
+  }
+
+  setInterval(callback: () => void, ms: number): CancelTimer {
+    return systemClock.setInterval(callback, ms / this.scale);
+  }
+}
+
+interface ManualTimer {
+  id: number;
+  due: number;
+  interval: number | null;
+  callback: () => void;
+}
+
+// Time only moves when advance() is called (test only)
+export class ManualClock implements Clock {
+  readonly mode = 'manual';
+  private current: number;
+  private timers: ManualTimer[] = [];
+  private nextId = 0;
+
+  constructor(start: number = Date.now()) {
+    this.current = start;
+  }
+
+  now(): number {
+    return this.current;
+  }
+
+  setTimeout(callback: () => void, ms: number): CancelTimer {
+    return this.schedule(callback, ms, null);
+  }
+
+  setInterval(callback: () => void, ms: number): CancelTimer {
+    return this.schedule(callback, ms, Math.max(ms, 1));
+  }
+
+  get pendingTimers(): number {
+    return this.timers.length;
+  }
+
+  // Fire every timer due within the next `ms`, in due order, moving time along with them
+  advance(ms: number): void {
+    const target = this.current + Math.max(ms, 0);
+
+    for (;;) {
+      let next: ManualTimer | undefined;
+      for (const timer of this.timers) {
+        if (timer.due <= target && (!next || timer.due < next.due || (timer.due === next.due && timer.id < next.id))) {
+          next = timer;
+        }
+      }
+      if (!next) break;
+
+      this.current = next.due;
+      if (next.interval === null) {
+        this.cancel(next.id);
+      } else {
+        next.due += next.interval;
+      }
+      next.callback();
+    }
+
+    this.current = target;
+  }
+
+  private schedule(callback: () => void, ms: number, interval: number | null): CancelTimer {
+    const id = this.nextId++;
+    this.timers.push({ id, due: this.current + Math.max(ms, 0), interval, callback });
+    return () => this.cancel(id);
+  }
+
+  private cancel(id: number): void {
+    this.timers = this.timers.filter(timer => timer.id !== id);
+  }
+}
+
+// TEST_CLOCK=scaled:<factor> or TEST_CLOCK=manual; ignored in production
+export function createClock(env: NodeJS.ProcessEnv = process.env): Clock {
+  const setting = env.TEST_CLOCK;
+  if (!setting) return systemClock;
+
+  if (env.NODE_ENV === 'production') {
+    console.warn('Ignoring TEST_CLOCK in production');
+    return systemClock;
+  }
+
+  if (setting === 'manual') {
+    return new ManualClock();
+  }
+
+  const [mode, factor] = setting.split(':');
+  const scale = Number(factor);
+  if (mode === 'scaled' && Number.isFinite(scale) && scale > 0) {
+    return new ScaledClock(scale);
+  }
+
+  console.warn(`Unknown TEST_CLOCK setting "${setting}", using system clock`);
+  return systemClock;
+}
+
+// Test-only control endpoints: GET /__test/clock and POST /__test/clock/advance?ms=N
+export function handleClockRequest(clock: Clock, req: IncomingMessage, res: ServerResponse): boolean {
+  if (clock.mode === 'system' || !req.url?.startsWith('/__test/clock')) return false;
+
+  const url = new URL(req.url, 'http://localhost');
+
+  if (req.method === 'POST' && url.pathname === '/__test/clock/advance') {
+    const ms = Number(url.searchParams.get('ms'));
+    if (!(clock instanceof ManualClock) || !Number.isFinite(ms) || ms < 0) {
+      res.writeHead(400, { 'Content-Type': 'application/json' });
+      res.end(JSON.stringify({ error: 'Manual clock and non-negative ms required' }));
+      return true;
+    }
+    clock.advance(ms);
+  } else if (req.method !== 'GET' || url.pathname !== '/__test/clock') {
+    return false;
+  }
+
+  res.writeHead(200, { 'Content-Type': 'application/json' });
+  res.end(JSON.stringify({
+    mode: clock.mode,
+    now: clock.now(),
+    scale: clock instanceof ScaledClock ? clock.scale : 1
+  }));
+  return true;
+}
@@ -0,0 +1,212 @@
+import { Buffer } from 'buffer';
+import { deflateRawSync } from 'zlib';
+import { ServerToClientEvents } from '../types';
+import { readNumber } from './config';
+
+export type OutgoingEvent = keyof ServerToClientEvents;
+
+export interface CompressionConfig {
+  enabled: boolean;
+  thresholdBytes: number;
+  level: number;
+  // Size every socket's deflate context: zlib keeps 2^(windowBits + 2) + 2^(memLevel + 9)
+  // bytes per compressing socket, outside the JS heap
+  windowBits: number;
+  memLevel: number;
+  contextTakeover: boolean;
+  neverCompress: OutgoingEvent[];
+  sampleEvery: number;
+}
+
+export interface EventCompressionStats {
+  messages: number;
+  bytes: number;
+  eligibleMessages: number;
+  eligibleBytes: number;
+  sampledBytes: number;
+  sampledCompressedBytes: number;
+  sampledCpuMs: number;
+}
+
+// Strokes are already quantized binary, arrive many times a second and sit on the
+// draw-to-paint path, so deflating them costs more latency than it saves bytes. Clock
+// pongs are far below any sensible threshold; listing them skips the size check.
+const DEFAULT_NEVER_COMPRESS: OutgoingEvent[] = ['drawing:stroke', 'clock:pong'];
+
+// Field names and enum values every Room snapshot repeats. Browsers cannot take a preset
+// dictionary over permessage-deflate, so on the wire the same effect comes from context
+// takeover (each message is compressed against the ones before it); the dictionary only
+// lets the sampled estimate reflect that steady state. Other events look nothing like a
+// room, so their samples are deflated without it rather than credited with its savings.
+const ROOM_DICTIONARY = Buffer.from(
+  '{"room":{"id":"","name":"","type":"public","players":[{"id":"","name":"","score":0,' +
+  '"isHost":false,"connected":true}],"gameState":"waiting","currentDrawer":null,' +
+  '"currentWord":null,"selectedWord":null,"wordChoices":[],"turnOrder":[],"currentTurnIndex":0,' +
+  '"scores":{},"roundTimer":60,"roundStartTime":null,"correctGuessers":[],"canvas":[],' +
+  '"hiddenStrokes":[],"hostId":"","maxPlayers":15,"roundDuration":60},"playerId":""}'
+);
+
+const ROOM_EVENTS: ReadonlySet<string> = new Set<OutgoingEvent>([
+  'room:created', 'room:joined', 'room:updated', 'room:spectating', 'room:delta', 'game:started'
+]);
+
+// The event name of a socket.io packet. Type, attachment count, namespace and ack id come
+// before the payload array, whose first element is the name.
+const eventName = (packet: string): string => {
+  const start = packet.indexOf('["');
+  const end = start === -1 ? -1 : packet.indexOf('"', start + 2);
+  return end === -1 ? 'unknown' : packet.slice(start + 2, end);
+};
+
+export function loadCompressionConfig(env: NodeJS.ProcessEnv = process.env): CompressionConfig {
+  return {
+    enabled: env.COMPRESSION_ENABLED !== 'false',
+    thresholdBytes: readNumber(env, 'COMPRESSION_THRESHOLD_BYTES', 1024),
+    level: Math.min(readNumber(env, 'COMPRESSION_LEVEL', 1), 9),
+    // 4 KB windows still span a whole room snapshot; zlib's defaults (15, 8) cost 256 KB
+    windowBits: Math.min(Math.max(Math.floor(readNumber(env, 'COMPRESSION_WINDOW_BITS', 12)), 9), 15),
+    memLevel: Math.min(Math.max(Math.floor(readNumber(env, 'COMPRESSION_MEM_LEVEL', 5)), 1), 9),
+    contextTakeover: env.COMPRESSION_CONTEXT_TAKEOVER !== 'false',
+    neverCompress: env.COMPRESSION_NEVER !== undefined
+      ? env.COMPRESSION_NEVER.split(',').map(event => event.trim()).filter(Boolean) as OutgoingEvent[]
+      : DEFAULT_NEVER_COMPRESS,
+    sampleEvery: Math.max(Math.floor(readNumber(env, 'COMPRESSION_SAMPLE_EVERY', 20)), 1)
+  };
+}
+
+// Options for the Server's permessage-deflate; messages under the threshold are sent as-is
+export function perMessageDeflateOptions(config: CompressionConfig) {
+  if (!config.enabled) return false;
+
+  return {
+    threshold: config.thresholdBytes,
+    zlibDeflateOptions: { level: config.level, memLevel: config.memLevel },
+    serverMaxWindowBits: config.windowBits,
+    serverNoContextTakeover: !config.contextTakeover,
+    // Client messages are small; not keeping their window saves an inflate context per socket
+    clientNoContextTakeover: true
+  };
+}
+
+const toBuffer = (data: string | ArrayBuffer | ArrayBufferView): Buffer => {
+  if (typeof data === 'string') return Buffer.from(data);
+  if (data instanceof ArrayBuffer) return Buffer.from(data);
+  return Buffer.from(data.buffer, data.byteOffset, data.byteLength);
+};
+
+interface OutgoingPacket {
+  type: string;
+  data?: unknown;
+  options?: { compress?: boolean };
+}
+
+export interface ObservableSocket {
+  on(event: 'packetCreate', listener: (packet: OutgoingPacket) => void): unknown;
+  on(event: 'close', listener: () => void): unknown;
+}
+
+// Decides which events may be compressed and estimates what compression buys: every
+// outgoing message is counted, and every Nth message that would be deflated is deflated
+// again here to measure the ratio and CPU cost, which are then extrapolated per event
+export class CompressionPolicy {
+  private never: Set<string>;
+  private stats: Map<string, EventCompressionStats> = new Map();
+  // Sockets that have deflated at least once and so hold a zlib context until they close
+  private compressingSockets = 0;
+
+  constructor(private config: CompressionConfig = loadCompressionConfig()) {
+    this.never = new Set(config.neverCompress);
+  }
+
+  shouldCompress(event: OutgoingEvent): boolean {
+    return this.config.enabled && !this.never.has(event);
+  }
+
+  // Binary attachments follow their placeholder packet, so they are billed to its event
+  observe(socket: ObservableSocket): void {
+    let lastEvent = 'unknown';
+    let compressing = false;
+    socket.on('packetCreate', (packet) => {
+      if (packet.type !== 'message') return;
+
+      let deflated = false;
+      if (typeof packet.data === 'string') {
+        lastEvent = eventName(packet.data);
+        deflated = this.record(lastEvent, packet.data, packet.options?.compress !== false);
+      } else if (packet.data instanceof ArrayBuffer || ArrayBuffer.isView(packet.data)) {
+        deflated = this.record(lastEvent, packet.data, packet.options?.compress !== false);
+      }
+
+      if (deflated && !compressing) {
+        compressing = true;
+        this.compressingSockets++;
+      }
+    });
+    socket.on('close', () => {
+      if (compressing) this.compressingSockets--;
+    });
+  }
+
+  // Returns whether the message goes through deflate on the wire
+  record(event: string, data: string | ArrayBuffer | ArrayBufferView, compress: boolean): boolean {
+    let stats = this.stats.get(event);
+    if (!stats) {
+      stats = { messages: 0, bytes: 0, eligibleMessages: 0, eligibleBytes: 0, sampledBytes: 0, sampledCompressedBytes: 0, sampledCpuMs: 0 };
+      this.stats.set(event, stats);
+    }
+
+    // Counting runs for every packet, so it only measures; a copy is made for samples alone
+    const length = typeof data === 'string' ? Buffer.byteLength(data) : data.byteLength;
+    stats.messages++;
+    stats.bytes += length;
+
+    if (!this.config.enabled || !compress || length < this.config.thresholdBytes) return false;
+
+    stats.eligibleBytes += length;
+    if (stats.eligibleMessages++ % this.config.sampleEvery !== 0) return true;
+
+    const started = process.hrtime.bigint();
+    const compressed = deflateRawSync(toBuffer(data), {
+      level: this.config.level,
+      windowBits: this.config.windowBits,
+      memLevel: this.config.memLevel,
+      dictionary: this.config.contextTakeover && ROOM_EVENTS.has(event) ? ROOM_DICTIONARY : undefined
+    });
+    stats.sampledCpuMs += Number(process.hrtime.bigint() - started) / 1e6;
+    stats.sampledBytes += length;
+    stats.sampledCompressedBytes += compressed.length;
+    return true;
+  }
+
+  getStats() {
+    const events: Record<string, EventCompressionStats & { estimatedSavedBytes: number; estimatedCpuMs: number }> = {};
+    let savedBytes = 0;
+    let cpuMs = 0;
+    let bytes = 0;
+
+    this.stats.forEach((stats, event) => {
+      const scale = stats.sampledBytes > 0 ? stats.eligibleBytes / stats.sampledBytes : 0;
+      const estimatedSavedBytes = Math.round((stats.sampledBytes - stats.sampledCompressedBytes) * scale);
+      const estimatedCpuMs = stats.sampledCpuMs * scale;
+      events[event] = { ...stats, estimatedSavedBytes, estimatedCpuMs };
+      savedBytes += estimatedSavedBytes;
+      cpuMs += estimatedCpuMs;
+      bytes += stats.bytes;
+    });
+
+    return {
+      enabled: this.config.enabled,
+      thresholdBytes: this.config.thresholdBytes,
+      level: this.config.level,
+      contextTakeover: this.config.contextTakeover,
+      compressingSockets: this.compressingSockets,
+      estimatedDeflateMemoryBytes:
+        this.compressingSockets * (2 ** (this.config.windowBits + 2) + 2 ** (this.config.memLevel + 9)),
+      bytes,
+      estimatedSavedBytes: savedBytes,
+      estimatedCpuMs: cpuMs,
+      savedBytesPerCpuMs: cpuMs > 0 ? savedBytes / cpuMs : 0,
+      events
+    };
+  }
+}
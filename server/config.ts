@@ -0,0 +1,12 @@
+// Shared by the load*Config functions: a missing, non-numeric or negative variable falls
+// back to the default
+export const readNumber = (env: NodeJS.ProcessEnv, key: string, fallback: number): number => {
+  const value = Number(env[key]);
+  return env[key] !== undefined && Number.isFinite(value) && value >= 0 ? value : fallback;
+};
+
+// For rates and sizes where zero would disable the limit rather than configure it
+export const readPositiveNumber = (env: NodeJS.ProcessEnv, key: string, fallback: number): number => {
+  const value = readNumber(env, key, fallback);
+  return value > 0 ? value : fallback;
+};
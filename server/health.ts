@@ -0,0 +1,70 @@
+import { IncomingMessage, ServerResponse } from 'http';
+import { readNumber } from './config';
+
+export interface DrainConfig {
+  timeoutMs: number;
+  pollMs: number;
+}
+
+// A round lasts 60s plus the 5s pause before the next one, so two minutes lets any round
+// that is running when the drain starts end normally
+export function loadDrainConfig(env: NodeJS.ProcessEnv = process.env): DrainConfig {
+  return {
+    timeoutMs: readNumber(env, 'DRAIN_TIMEOUT_MS', 120000),
+    pollMs: readNumber(env, 'DRAIN_POLL_MS', 1000)
+  };
+}
+
+// Serving until a drain starts; draining until no round is in flight (or the timeout
+// passes), then stopped. Liveness stays green throughout, readiness goes red at once so
+// load balancers send new players to the next instance.
+export class Lifecycle {
+  private draining = false;
+  private startedAt = Date.now();
+
+  get isDraining(): boolean {
+    return this.draining;
+  }
+
+  // Resolves once `activeRounds` reports zero or the timeout passes; the caller then
+  // closes the server. Real time on purpose: a scaled test clock must not cut it short.
+  drain(activeRounds: () => number, config: DrainConfig): Promise<{ activeRounds: number; timedOut: boolean }> {
+    this.draining = true;
+    const deadline = Date.now() + config.timeoutMs;
+
+    return new Promise(resolve => {
+      const check = () => {
+        const remaining = activeRounds();
+        if (remaining === 0 || Date.now() >= deadline) {
+          resolve({ activeRounds: remaining, timedOut: remaining > 0 });
+          return;
+        }
+        setTimeout(check, config.pollMs);
+      };
+      check();
+    });
+  }
+
+  get uptimeMs(): number {
+    return Date.now() - this.startedAt;
+  }
+}
+
+const respond = (res: ServerResponse, status: number, body: Record<string, unknown>) => {
+  res.writeHead(status, { 'Content-Type': 'application/json', 'Cache-Control': 'no-store' });
+  res.end(JSON.stringify(body));
+};
+
+export function handleHealthRequest(lifecycle: Lifecycle, req: IncomingMessage, res: ServerResponse): boolean {
+  if (req.method !== 'GET' && req.method !== 'HEAD') return false;
+
+  if (req.url === '/healthz') {
+    respond(res, 200, { status: 'ok', uptimeMs: lifecycle.uptimeMs });
+    return true;
+  }
+  if (req.url === '/readyz') {
+    respond(res, lifecycle.isDraining ? 503 : 200, { status: lifecycle.isDraining ? 'draining' : 'ready' });
+    return true;
+  }
+  return false;
+}
@@ -1,11 +1,38 @@
 import { createServer } from 'http';
 import { Server, Socket } from 'socket.io';
-import { ServerToClientEvents, ClientToServerEvents } from '../types';
+import { ServerToClientEvents, ClientToServerEvents, Room } from '../types';
 import { RoomManager } from './RoomManager';
+import { RateLimiter, loadRateLimiterConfig } from './RateLimiter';
+import { CancelTimer, createClock, handleClockRequest } from './clock';
+import { ServerMetrics, handleMetricsRequest } from './metrics';
+import { DisconnectBatcher, ThrottledTask, loadBatchingConfig } from './batching';
+import { CompressionPolicy, loadCompressionConfig, perMessageDeflateOptions } from './compression';
+import { SpectatorFanout, loadSpectatorConfig, spectatorChannel, spectatorView } from './spectators';
+import { Lifecycle, handleHealthRequest, loadDrainConfig } from './health';
+import { Leaderboard, loadLeaderboardConfig } from './Leaderboard';
+import { EventValidator, rejectionMessage } from './validation';
+import { GuessPipeline } from './GuessPipeline';
 
 const PORT = process.env.PORT || 3001;
+const NEXT_ROUND_DELAY_MS = 5000;
+const DRAINING_MESSAGE = 'Server is restarting, please try again in a moment';
 
-const httpServer = createServer();
+const clock = createClock();
+const metrics = new ServerMetrics();
+const lifecycle = new Lifecycle();
+
+const httpServer = createServer((req, res) => {
+  if (handleHealthRequest(lifecycle, req, res)) return;
+  if (handleMetricsRequest(metrics, req, res)) return;
+  if (handleClockRequest(clock, req, res)) return;
+
+  res.writeHead(404);
+  res.end();
+});
+const rateLimiter = new RateLimiter(loadRateLimiterConfig(), clock);
+const compressionConfig = loadCompressionConfig();
+const compression = new CompressionPolicy(compressionConfig);
+const validator = new EventValidator();
 
 const io = new Server<ClientToServerEvents, ServerToClientEvents>(httpServer, {
   cors: {
@@ -13,24 +40,92 @@ const io = new Server<ClientToServerEvents, ServerToClientEvents>(httpServer, {
       ? process.env.CLIENT_URL || 'http://localhost:3000'
       : '*',
     methods: ['GET', 'POST']
-  }
+  },
+  maxHttpBufferSize: rateLimiter.maxPayloadBytes,
+  perMessageDeflate: perMessageDeflateOptions(compressionConfig)
 });
-
-const roomManager = new RoomManager();
-const timerIntervals = new Map<string, NodeJS.Timeout>();
+io.engine.on('connection', (rawSocket) => compression.observe(rawSocket));
+
+const leaderboardConfig = loadLeaderboardConfig();
+const leaderboard = new Leaderboard(leaderboardConfig, clock);
+const roomManager = new RoomManager(clock, deltas => leaderboard.record(deltas));
+const roundTimers = new Map<string, CancelTimer>();
+const nextRoundTimers = new Map<string, CancelTimer>();
+
+const batchingConfig = loadBatchingConfig();
+const disconnectBatcher = new DisconnectBatcher(removePlayers, batchingConfig.disconnectBatchMs, clock);
+const roomsListBroadcast = new ThrottledTask(
+  () => io.emit('rooms:list', roomManager.getPublicRooms()),
+  batchingConfig.roomsListIntervalMs,
+  clock
+);
+
+const guessPipeline = new GuessPipeline(
+  roomManager,
+  {
+    result: (playerId, result) => io.sockets.sockets.get(playerId)?.emit('guess:result', result),
+    correct: (drawerId, guessers) => io.sockets.sockets.get(drawerId)?.emit('guess:correct', guessers)
+  },
+  batchingConfig.guessBatchMs,
+  clock
+);
+
+const spectatorConfig = loadSpectatorConfig();
+const spectatorFanout = new SpectatorFanout(
+  {
+    strokes: (roomId, packed) => io.to(spectatorChannel(roomId)).emit('spectate:strokes', packed),
+    delta: (roomId, delta) => io.to(spectatorChannel(roomId)).emit('room:delta', delta)
+  },
+  spectatorConfig.flushMs,
+  clock
+);
+
+metrics.addSource('game', () => ({
+  ...roomManager.getStats(),
+  sockets: io.engine.clientsCount,
+  roundTimers: roundTimers.size,
+  nextRoundTimers: nextRoundTimers.size,
+  draining: lifecycle.isDraining,
+  disconnects: disconnectBatcher.getStats(),
+  roomsListBroadcasts: roomsListBroadcast.getStats()
+}));
+metrics.addSource('rateLimiter', () => rateLimiter.getStats());
+metrics.addSource('validation', () => validator.getStats());
+metrics.addSource('compression', () => compression.getStats());
+metrics.addSource('spectators', () => spectatorFanout.getStats());
+metrics.addSource('leaderboard', () => leaderboard.getStats());
+metrics.addSource('guesses', () => guessPipeline.getStats());
 
 io.on('connection', (socket: Socket<ClientToServerEvents, ServerToClientEvents>) => {
   console.log('Client connected:', socket.id);
 
+  // Every packet's arguments are checked before any handler runs; malformed ones are dropped
+  socket.use((packet, next) => {
+    if (validator.isValid(packet)) {
+      next();
+      return;
+    }
+
+    // Answer a waiting ack too, so e.g. a drawer never keeps a stroke the server dropped
+    const ack = packet[packet.length - 1];
+    if (typeof ack === 'function') ack(null);
+    socket.emit('error', rejectionMessage(packet));
+  });
+
   // Create room
   socket.on('room:create', ({ roomName, roomType, playerName }) => {
+    if (lifecycle.isDraining) {
+      socket.emit('error', DRAINING_MESSAGE);
+      return;
+    }
+
     try {
       const room = roomManager.createRoom(roomName, roomType, socket.id, playerName);
       socket.join(room.id);
       socket.emit('room:created', { roomId: room.id, room });
 
       if (roomType === 'public') {
-        io.emit('rooms:list', roomManager.getPublicRooms());
+        roomsListBroadcast.request();
       }
     } catch (error) {
       socket.emit('error', error instanceof Error ? error.message : 'Failed to create room');
@@ -49,19 +144,67 @@ io.on('connection', (socket: Socket<ClientToServerEvents, ServerToClientEvents>)
       socket.join(roomId);
       socket.emit('room:joined', { room: result.room, playerId: socket.id });
       io.to(roomId).emit('room:player-joined', result.player);
-      io.to(roomId).emit('room:updated', result.room);
+      broadcastRoom(result.room);
 
       if (result.room.type === 'public') {
-        io.emit('rooms:list', roomManager.getPublicRooms());
+        roomsListBroadcast.request();
       }
     } catch (error) {
       socket.emit('error', error instanceof Error ? error.message : 'Failed to join room');
     }
   });
 
-  // Leave room
+  // Quick play: join the fullest waiting public room or open a new one
+  socket.on('room:quick-play', ({ playerName }) => {
+    if (lifecycle.isDraining) {
+      socket.emit('error', DRAINING_MESSAGE);
+      return;
+    }
+
+    try {
+      const { room, player, created } = roomManager.quickPlay(socket.id, playerName);
+      socket.join(room.id);
+
+      if (created) {
+        socket.emit('room:created', { roomId: room.id, room });
+      } else {
+        socket.emit('room:joined', { room, playerId: socket.id });
+        io.to(room.id).emit('room:player-joined', player);
+        broadcastRoom(room);
+      }
+
+      roomsListBroadcast.request();
+    } catch (error) {
+      socket.emit('error', error instanceof Error ? error.message : 'Failed to find a room');
+    }
+  });
+
+  // Spectate: watch a room without taking a player slot; strokes and room state arrive
+  // batched on the spectator channel, and guesses from spectators are never accepted
+  socket.on('room:spectate', ({ roomId }) => {
+    const room = roomManager.getRoom(roomId);
+    if (!room) {
+      socket.emit('error', 'Room not found');
+      return;
+    }
+    if (roomManager.getSpectatorCount(roomId) >= spectatorConfig.maxSpectatorsPerRoom) {
+      socket.emit('error', 'Too many spectators');
+      return;
+    }
+
+    // Flush first so the snapshot already holds everything batched so far
+    spectatorFanout.flushRoom(roomId);
+    stopSpectating([socket.id]);
+    roomManager.spectateRoom(roomId, socket.id);
+    spectatorFanout.watch(room);
+    socket.join(spectatorChannel(roomId));
+    socket.emit('room:spectating', { room: spectatorView(room) });
+  });
+
+  // Leave room; handled right away so a following join is not undone by a queued leave
   socket.on('room:leave', () => {
-    handlePlayerDisconnect(socket.id);
+    stopSpectating([socket.id]);
+    removePlayers([socket.id]);
   });
 
   // Fetch public rooms
@@ -69,8 +212,21 @@ io.on('connection', (socket: Socket<ClientToServerEvents, ServerToClientEvents>)
     socket.emit('rooms:list', roomManager.getPublicRooms());
   });
 
+  // Leaderboard: served from the maintained top list, no rooms are scanned
+  socket.on('leaderboard:fetch', ({ window, limit }) => {
+    if (window !== 'daily' && window !== 'all-time') return;
+
+    const size = typeof limit === 'number' && limit > 0 ? Math.min(limit, leaderboardConfig.size) : leaderboardConfig.size;
+    socket.emit('leaderboard:list', { window, entries: leaderboard.top(window, size) });
+  });
+
   // Start game
   socket.on('game:start', () => {
+    if (lifecycle.isDraining) {
+      socket.emit('error', DRAINING_MESSAGE);
+      return;
+    }
+
     const room = roomManager.getRoomByPlayerId(socket.id);
     if (!room || room.hostId !== socket.id) {
       socket.emit('error', 'Only host can start the game');
@@ -84,7 +240,10 @@ io.on('connection', (socket: Socket<ClientToServerEvents, ServerToClientEvents>)
 
     const updatedRoom = roomManager.startGame(room.id);
     if (updatedRoom) {
+      cancelNextRound(room.id);
       io.to(room.id).emit('game:started', updatedRoom);
+      io.to(spectatorChannel(room.id)).emit('game:started', spectatorView(updatedRoom));
+      spectatorFanout.resync(updatedRoom);
 
       // Send word choices to current drawer
       const drawer = io.sockets.sockets.get(updatedRoom.currentDrawer!);
@@ -102,22 +261,32 @@ io.on('connection', (socket: Socket<ClientToServerEvents, ServerToClientEvents>)
       return;
     }
 
-    const updatedRoom = roomManager.selectWord(room.id, word);
+    // The word must be one the server offered; its points come from the server's copy
+    const choice = room.gameState === 'word-selection'
+      ? room.wordChoices.find(option => option.text === word.text)
+      : undefined;
+    if (!choice) {
+      socket.emit('error', 'Invalid word');
+      return;
+    }
+
+    const updatedRoom = roomManager.selectWord(room.id, choice);
     if (updatedRoom) {
-      // Notify drawer with the word
-      socket.emit('game:round-start', {
+      // The deadline is sent once; clients count down to it locally
+      const roundStart = {
         drawer: socket.id,
-        word: word.text,
-        timer: updatedRoom.roundDuration
-      });
+        timer: updatedRoom.roundDuration,
+        deadline: updatedRoom.roundStartTime! + updatedRoom.roundDuration * 1000,
+        serverTime: clock.now()
+      };
 
-      // Notify other players without the word
-      socket.to(room.id).emit('game:round-start', {
-        drawer: socket.id,
-        timer: updatedRoom.roundDuration
-      });
+      // Notify drawer with the word
+      socket.emit('game:round-start', { ...roundStart, word: choice.text });
 
-      io.to(room.id).emit('room:updated', updatedRoom);
+      // Notify other players and spectators without the word
+      socket.to(room.id).to(spectatorChannel(room.id)).emit('game:round-start', roundStart);
+
+      broadcastRoom(updatedRoom);
 
       // Start timer
       startRoundTimer(room.id, updatedRoom.roundDuration);
@@ -125,12 +294,24 @@ io.on('connection', (socket: Socket<ClientToServerEvents, ServerToClientEvents>)
   });
 
   // Drawing stroke
-  socket.on('drawing:stroke', (stroke) => {
-    const room = roomManager.getRoomByPlayerId(socket.id);
-    if (!room || room.currentDrawer !== socket.id) return;
+  // Every stroke is acked with its id or null: stroke ids are positions in room.canvas, so
+  // the drawer only keeps the strokes the server kept
+  socket.on('drawing:stroke', (stroke, ack) => {
+    const room = rateLimiter.checkSocket('drawing:stroke', socket.id, stroke)
+      ? roomManager.getRoomByPlayerId(socket.id)
+      : undefined;
+    if (!room || room.currentDrawer !== socket.id || !rateLimiter.checkRoom('drawing:stroke', room.id)) {
+      ack?.(null);
+      return;
+    }
 
-    roomManager.addStroke(room.id, stroke);
-    socket.to(room.id).emit('drawing:stroke', stroke);
+    // The encoded packet was validated by the rate limiter; store and relay the same
+    // buffer. Broadcasts are encoded once by the adapter and the binary attachment
+    // is written as-is to every guesser, so cost does not grow with room size.
+    const strokeId = roomManager.addStroke(room.id, stroke);
+    ack?.(strokeId);
+    socket.to(room.id).compress(compression.shouldCompress('drawing:stroke')).emit('drawing:stroke', stroke);
+    spectatorFanout.addStroke(room.id, stroke);
   });
 
   // Clear canvas
@@ -139,155 +320,242 @@ io.on('connection', (socket: Socket<ClientToServerEvents, ServerToClientEvents>)
     if (!room || room.currentDrawer !== socket.id) return;
 
     roomManager.clearCanvas(room.id);
-    io.to(room.id).emit('drawing:clear');
+    spectatorFanout.flushRoom(room.id);
+    io.to(room.id).to(spectatorChannel(room.id)).emit('drawing:clear');
+  });
+
+  // Undo / redo: only the stroke id goes over the wire, clients hide or restore it locally.
+  // Edits draw from the room's stroke budget so they cannot be spammed.
+  socket.on('drawing:undo', () => {
+    const room = roomManager.getRoomByPlayerId(socket.id);
+    if (!room || room.currentDrawer !== socket.id) return;
+    if (!rateLimiter.checkRoom('drawing:stroke', room.id)) return;
+
+    const strokeId = roomManager.undoStroke(room.id);
+    if (strokeId !== null) {
+      spectatorFanout.flushRoom(room.id);
+      io.to(room.id).to(spectatorChannel(room.id)).emit('drawing:undo', strokeId);
+    }
+  });
+
+  socket.on('drawing:redo', () => {
+    const room = roomManager.getRoomByPlayerId(socket.id);
+    if (!room || room.currentDrawer !== socket.id) return;
+    if (!rateLimiter.checkRoom('drawing:stroke', room.id)) return;
+
+    const strokeId = roomManager.redoStroke(room.id);
+    if (strokeId !== null) {
+      spectatorFanout.flushRoom(room.id);
+      io.to(room.id).to(spectatorChannel(room.id)).emit('drawing:redo', strokeId);
+    }
   });
 
   // Submit guess
   socket.on('guess:submit', (guess) => {
+    if (!rateLimiter.checkSocket('guess:submit', socket.id, guess)) return;
+
     const room = roomManager.getRoomByPlayerId(socket.id);
     if (!room || room.currentDrawer === socket.id) return;
+    if (!rateLimiter.checkRoom('guess:submit', room.id)) return;
 
-    const isCorrect = roomManager.submitGuess(room.id, socket.id, guess);
-
-    const player = room.players.find(p => p.id === socket.id);
-    socket.emit('guess:result', {
-      correct: isCorrect,
-      playerId: socket.id,
-      playerName: player?.name || 'Unknown'
-    });
-
-    if (isCorrect) {
-      // Notify the drawer
-      const drawer = io.sockets.sockets.get(room.currentDrawer!);
-      if (drawer && player) {
-        drawer.emit('guess:correct', {
-          playerId: socket.id,
-          playerName: player.name
-        });
-      }
-    }
+    // Checked with the rest of this tick's guesses; the result follows from the pipeline
+    guessPipeline.submit(room.id, socket.id, guess);
   });
 
   // Stop timer
   socket.on('game:stop-timer', (correctGuessers) => {
     const room = roomManager.getRoomByPlayerId(socket.id);
-    if (!room || room.currentDrawer !== socket.id) return;
+    // Only while drawing: a resent stop must not score the round again
+    if (!room || room.currentDrawer !== socket.id || room.gameState !== 'drawing') return;
 
     stopRoundTimer(room.id);
+    // The drawer's list predates any guesses still queued; those players are told they
+    // were right, so they are scored as well
+    const flushed = guessPipeline.flushRoom(room.id).filter(id => !correctGuessers.includes(id));
 
-    const updatedRoom = roomManager.endRound(room.id, correctGuessers);
+    const updatedRoom = roomManager.endRound(room.id, correctGuessers.concat(flushed));
     if (updatedRoom) {
       io.to(room.id).emit('game:timer-stopped');
-      io.to(room.id).emit('game:round-end', {
+      io.to(room.id).to(spectatorChannel(room.id)).emit('game:round-end', {
         word: updatedRoom.currentWord?.text || '',
         scores: updatedRoom.scores
       });
-      io.to(room.id).emit('room:updated', updatedRoom);
-
-      // Auto advance to next round after 5 seconds
-      setTimeout(() => {
-        const nextRoom = roomManager.nextRound(room.id);
-        if (nextRoom) {
-          if (nextRoom.gameState === 'game-end') {
-            const winner = roomManager.getWinner(room.id);
-            io.to(room.id).emit('game:end', {
-              finalScores: nextRoom.scores,
-              winner: winner || ''
-            });
-          } else {
-            io.to(room.id).emit('room:updated', nextRoom);
-            const drawer = io.sockets.sockets.get(nextRoom.currentDrawer!);
-            if (drawer) {
-              drawer.emit('game:word-selection', { wordChoices: nextRoom.wordChoices });
-            }
-          }
-        }
-      }, 5000);
+      broadcastRoom(updatedRoom);
+
+      scheduleNextRound(room.id);
     }
   });
 
+  // Clock sync: the client derives its offset from the round trip
+  socket.on('clock:ping', (clientTime) => {
+    if (typeof clientTime !== 'number') return;
+    socket.compress(compression.shouldCompress('clock:pong')).emit('clock:pong', { clientTime, serverTime: clock.now() });
+  });
+
   // Disconnect
   socket.on('disconnect', () => {
     console.log('Client disconnected:', socket.id);
-    handlePlayerDisconnect(socket.id);
+    stopSpectating([socket.id]);
+    disconnectBatcher.add(socket.id);
+    rateLimiter.releaseSocket(socket.id);
   });
 });
 
 function startRoundTimer(roomId: string, duration: number) {
   stopRoundTimer(roomId);
 
-  let timeLeft = duration;
-  const interval = setInterval(() => {
-    timeLeft--;
-    io.to(roomId).emit('game:timer-update', timeLeft);
+  // One timer per round rather than a per-second tick fanned out to every player
+  const cancel = clock.setTimeout(() => {
+    roundTimers.delete(roomId);
+    const room = roomManager.getRoom(roomId);
+    if (!room) return;
 
-    if (timeLeft <= 0) {
-      stopRoundTimer(roomId);
-      const room = roomManager.getRoom(roomId);
-
-      if (room) {
-        const updatedRoom = roomManager.endRound(roomId, room.correctGuessers);
-        if (updatedRoom) {
-          io.to(roomId).emit('game:round-end', {
-            word: updatedRoom.currentWord?.text || '',
-            scores: updatedRoom.scores
-          });
-          io.to(roomId).emit('room:updated', updatedRoom);
-
-          // Auto advance to next round
-          setTimeout(() => {
-            const nextRoom = roomManager.nextRound(roomId);
-            if (nextRoom) {
-              if (nextRoom.gameState === 'game-end') {
-                const winner = roomManager.getWinner(roomId);
-                io.to(roomId).emit('game:end', {
-                  finalScores: nextRoom.scores,
-                  winner: winner || ''
-                });
-              } else {
-                io.to(roomId).emit('room:updated', nextRoom);
-                const drawer = io.sockets.sockets.get(nextRoom.currentDrawer!);
-                if (drawer) {
-                  drawer.emit('game:word-selection', { wordChoices: nextRoom.wordChoices });
-                }
-              }
-            }
-          }, 5000);
-        }
-      }
+    // Guesses typed before time ran out still count
+    guessPipeline.flushRoom(roomId);
+    const updatedRoom = roomManager.endRound(roomId, room.correctGuessers);
+    if (updatedRoom) {
+      io.to(roomId).to(spectatorChannel(roomId)).emit('game:round-end', {
+        word: updatedRoom.currentWord?.text || '',
+        scores: updatedRoom.scores
+      });
+      broadcastRoom(updatedRoom);
+
+      scheduleNextRound(roomId);
     }
-  }, 1000);
+  }, duration * 1000);
 
-  timerIntervals.set(roomId, interval);
+  roundTimers.set(roomId, cancel);
 }
 
 function stopRoundTimer(roomId: string) {
-  const interval = timerIntervals.get(roomId);
-  if (interval) {
-    clearInterval(interval);
-    timerIntervals.delete(roomId);
+  const cancel = roundTimers.get(roomId);
+  if (cancel) {
+    cancel();
+    roundTimers.delete(roomId);
   }
 }
 
-function handlePlayerDisconnect(playerId: string) {
-  const result = roomManager.leaveRoom(playerId);
-  if (result) {
-    const { roomId, room } = result;
+// Auto advance to the next round (or end the game) after a short pause
+function scheduleNextRound(roomId: string) {
+  cancelNextRound(roomId);
+
+  const cancel = clock.setTimeout(() => {
+    nextRoundTimers.delete(roomId);
 
+    // While draining, a finished round ends its game so the final scores still go out
+    const nextRoom = lifecycle.isDraining ? roomManager.endGame(roomId) : roomManager.nextRound(roomId);
+    if (!nextRoom) return;
+
+    if (nextRoom.gameState === 'game-end') {
+      const winner = roomManager.getWinner(roomId);
+      io.to(roomId).to(spectatorChannel(roomId)).emit('game:end', {
+        finalScores: nextRoom.scores,
+        winner: winner || ''
+      });
+      spectatorFanout.roomChanged(nextRoom);
+    } else {
+      broadcastRoom(nextRoom);
+      const drawer = io.sockets.sockets.get(nextRoom.currentDrawer!);
+      if (drawer) {
+        drawer.emit('game:word-selection', { wordChoices: nextRoom.wordChoices });
+      }
+    }
+  }, NEXT_ROUND_DELAY_MS);
+
+  nextRoundTimers.set(roomId, cancel);
+}
+
+function cancelNextRound(roomId: string) {
+  const cancel = nextRoundTimers.get(roomId);
+  if (cancel) {
+    cancel();
+    nextRoundTimers.delete(roomId);
+  }
+}
+
+// Players get the full room at once; spectators get the changed fields with the next batch
+function broadcastRoom(room: Room) {
+  io.to(room.id).emit('room:updated', room);
+  spectatorFanout.roomChanged(room);
+}
+
+function stopSpectating(spectatorIds: string[]) {
+  for (const { roomId, remaining } of roomManager.stopSpectating(spectatorIds)) {
+    spectatorIds.forEach(spectatorId => io.sockets.sockets.get(spectatorId)?.leave(spectatorChannel(roomId)));
+    if (remaining === 0) {
+      spectatorFanout.unwatch(roomId);
+    }
+  }
+}
+
+// Remove players in one pass: each affected room is updated and broadcast once,
+// however many of its players dropped in the same batch
+function removePlayers(playerIds: string[]) {
+  let publicRoomsChanged = false;
+
+  for (const { roomId, room, playerIds: leftIds } of roomManager.leaveRooms(playerIds)) {
     if (room) {
-      io.to(roomId).emit('room:player-left', playerId);
-      io.to(roomId).emit('room:updated', room);
+      leftIds.forEach(playerId => io.to(roomId).emit('room:player-left', playerId));
+      broadcastRoom(room);
 
       if (room.type === 'public') {
-        io.emit('rooms:list', roomManager.getPublicRooms());
+        publicRoomsChanged = true;
       }
     } else {
       // Room was deleted
       stopRoundTimer(roomId);
+      cancelNextRound(roomId);
+      rateLimiter.releaseRoom(roomId);
+      spectatorFanout.unwatch(roomId);
+      guessPipeline.drop(roomId);
+      io.to(spectatorChannel(roomId)).emit('error', 'Room closed');
+      io.in(spectatorChannel(roomId)).socketsLeave(spectatorChannel(roomId));
     }
   }
+
+  if (publicRoomsChanged) {
+    roomsListBroadcast.request();
+  }
 }
 
+// Periodically report rate limit rejections so limits can be tuned
+let lastRejectedTotal = 0;
+setInterval(() => {
+  const rejectedTotal = rateLimiter.getRejectedTotal();
+  if (rejectedTotal !== lastRejectedTotal) {
+    lastRejectedTotal = rejectedTotal;
+    console.log('Rate limiter stats:', JSON.stringify(rateLimiter.getStats()));
+  }
+}, 60000).unref();
+
+// Graceful drain for rolling deploys: readiness fails at once, new rooms and games are
+// refused, running rounds play out and their games end with final scores, then we exit.
+// A second signal exits immediately.
+const drainConfig = loadDrainConfig();
+
+async function shutdown(signal: NodeJS.Signals) {
+  if (lifecycle.isDraining) {
+    console.log(`${signal} received again, exiting without waiting for rounds`);
+    process.exit(1);
+  }
+
+  console.log(`${signal} received, draining ${roomManager.getActiveGameCount()} active games`);
+  const { activeRounds, timedOut } = await lifecycle.drain(() => roomManager.getActiveGameCount(), drainConfig);
+  if (timedOut) {
+    console.log(`Drain timed out with ${activeRounds} games still running`);
+  }
+
+  disconnectBatcher.drain();
+  io.close(() => process.exit(0));
+  setTimeout(() => process.exit(0), 5000).unref();
+}
+
+process.on('SIGTERM', shutdown);
+process.on('SIGINT', shutdown);
+
 httpServer.listen(PORT, () => {
   console.log(`Server running on port ${PORT}`);
+  if (clock.mode !== 'system') {
+    console.log(`Using ${clock.mode} test clock`);
+  }
 });
@@ -0,0 +1,115 @@
+import { IncomingMessage, ServerResponse } from 'http';
+import { IntervalHistogram, monitorEventLoopDelay } from 'perf_hooks';
+
+export type MetricsSource = () => Record<string, unknown>;
+
+// Where a consumer's CPU and lag window started
+interface MetricsWindow {
+  startedAt: number;
+  cpu: NodeJS.CpuUsage;
+  loopDelay: IntervalHistogram;
+}
+
+// Each window runs its own loop-delay monitor, so only a handful of consumers get one
+const MAX_WINDOWS = 8;
+const MAX_WINDOW_NAME_LENGTH = 64;
+
+const newLoopDelay = (): IntervalHistogram => {
+  const histogram = monitorEventLoopDelay({ resolution: 20 });
+  histogram.enable();
+  return histogram;
+};
+
+// Process-level health numbers for soak testing: memory, live handles and event-loop lag.
+// Reading never resets anything: CPU and lag cover the whole uptime unless the reader names
+// a window, which then covers the time since that reader's previous snapshot. Consumers
+// polling side by side (a soak sampler, a storm run) each get their own window.
+export class ServerMetrics {
+  private total: MetricsWindow = { startedAt: Date.now(), cpu: process.cpuUsage(), loopDelay: newLoopDelay() };
+  private windows: Map<string, MetricsWindow> = new Map();
+  private sources: Map<string, MetricsSource> = new Map();
+
+  // Register a named section (rooms, rate limiter, ...) that is sampled on every snapshot
+  addSource(name: string, source: MetricsSource): void {
+    this.sources.set(name, source);
+  }
+
+  snapshot(windowName?: string): Record<string, unknown> {
+    const memory = process.memoryUsage();
+    const handles: Record<string, number> = {};
+    process.getActiveResourcesInfo().forEach(type => {
+      handles[type] = (handles[type] || 0) + 1;
+    });
+
+    // A window's first read covers the uptime, like an unnamed one
+    const now = Date.now();
+    const window = (windowName !== undefined && this.windows.get(windowName)) || this.total;
+    const cpu = process.cpuUsage(window.cpu);
+    const windowMs = Math.max(now - window.startedAt, 1);
+    const { loopDelay } = window;
+
+    const snapshot: Record<string, unknown> = {
+      uptimeMs: now - this.total.startedAt,
+      memory: {
+        rss: memory.rss,
+        heapUsed: memory.heapUsed,
+        heapTotal: memory.heapTotal,
+        external: memory.external,
+        arrayBuffers: memory.arrayBuffers
+      },
+      handles,
+      cpu: {
+        userMs: cpu.user / 1000,
+        systemMs: cpu.system / 1000,
+        percent: ((cpu.user + cpu.system) / 1000 / windowMs) * 100,
+        windowMs
+      },
+      eventLoopLagMs: {
+        mean: loopDelay.mean / 1e6,
+        p50: loopDelay.percentile(50) / 1e6,
+        p99: loopDelay.percentile(99) / 1e6,
+        max: loopDelay.max / 1e6
+      }
+    };
+
+    this.sources.forEach((source, name) => {
+      snapshot[name] = source();
+    });
+
+    if (windowName !== undefined) {
+      this.restartWindow(windowName, now);
+    }
+    return snapshot;
+  }
+
+  private restartWindow(name: string, now: number): void {
+    const window = this.windows.get(name);
+    if (window) {
+      window.loopDelay.reset();
+      window.cpu = process.cpuUsage();
+      window.startedAt = now;
+      return;
+    }
+
+    // Forget the oldest consumer rather than monitoring for every name ever sent
+    if (this.windows.size >= MAX_WINDOWS) {
+      const [oldest, evicted] = this.windows.entries().next().value as [string, MetricsWindow];
+      evicted.loopDelay.disable();
+      this.windows.delete(oldest);
+    }
+    this.windows.set(name, { startedAt: now, cpu: process.cpuUsage(), loopDelay: newLoopDelay() });
+  }
+}
+
+export function handleMetricsRequest(metrics: ServerMetrics, req: IncomingMessage, res: ServerResponse): boolean {
+  if (req.method !== 'GET' || !req.url?.startsWith('/metrics')) return false;
+
+  const url = new URL(req.url, 'http://localhost');
+  if (url.pathname !== '/metrics') return false;
+
+  // ?window=<name> reports CPU and lag since this consumer's previous request
+  const windowName = url.searchParams.get('window')?.slice(0, MAX_WINDOW_NAME_LENGTH) || undefined;
+  res.writeHead(200, { 'Content-Type': 'application/json' });
+  res.end(JSON.stringify(metrics.snapshot(windowName)));
+  return true;
+}
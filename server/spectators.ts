@@ -0,0 +1,172 @@
+import { EncodedStroke, Room } from '../types';
+import { packStrokes } from '../lib/strokeCodec';
+import { CancelTimer, Clock, systemClock } from './clock';
+import { readNumber } from './config';
+
+export interface SpectatorConfig {
+  flushMs: number;
+  maxSpectatorsPerRoom: number;
+}
+
+export interface SpectatorSink {
+  strokes: (roomId: string, packed: ArrayBuffer) => void;
+  delta: (roomId: string, delta: Partial<Room>) => void;
+}
+
+export function loadSpectatorConfig(env: NodeJS.ProcessEnv = process.env): SpectatorConfig {
+  return {
+    flushMs: readNumber(env, 'SPECTATOR_FLUSH_MS', 250),
+    maxSpectatorsPerRoom: readNumber(env, 'MAX_SPECTATORS_PER_ROOM', 500)
+  };
+}
+
+// Spectators of a room share one Socket.IO room, separate from the players'
+export const spectatorChannel = (roomId: string): string => `${roomId}:spectators`;
+
+// Spectators never see the word. Strokes reach them as batches, so deltas carry the canvas
+// only when it was wiped (clear, new game, next round) and then always as [].
+const DELTA_EXCLUDED = new Set<keyof Room>(['currentWord', 'selectedWord', 'wordChoices']);
+const EMPTY_CANVAS = '[]';
+
+export function spectatorView(room: Room): Room {
+  return { ...room, currentWord: null, selectedWord: null, wordChoices: [] };
+}
+
+type FieldSnapshot = Map<keyof Room, string>;
+
+const snapshotFields = (room: Room): FieldSnapshot => {
+  const fields: FieldSnapshot = new Map();
+  (Object.keys(room) as Array<keyof Room>).forEach(key => {
+    if (key === 'canvas') {
+      fields.set(key, room.canvas.length === 0 ? EMPTY_CANVAS : 'strokes');
+    } else if (!DELTA_EXCLUDED.has(key)) {
+      fields.set(key, JSON.stringify(room[key]));
+    }
+  });
+  return fields;
+};
+
+// The cheap tier of the fan-out. Players get every stroke and full room snapshots the
+// moment they happen; each watched room's spectator channel instead gets, at most once per
+// flush window, one packed buffer of the strokes drawn since the last flush and the room
+// fields that changed. Either way the work is per room, not per spectator: the adapter
+// encodes each batch once for the whole channel.
+export class SpectatorFanout {
+  private watched: Map<string, FieldSnapshot> = new Map();
+  private pendingStrokes: Map<string, EncodedStroke[]> = new Map();
+  private dirtyRooms: Map<string, Room> = new Map();
+  private cancelFlush: CancelTimer | null = null;
+  private strokeBatches = 0;
+  private strokes = 0;
+  private deltas = 0;
+
+  constructor(
+    private sink: SpectatorSink,
+    private flushMs: number,
+    private clock: Clock = systemClock
+  ) {}
+
+  // Start (or keep) sending a room's updates to its spectators; the caller sends newcomers
+  // a full spectatorView after flushRoom, so no batch reaches them twice
+  watch(room: Room): void {
+    if (!this.watched.has(room.id)) {
+      this.watched.set(room.id, snapshotFields(room));
+    }
+  }
+
+  // Spectators were just sent a full spectatorView; drop whatever was queued before it
+  resync(room: Room): void {
+    if (!this.watched.has(room.id)) return;
+
+    this.watched.set(room.id, snapshotFields(room));
+    this.pendingStrokes.delete(room.id);
+    this.dirtyRooms.delete(room.id);
+  }
+
+  unwatch(roomId: string): void {
+    this.watched.delete(roomId);
+    this.pendingStrokes.delete(roomId);
+    this.dirtyRooms.delete(roomId);
+  }
+
+  addStroke(roomId: string, stroke: EncodedStroke): void {
+    if (!this.watched.has(roomId)) return;
+
+    const pending = this.pendingStrokes.get(roomId);
+    if (pending) {
+      pending.push(stroke);
+    } else {
+      this.pendingStrokes.set(roomId, [stroke]);
+    }
+    this.schedule();
+  }
+
+  roomChanged(room: Room): void {
+    if (!this.watched.has(room.id)) return;
+
+    this.dirtyRooms.set(room.id, room);
+    this.schedule();
+  }
+
+  // Send a room's pending batch now, e.g. before an undo that may refer to a stroke in it
+  flushRoom(roomId: string): void {
+    // The delta goes first: if it empties the canvas, strokes drawn since belong after it
+    const room = this.dirtyRooms.get(roomId);
+    const sent = this.watched.get(roomId);
+    if (room && sent) {
+      this.dirtyRooms.delete(roomId);
+      const delta: Partial<Record<keyof Room, unknown>> = {};
+      let changed = false;
+      snapshotFields(room).forEach((value, key) => {
+        if (sent.get(key) === value) return;
+
+        sent.set(key, value);
+        if (key !== 'canvas' || value === EMPTY_CANVAS) {
+          delta[key] = key === 'canvas' ? [] : room[key];
+          changed = true;
+        }
+      });
+      if (changed) {
+        this.deltas++;
+        this.sink.delta(roomId, delta as Partial<Room>);
+      }
+    }
+
+    const pending = this.pendingStrokes.get(roomId);
+    if (pending) {
+      this.pendingStrokes.delete(roomId);
+      this.strokeBatches++;
+      this.strokes += pending.length;
+      this.sink.strokes(roomId, packStrokes(pending));
+      this.watched.get(roomId)?.set('canvas', 'strokes');
+    }
+  }
+
+  flush(): void {
+    if (this.cancelFlush) {
+      this.cancelFlush();
+      this.cancelFlush = null;
+    }
+
+    const roomIds = new Set([...this.pendingStrokes.keys(), ...this.dirtyRooms.keys()]);
+    roomIds.forEach(roomId => this.flushRoom(roomId));
+  }
+
+  getStats(): { watchedRooms: number; strokeBatches: number; strokes: number; deltas: number } {
+    return {
+      watchedRooms: this.watched.size,
+      strokeBatches: this.strokeBatches,
+      strokes: this.strokes,
+      deltas: this.deltas
+    };
+  }
+
+  private schedule(): void {
+    if (!this.cancelFlush) {
+      this.cancelFlush = this.clock.setTimeout(() => {
+        this.cancelFlush = null;
+        this.flush();
+      }, this.flushMs);
+    }
+  }
+}
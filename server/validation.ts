@@ -0,0 +1,137 @@
+import { ClientToServerEvents, MAX_NAME_LENGTH } from '../types';
+
+export type Check = (value: unknown) => boolean;
+
+export type EventName = keyof ClientToServerEvents;
+
+// One check per argument of the event, in order
+type ChecksFor<Args extends unknown[]> = { [I in keyof Args]-?: Check };
+type ArgChecks<E extends EventName> = ChecksFor<Parameters<ClientToServerEvents[E]>>;
+
+const MAX_ID_LENGTH = 64;
+const MAX_PLAYERS = 15;
+
+// Checks are built once at startup from these combinators. Each is a closure over its
+// precomputed fields and runs in one pass without allocating, so a valid payload costs a
+// few typeof tests per field.
+export const string = (minLength: number, maxLength: number): Check => value =>
+  typeof value === 'string' && value.length >= minLength && value.length <= maxLength;
+
+export const number = (min: number, max: number): Check => value =>
+  typeof value === 'number' && value >= min && value <= max;
+
+export const integer = (min: number, max: number): Check => value =>
+  typeof value === 'number' && Number.isInteger(value) && value >= min && value <= max;
+
+export const oneOf = (...options: readonly string[]): Check => value =>
+  typeof value === 'string' && options.includes(value);
+
+export const optional = (check: Check): Check => value => value === undefined || check(value);
+
+export const binary: Check = value => value instanceof Uint8Array || value instanceof ArrayBuffer;
+
+export const callback: Check = value => typeof value === 'function';
+
+export const arrayOf = (check: Check, maxLength: number): Check => value => {
+  if (!Array.isArray(value) || value.length > maxLength) return false;
+  for (let i = 0; i < value.length; i++) {
+    if (!check(value[i])) return false;
+  }
+  return true;
+};
+
+// Unknown keys are ignored; handlers only ever read the listed ones
+export const object = (shape: Record<string, Check>): Check => {
+  const keys = Object.keys(shape);
+  const checks = keys.map(key => shape[key]);
+
+  return value => {
+    if (typeof value !== 'object' || value === null || Array.isArray(value)) return false;
+    const record = value as Record<string, unknown>;
+    for (let i = 0; i < keys.length; i++) {
+      if (!checks[i](record[keys[i]])) return false;
+    }
+    return true;
+  };
+};
+
+const playerName = string(1, MAX_NAME_LENGTH);
+const roomId = string(1, MAX_ID_LENGTH);
+
+// Every client event, keyed like ClientToServerEvents so adding an event there without a
+// check here fails to compile. Strokes and guesses only get a type check: their size limits
+// live in the RateLimiter, which counts those rejections per event.
+const EVENT_CHECKS: { [E in EventName]: ArgChecks<E> } = {
+  'room:create': [object({
+    roomName: string(1, MAX_NAME_LENGTH),
+    roomType: oneOf('public', 'private'),
+    playerName
+  })],
+  'room:join': [object({ roomId, playerName })],
+  'room:quick-play': [object({ playerName })],
+  'room:spectate': [object({ roomId })],
+  'room:leave': [],
+  'rooms:fetch': [],
+  'leaderboard:fetch': [object({
+    window: oneOf('daily', 'all-time'),
+    limit: optional(integer(1, 1000))
+  })],
+  'game:start': [],
+  // Only the shape here; the handler also requires one of the drawer's word choices
+  'game:select-word': [object({
+    text: string(1, MAX_NAME_LENGTH),
+    difficulty: oneOf('easy', 'medium', 'hard'),
+    points: number(0, Number.MAX_SAFE_INTEGER)
+  })],
+  'game:stop-timer': [arrayOf(string(1, MAX_ID_LENGTH), MAX_PLAYERS)],
+  'drawing:stroke': [binary, optional(callback)],
+  'drawing:clear': [],
+  'drawing:undo': [],
+  'drawing:redo': [],
+  'guess:submit': [string(0, Number.MAX_SAFE_INTEGER)],
+  'clock:ping': [number(0, Number.MAX_SAFE_INTEGER)]
+};
+
+const CHECKS = new Map<string, Check[]>(Object.entries(EVENT_CHECKS));
+
+const NAME_FIELDS = ['playerName', 'roomName'];
+
+// What to tell the client about a packet isValid rejected. Only runs on rejection, so it
+// can afford to look again: a name that is too long gets its own message, since the player
+// can fix it; anything else is a bug or tampering and stays generic.
+export function rejectionMessage(packet: unknown[]): string {
+  const payload = packet[1];
+  if (typeof payload === 'object' && payload !== null) {
+    const record = payload as Record<string, unknown>;
+    const tooLong = NAME_FIELDS.some(key => typeof record[key] === 'string' && (record[key] as string).length > MAX_NAME_LENGTH);
+    if (tooLong) return `Names can be at most ${MAX_NAME_LENGTH} characters`;
+  }
+  return 'Invalid request';
+}
+
+// Rejects a packet before it reaches any handler. Events without arguments accept and
+// ignore whatever is sent, including a trailing ack callback.
+export class EventValidator {
+  private rejected: Map<string, number> = new Map();
+
+  // `packet` is socket.io's [event, ...args], checked in place rather than sliced
+  isValid(packet: unknown[]): boolean {
+    const event = packet[0];
+    const checks = typeof event === 'string' ? CHECKS.get(event) : undefined;
+    if (!checks) return this.reject('unknown');
+
+    for (let i = 0; i < checks.length; i++) {
+      if (!checks[i](packet[i + 1])) return this.reject(event as string);
+    }
+    return true;
+  }
+
+  getStats(): { rejected: Record<string, number> } {
+    return { rejected: Object.fromEntries(this.rejected) };
+  }
+
+  private reject(key: string): false {
+    this.rejected.set(key, (this.rejected.get(key) || 0) + 1);
+    return false;
+  }
+}
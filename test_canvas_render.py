@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Canvas rendering check: drawer and guesser canvases match the recorded stroke log"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+playwright_api = pytest.importorskip("playwright.sync_api")
+
+from canvas_diff import STROKE_LOG_HOOK, read_stroke_log, verify_canvas
+from harness import create_room, draw_stroke, join_room, start_round
+
+STROKES = [
+    [(100, 100), (300, 120), (500, 100), (700, 140)],
+    [(150, 450), (250, 300), (350, 450)],
+    [(400, 500), (420, 520), (600, 300), (750, 550)],
+]
+
+
+def test_canvas_matches_stroke_log():
+    with playwright_api.sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        try:
+            pages = []
+            for _ in range(2):
+                context = browser.new_context()
+                context.add_init_script(STROKE_LOG_HOOK)
+                pages.append(context.new_page())
+
+            room_id = create_room(pages[0], "Alice", room_name="Render Check")
+            join_room(pages[1], room_id, "Bob")
+            drawer = start_round(pages[0], pages)
+            guesser = pages[1] if drawer is pages[0] else pages[0]
+
+            for points in STROKES:
+                draw_stroke(drawer, points)
+
+            strokes = read_stroke_log(drawer)
+            assert len(strokes) == len(STROKES)
+
+            guesser.wait_for_function(f"window.__renderedStrokeCount >= {len(STROKES)}", timeout=5000)
+
+            verify_canvas(drawer, strokes)
+            verify_canvas(guesser, strokes)
+        finally:
+            browser.close()
+
+
+if __name__ == "__main__":
+    test_canvas_matches_stroke_log()
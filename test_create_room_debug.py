@@ -2,6 +2,7 @@
 """Debug room creation"""
 
 from playwright.sync_api import sync_playwright
+from harness import client_url
 import time
 
 def test_room_creation():
@@ -14,7 +15,7 @@ def test_room_creation():
         page.on("console", lambda msg: print(f"[CONSOLE] {msg.text}"))
 
         print("\n=== Creating private room ===")
-        page.goto("http://localhost:3000")
+        page.goto(client_url())
         time.sleep(2)
 
         print("✓ Page loaded")
@@ -2,6 +2,7 @@
 """Final test: Create room and join from another browser"""
 
 from playwright.sync_api import sync_playwright
+from harness import client_url
 import time
 import re
 
@@ -18,7 +19,7 @@ def test_complete_flow():
         page1 = context1.new_page()
 
         print("\n[Player 1] Creating private room...")
-        page1.goto("http://localhost:3000")
+        page1.goto(client_url())
         time.sleep(1)
 
         # Fill name
@@ -57,7 +58,7 @@ def test_complete_flow():
             browser.close()
             return
 
-        room_url = f"http://localhost:3000/room/{room_id}"
+        room_url = f"{client_url()}/room/{room_id}"
         print(f"[Player 1] Room URL: {room_url}")
 
         # PLAYER 2: Join room
@@ -2,6 +2,7 @@
 """Test complete private room creation and join flow"""
 
 from playwright.sync_api import sync_playwright
+from harness import client_url
 import time
 import re
 
@@ -14,7 +15,7 @@ def test_private_room_flow():
         page1 = context1.new_page()
 
         print("\n=== PLAYER 1: Creating private room ===")
-        page1.goto("http://localhost:3000")
+        page1.goto(client_url())
         time.sleep(1)
 
         # Enter name
@@ -4,6 +4,7 @@ Tests all features mentioned in README.md
 """
 import time
 from playwright.sync_api import sync_playwright, expect
+from harness import client_url
 import json
 
 def log_test(message, status="INFO"):
@@ -26,7 +27,7 @@ def test_pictionary_game():
             # Test 1: Home Page Load
             log_test("Test 1: Loading home page...", "TEST")
             page1 = browser.new_page()
-            page1.goto('http://localhost:3000')
+            page1.goto(client_url())
             page1.wait_for_load_state('networkidle')
 
             # Take screenshot for inspection
@@ -4,6 +4,7 @@ Works around the missing join modal issue
 """
 import time
 from playwright.sync_api import sync_playwright
+from harness import client_url
 import json
 
 def log_test(message, status="INFO"):
@@ -26,7 +27,7 @@ def test_pictionary_game():
             # Test 1: Home Page Load
             log_test("Test 1: Loading home page...", "TEST")
             page1 = browser.new_page()
-            page1.goto('http://localhost:3000')
+            page1.goto(client_url())
             page1.wait_for_load_state('networkidle')
             page1.screenshot(path='/tmp/pictionary_home.png', full_page=True)
 
@@ -87,7 +88,7 @@ def test_pictionary_game():
             log_test("\nTest 3: Player2 joining via proper flow...", "TEST")
             try:
                 page2 = browser.new_page()
-                page2.goto('http://localhost:3000')
+                page2.goto(client_url())
                 page2.wait_for_load_state('networkidle')
 
                 # Enter Player2 name
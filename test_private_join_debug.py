@@ -2,9 +2,10 @@
 """Test private room join with detailed debugging"""
 
 from playwright.sync_api import sync_playwright
+from harness import client_url
 import time
 
-ROOM_URL = "http://localhost:3000/room/05b1e9ae-69b9-4100-8e99-ff31030139bc"
+ROOM_URL = f"{client_url()}/room/05b1e9ae-69b9-4100-8e99-ff31030139bc"
 
 def test_private_room_join():
     with sync_playwright() as p:
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Direct room link load budget: name prompt visible, interactive, and lobby joined
+
+Opens a private room by its link in a fresh browser context (empty cache) a few
+times and takes the median of each milestone, in ms since navigation start:
+  prompt_visible  the name prompt is on screen (server-rendered HTML)
+  interactive     the page has hydrated and enabled the prompt
+  lobby           the lobby is shown after submitting a name
+Budgets can be overridden with ROOM_TTI_BUDGET_MS and ROOM_LOBBY_BUDGET_MS.
+"""
+import os
+import statistics
+
+import pytest
+
+playwright_api = pytest.importorskip("playwright.sync_api")
+
+from harness import client_url, create_room, record_metric
+
+RUNS = 3
+INTERACTIVE_BUDGET_MS = float(os.environ.get("ROOM_TTI_BUDGET_MS", 2000))
+LOBBY_BUDGET_MS = float(os.environ.get("ROOM_LOBBY_BUDGET_MS", 4000))
+
+NAME_INPUT = 'input[placeholder="Enter your name"]'
+
+# Resolves with performance.now() once the selector matches and, when `enabled` is set, the
+# element is no longer disabled (the prompt is server-rendered disabled until hydration)
+MILESTONE = """
+([selector, enabled]) => {
+  const el = document.querySelector(selector);
+  if (!el || (enabled && el.disabled)) return null;
+  return performance.now();
+}
+"""
+
+
+def load_room_link(browser, room_id, player_name):
+    context = browser.new_context()
+    try:
+        page = context.new_page()
+        page.goto(f"{client_url()}/room/{room_id}", wait_until="commit")
+        timings = {
+            "prompt_visible": page.wait_for_function(MILESTONE, arg=[NAME_INPUT, False], polling=10).json_value(),
+            "interactive": page.wait_for_function(MILESTONE, arg=[NAME_INPUT, True], polling=10).json_value(),
+        }
+        page.fill(NAME_INPUT, player_name)
+        page.click('button[type="submit"]:has-text("Join Room")')
+        page.wait_for_selector("text=Waiting for players...", timeout=15000)
+        timings["lobby"] = page.evaluate("performance.now()")
+        return timings
+    finally:
+        context.close()
+
+
+def test_room_link_time_to_interactive():
+    with playwright_api.sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        try:
+            host = browser.new_context().new_page()
+            room_id = create_room(host, "Host", room_name="TTI Check")
+
+            runs = [load_room_link(browser, room_id, f"Guest {i}") for i in range(RUNS)]
+        finally:
+            browser.close()
+
+    medians = {name: round(statistics.median(run[name] for run in runs), 1) for name in runs[0]}
+    for name, value in medians.items():
+        record_metric(f"room_link_{name}", value, runs=RUNS)
+    print(f"\nRoom link load (median of {RUNS}): {medians}")
+
+    assert medians["prompt_visible"] <= medians["interactive"] <= medians["lobby"]
+    assert medians["interactive"] <= INTERACTIVE_BUDGET_MS, (
+        f"name prompt interactive after {medians['interactive']}ms, budget {INTERACTIVE_BUDGET_MS}ms"
+    )
+    assert medians["lobby"] <= LOBBY_BUDGET_MS, f"lobby shown after {medians['lobby']}ms, budget {LOBBY_BUDGET_MS}ms"
+
+
+if __name__ == "__main__":
+    test_room_link_time_to_interactive()
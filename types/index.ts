@@ -1,5 +1,8 @@
 export type RoomType = 'public' | 'private';
 
+// Player and room names longer than this are rejected by the server
+export const MAX_NAME_LENGTH = 50;
+
 export type GameState = 'waiting' | 'word-selection' | 'drawing' | 'round-end' | 'game-end';
 
 export type Difficulty = 'easy' | 'medium' | 'hard';
@@ -24,6 +27,9 @@ export interface DrawingStroke {
   points: { x: number; y: number }[];
 }
 
+// Binary-packed DrawingStroke, see lib/strokeCodec.ts
+export type EncodedStroke = ArrayBuffer | Uint8Array;
+
 export interface Room {
   id: string;
   name: string;
@@ -40,7 +46,8 @@ export interface Room {
   roundTimer: number;
   roundStartTime: number | null;
   correctGuessers: string[];
-  canvas: DrawingStroke[];
+  canvas: EncodedStroke[];
+  hiddenStrokes: number[];  // ids (canvas indices) of undone strokes
   hostId: string;
   maxPlayers: number;
   roundDuration: number;
@@ -52,38 +59,71 @@ export interface GuessResult {
   playerName: string;
 }
 
+// The round ends at `deadline` on the server's clock; clients count down locally,
+// correcting for clock skew with the offset measured by clock:ping/clock:pong
+export interface RoundStart {
+  drawer: string;
+  word?: string;
+  timer: number;
+  deadline: number;
+  serverTime: number;
+}
+
+export type LeaderboardWindow = 'daily' | 'all-time';
+
+export interface LeaderboardEntry {
+  rank: number;
+  name: string;
+  score: number;
+}
+
 // Socket Events
 export interface ServerToClientEvents {
   'room:created': (data: { roomId: string; room: Room }) => void;
   'room:joined': (data: { room: Room; playerId: string }) => void;
   'room:updated': (room: Room) => void;
+  'room:spectating': (data: { room: Room }) => void;
+  // Spectators only: the room fields that changed, and strokes packed into one buffer
+  'room:delta': (delta: Partial<Room>) => void;
+  'spectate:strokes': (packed: ArrayBuffer) => void;
   'room:player-joined': (player: Player) => void;
   'room:player-left': (playerId: string) => void;
   'game:started': (room: Room) => void;
   'game:word-selection': (data: { wordChoices: Word[] }) => void;
   'game:word-selected': (data: { hasWord: boolean }) => void;
-  'game:round-start': (data: { drawer: string; word?: string; timer: number }) => void;
-  'game:timer-update': (seconds: number) => void;
+  'game:round-start': (data: RoundStart) => void;
   'game:timer-stopped': () => void;
-  'drawing:stroke': (stroke: DrawingStroke) => void;
+  'drawing:stroke': (stroke: EncodedStroke) => void;
   'drawing:clear': () => void;
+  'drawing:undo': (strokeId: number) => void;
+  'drawing:redo': (strokeId: number) => void;
   'guess:result': (result: GuessResult) => void;
-  'guess:correct': (data: { playerId: string; playerName: string }) => void;
+  // Drawer only: the players who got the word since the last update, batched per tick
+  'guess:correct': (guessers: Array<{ playerId: string; playerName: string }>) => void;
   'game:round-end': (data: { word: string; scores: Record<string, number> }) => void;
   'game:end': (data: { finalScores: Record<string, number>; winner: string }) => void;
   'error': (message: string) => void;
   'rooms:list': (rooms: Array<{ id: string; name: string; playerCount: number; gameState: GameState }>) => void;
+  'clock:pong': (data: { clientTime: number; serverTime: number }) => void;
+  'leaderboard:list': (data: { window: LeaderboardWindow; entries: LeaderboardEntry[] }) => void;
 }
 
 export interface ClientToServerEvents {
   'room:create': (data: { roomName: string; roomType: RoomType; playerName: string }) => void;
   'room:join': (data: { roomId: string; playerName: string }) => void;
+  'room:quick-play': (data: { playerName: string }) => void;
+  'room:spectate': (data: { roomId: string }) => void;
   'room:leave': () => void;
   'rooms:fetch': () => void;
+  'leaderboard:fetch': (data: { window: LeaderboardWindow; limit?: number }) => void;
   'game:start': () => void;
   'game:select-word': (word: Word) => void;
   'game:stop-timer': (correctGuessers: string[]) => void;
-  'drawing:stroke': (stroke: DrawingStroke) => void;
+  // Acked with the stroke's id (its index in room.canvas), or null if it was dropped
+  'drawing:stroke': (stroke: EncodedStroke, ack?: (strokeId: number | null) => void) => void;
   'drawing:clear': () => void;
+  'drawing:undo': () => void;
+  'drawing:redo': () => void;
   'guess:submit': (guess: string) => void;
+  'clock:ping': (clientTime: number) => void;
 }